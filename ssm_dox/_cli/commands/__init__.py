@@ -1,6 +1,10 @@
 """CLI commands."""
 from ._build import build
+from ._cache import cache
 from ._check import check
 from ._publish import publish
+from ._publish_ssm import publish_ssm
+from ._release import release
+from ._watch import watch
 
-__all__ = ["build", "check", "publish"]
+__all__ = ["build", "cache", "check", "publish", "publish_ssm", "release", "watch"]
@@ -2,6 +2,11 @@
 
 If ``DOX_DIRECTORY`` (absolute or relative) is omitted, ``./dox`` is used.
 
+A ``.ssm-dox-manifest`` file is written to the output directory recording the Dox,
+digests, size, and build duration of each document. ``check``, ``publish``,
+and ``release`` use it to avoid reading documents that have not changed since
+they were built.
+
 .. rubric:: Usage
 .. code-block:: shell
 
@@ -10,6 +15,20 @@ If ``DOX_DIRECTORY`` (absolute or relative) is omitted, ``./dox`` is used.
 .. rubric:: Options
 .. code-block:: text
 
+  --changed PATH     only build Dox affected by a change to this file or
+                     directory (e.g. a template or an included script); can
+                     be provided more than once
+  --changed-since REF
+                     only process Dox affected by files that changed since
+                     this git ref (e.g. a branch, tag, or commit), including
+                     uncommitted changes
+  --incremental      only build Dox whose template, included files, or built
+                     document changed since they were last built
+  -j, --jobs INTEGER RANGE
+                     number of Dox to process in parallel  [default: number
+                     of CPUs; x>=1]
+  --no-index         walk the entire directory tree instead of using the
+                     discovery index
   -o, --output TEXT  path where built files should be placed
                      [default: ./ssm_documents]
 
@@ -19,19 +38,57 @@ If ``DOX_DIRECTORY`` (absolute or relative) is omitted, ``./dox`` is used.
   $ ssm-dox build
   $ ssm-dox build ./dox
   $ ssm-dox build ./dox --output ./ssm_documents
+  $ ssm-dox build --incremental
+  $ ssm-dox build --changed ./scripts/common.sh --changed ./dox/Example
+  $ ssm-dox build --changed-since origin/master
+  $ ssm-dox build --jobs 1
 
 """
+import logging
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 import click
 
+from ...builder import Builder
+from ...cache import (
+    SCRIPT_CACHE,
+    BuildCache,
+    DependencyGraph,
+    DiscoveryIndex,
+    TemplateCache,
+)
 from ...constants import DOCUMENTS_DIR, DOX_DIR
 from ...finder import Finder
+from ...manifest import BuildManifest
+from ...selector import DoxSelector
+from .. import options
 from .utils import click_directory
 
+LOGGER = logging.getLogger(__name__)
+
 
 @click.command("build", short_help="build dox")
+@options.serializer
 @click.argument("dox_directory", callback=click_directory, default=DOX_DIR)
+@click.option(
+    "--changed",
+    help="only build Dox affected by a change to this file or directory "
+    "(e.g. a template or an included script); can be provided more than once",
+    metavar="PATH",
+    multiple=True,
+    type=click.Path(path_type=Path),
+)
+@options.changed_since
+@click.option(
+    "--incremental",
+    default=False,
+    help="only build Dox whose template, included files, or built document "
+    "changed since they were last built",
+    is_flag=True,
+)
+@options.jobs
+@options.no_index
 @click.option(
     "-o",
     "--output",
@@ -40,12 +97,59 @@ from .utils import click_directory
     help="path where built files should be placed",
     show_default=True,
 )
-def build(dox_directory: Path, output: Path) -> None:
+@click.pass_context
+def build(
+    ctx: click.Context,
+    dox_directory: Path,
+    output: Path,
+    *,
+    changed: Tuple[Path, ...] = (),
+    changed_since: Optional[List[Path]] = None,
+    incremental: bool = False,
+    jobs: int = 1,
+    no_index: bool = False,
+) -> None:
     """Build SSM Documents from Dox in DOX_DIRECTORY.
 
     If DOX_DIRECTORY (absolute or relative) is omitted, ./dox is used.
 
     """
-    finder = Finder(root_dir=dox_directory)
-    for dox in finder.dox:
-        dox.build(output)
+    template_cache = TemplateCache.from_cache_dir()
+    finder = Finder(
+        root_dir=dox_directory,
+        index=None if no_index else DiscoveryIndex.for_root(dox_directory),
+        template_cache=template_cache,
+    )
+    graph = DependencyGraph.for_root(dox_directory)
+    builder = Builder(
+        output,
+        cache=BuildCache.for_output(output) if incremental else None,
+        graph=graph,
+        jobs=jobs,
+        manifest=BuildManifest(output),
+    )
+    selector = (
+        DoxSelector([*changed, *(changed_since or [])], graph)
+        if changed or changed_since is not None
+        else None
+    )
+    summary = builder.build(
+        selector.select(finder.iter_dox()) if selector else finder.iter_dox()
+    )
+    if selector:
+        selector.log()
+    template_cache.prune()
+    SCRIPT_CACHE.log_stats()
+    template_cache.log_stats()
+    LOGGER.info(
+        "built %s dox (%s written, %s unchanged); "
+        "skipped %s up-to-date and %s unaffected dox",
+        summary.built,
+        summary.built - summary.unchanged,
+        summary.unchanged,
+        summary.skipped,
+        len(selector.skipped) if selector else 0,
+    )
+    if summary.failed:
+        LOGGER.error("failed to build %s dox", summary.failed)
+        ctx.exit(1)
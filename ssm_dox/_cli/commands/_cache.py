@@ -0,0 +1,70 @@
+"""Manage the cache used to speed up ``build``, ``check``, and ``publish``.
+
+The cache is stored in ``./.ssm-dox-cache``.
+It contains the discovery index of each directory that has been explored,
+the build cache of each output directory used with ``build --incremental``,
+and the validated content of Dox templates.
+
+.. rubric:: Usage
+.. code-block:: shell
+
+  $ ssm-dox cache [OPTIONS] COMMAND [ARGS]...
+
+.. rubric:: Commands
+.. code-block:: text
+
+  clear  remove everything from the cache
+  stats  show the size of the cache
+
+.. rubric:: Example
+.. code-block:: shell
+
+  $ ssm-dox cache stats
+  $ ssm-dox cache clear
+
+"""
+import logging
+import shutil
+
+import click
+
+from ...cache import TemplateCache
+from ...constants import CACHE_DIR
+
+LOGGER = logging.getLogger(__name__)
+
+
+@click.group("cache", short_help="manage the cache")
+def cache() -> None:
+    """Manage the cache used to speed up build, check, and publish."""
+
+
+@cache.command("clear", short_help="remove everything from the cache")
+def clear() -> None:
+    """Remove everything from the cache."""
+    if not CACHE_DIR.is_dir():
+        LOGGER.info("cache is already empty")
+        return
+    shutil.rmtree(CACHE_DIR)
+    LOGGER.info("removed %s", CACHE_DIR)
+
+
+@cache.command("stats", short_help="show the size of the cache")
+def stats() -> None:
+    """Show the size of the cache."""
+    templates = TemplateCache.from_cache_dir(CACHE_DIR)
+    template_stats = templates.stats
+    LOGGER.info(
+        "templates: %s entries using %s byte(s) (limit %s byte(s))",
+        template_stats.entries,
+        template_stats.size,
+        templates.max_bytes,
+    )
+    for name in ("build", "discovery"):
+        files = [p for p in (CACHE_DIR / name).glob("*.json") if p.is_file()]
+        LOGGER.info(
+            "%s: %s file(s) using %s byte(s)",
+            name,
+            len(files),
+            sum(p.stat().st_size for p in files),
+        )
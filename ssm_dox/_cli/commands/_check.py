@@ -1,5 +1,8 @@
 """Compare Dox in to SSM Documents to ensure the match.
 
+Every Dox is checked, even after one is found to be out of date.
+A report listing every drifted, missing, and orphaned document is output at the end.
+
 If ``DOX_DIRECTORY`` (absolute or relative) is omitted, ``./dox`` is used.
 If ``DOCUMENTS_DIRECTORY`` (absolute or relative) is omitted, ``./ssm_documents`` is used.
 
@@ -8,44 +11,89 @@ If ``DOCUMENTS_DIRECTORY`` (absolute or relative) is omitted, ``./ssm_documents`
 
   $ ssm-dox check [OPTIONS] [DOX_DIRECTORY] [DOCUMENTS_DIRECTORY]
 
+.. rubric:: Options
+.. code-block:: text
+
+  --changed-since REF       only check Dox affected by files that changed
+                            since this git ref (e.g. a branch, tag, or
+                            commit), including uncommitted changes
+  -j, --jobs INTEGER RANGE  number of Dox to process in parallel  [default:
+                            number of CPUs; x>=1]
+  --no-index                walk the entire directory tree instead of using the
+                            discovery index
+
 .. rubric:: Example
 .. code-block:: shell
 
   $ ssm-dox check
   $ ssm-dox check ./dox
   $ ssm-dox check ./dox ./ssm_documents
+  $ ssm-dox check --jobs 4
+  $ ssm-dox check --changed-since origin/master
 
 """
-import logging
 from pathlib import Path
+from typing import List, Optional
 
 import click
 
+from ...cache import SCRIPT_CACHE, DependencyGraph, DiscoveryIndex, TemplateCache
+from ...checker import Checker
 from ...constants import DOCUMENTS_DIR, DOX_DIR
-from ...exceptions import DocumentDrift
 from ...finder import Finder
+from ...selector import DoxSelector
+from .. import options
 from .utils import click_directory
 
-LOGGER = logging.getLogger(__name__)
-
 
 @click.command("check", short_help="check dox")
+@options.serializer
 @click.argument("dox_directory", callback=click_directory, default=DOX_DIR)
 @click.argument("documents_directory", callback=click_directory, default=DOCUMENTS_DIR)
+@options.changed_since
+@options.jobs
+@options.no_index
 @click.pass_context
-def check(ctx: click.Context, documents_directory: Path, dox_directory: Path) -> None:
+def check(
+    ctx: click.Context,
+    documents_directory: Path,
+    dox_directory: Path,
+    *,
+    changed_since: Optional[List[Path]] = None,
+    jobs: int = 1,
+    no_index: bool = False,
+) -> None:
     """Compare Dox in to SSM Documents to ensure the match.
 
     If DOX_DIRECTORY (absolute or relative) is omitted, ./dox is used.
     If DOCUMENTS_DIRECTORY (absolute or relative) is omitted, ./ssm_documents is used.
 
     """
-    finder = Finder(root_dir=dox_directory)
-    for dox in finder.dox:
-        try:
-            dox.check(documents_directory)
-        except DocumentDrift as err:
-            LOGGER.error(err)
-            dox.diff(documents_directory)
-            ctx.exit(1)
-    LOGGER.info("all documents are up to date")
+    template_cache = TemplateCache.from_cache_dir()
+    dox_finder = Finder(
+        root_dir=dox_directory,
+        index=None if no_index else DiscoveryIndex.for_root(dox_directory),
+        template_cache=template_cache,
+    )
+    documents_finder = Finder(
+        root_dir=documents_directory,
+        index=None if no_index else DiscoveryIndex.for_root(documents_directory),
+    )
+    selector = (
+        None
+        if changed_since is None
+        else DoxSelector(changed_since, DependencyGraph.for_root(dox_directory))
+    )
+    report = Checker(documents_directory, jobs=jobs, manifest=True).check(
+        selector.select(dox_finder.iter_dox()) if selector else dox_finder.iter_dox(),
+        documents_finder.iter_documents(),
+        skipped=selector.skipped if selector else (),
+    )
+    if selector:
+        selector.log()
+    report.log()
+    template_cache.prune()
+    SCRIPT_CACHE.log_stats()
+    template_cache.log_stats()
+    if not report.ok:
+        ctx.exit(1)
@@ -2,6 +2,9 @@
 
 If DOCUMENTS_DIRECTORY (absolute or relative) is omitted, ``./ssm_documents`` is used.
 
+The objects under the prefix are listed first so that documents that are
+already in the bucket with the same content are not uploaded again.
+
 .. rubric:: Usage
 .. code-block:: shell
 
@@ -10,6 +13,14 @@ If DOCUMENTS_DIRECTORY (absolute or relative) is omitted, ``./ssm_documents`` is
 .. rubric:: Options
 .. code-block:: text
 
+  -c, --concurrency INTEGER RANGE
+                     number of documents to upload at the same time
+                     [default: 10; x>=1]
+  --delete           delete objects under the prefix that do not correspond
+                     to a document (requires a non-empty prefix)
+  --force            upload every document, even if its object is unchanged
+  --no-index         walk the entire directory tree instead of using the
+                     discovery index
   -p, --prefix TEXT  prefix to append to S3 Object key  [default: dev]
   --profile TEXT     AWS profile name
   --region TEXT      AWS region where the bucket is located
@@ -21,6 +32,8 @@ If DOCUMENTS_DIRECTORY (absolute or relative) is omitted, ``./ssm_documents`` is
   $ ssm-dox publish example-bucket
   $ ssm-dox publish example-bucket ./ssm_documents --prefix latest
   $ ssm-dox publish example-bucket ./ssm_documents --region us-east-1
+  $ ssm-dox publish example-bucket --concurrency 32
+  $ ssm-dox publish example-bucket --prefix latest --delete
 
 """
 import logging
@@ -30,16 +43,43 @@ from typing import Optional
 import boto3
 import click
 
+from ...cache import DiscoveryIndex
 from ...constants import DOCUMENTS_DIR
 from ...finder import Finder
+from ...manifest import BuildManifest
+from ...publisher import Publisher
+from .. import options
 from .utils import click_directory
 
 LOGGER = logging.getLogger(__name__)
 
 
 @click.command("publish", short_help="publish documents")
+@options.serializer
 @click.argument("bucket", required=True)
 @click.argument("documents_directory", callback=click_directory, default=DOCUMENTS_DIR)
+@click.option(
+    "-c",
+    "--concurrency",
+    default=10,
+    help="number of documents to upload at the same time",
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--delete",
+    default=False,
+    help="delete objects under the prefix that do not correspond to a document "
+    "(requires a non-empty prefix)",
+    is_flag=True,
+)
+@click.option(
+    "--force",
+    default=False,
+    help="upload every document, even if its object is unchanged",
+    is_flag=True,
+)
+@options.no_index
 @click.option(
     "-p",
     "--prefix",
@@ -49,10 +89,16 @@ LOGGER = logging.getLogger(__name__)
 )
 @click.option("--profile", default=None, help="AWS profile name")
 @click.option("--region", default=None, help="AWS region where the bucket is located")
+@click.pass_context
 def publish(
+    ctx: click.Context,
     bucket: str,
     documents_directory: Path,
     *,
+    concurrency: int = 10,
+    delete: bool = False,
+    force: bool = False,
+    no_index: bool = False,
     prefix: Optional[str] = None,
     profile: Optional[str] = None,
     region: Optional[str] = None,
@@ -62,8 +108,26 @@ def publish(
     If DOCUMENTS_DIRECTORY (absolute or relative) is omitted, ./ssm_documents is used.
 
     """
-    finder = Finder(root_dir=documents_directory)
+    if delete and not prefix:
+        raise click.UsageError(
+            "--delete requires a non-empty --prefix; it would delete every "
+            "object in the bucket"
+        )
+    finder = Finder(
+        root_dir=documents_directory,
+        index=None if no_index else DiscoveryIndex.for_root(documents_directory),
+    )
     session = boto3.Session(profile_name=profile, region_name=region)  # type: ignore
-    s3_client = session.client("s3")
-    for doc in finder.documents:
-        doc.publish(s3_client, bucket=bucket, prefix=prefix)
+    publisher = Publisher(
+        Publisher.create_client(session, concurrency=concurrency),
+        bucket=bucket,
+        concurrency=concurrency,
+        delete=delete,
+        force=force,
+        manifest=BuildManifest(documents_directory),
+        prefix=prefix,
+    )
+    summary = publisher.publish(finder.iter_documents())
+    summary.log()
+    if summary.failed:
+        ctx.exit(1)
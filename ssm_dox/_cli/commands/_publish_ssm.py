@@ -0,0 +1,118 @@
+"""Publish SSM Documents from ``DOCUMENTS_DIRECTORY`` directly to SSM.
+
+If DOCUMENTS_DIRECTORY (absolute or relative) is omitted, ``./ssm_documents`` is used.
+
+Each document is published as a ``Command`` SSM Document named after its path
+relative to DOCUMENTS_DIRECTORY (directories are joined with ``-``). SSM
+Documents that do not exist are created. Otherwise, a new version is created
+and made the default version unless the content of the default version is
+already the same.
+
+The SSM Documents API is heavily throttled so the concurrency should be kept
+low. Throttled requests are retried with an adaptive backoff.
+
+.. rubric:: Usage
+.. code-block:: shell
+
+  $ ssm-dox publish-ssm [OPTIONS] [DOCUMENTS_DIRECTORY]
+
+.. rubric:: Options
+.. code-block:: text
+
+  -c, --concurrency INTEGER RANGE
+                     number of documents to publish at the same time
+                     [default: 3; x>=1]
+  --force            update every document, even if its SSM Document is
+                     unchanged
+  --no-index         walk the entire directory tree instead of using the
+                     discovery index
+  -p, --prefix TEXT  prefix to prepend to the name of each SSM Document
+  --profile TEXT     AWS profile name
+  --region TEXT      AWS region where the SSM Documents are published
+  -h, --help         Show this message and exit.
+
+.. rubric:: Example
+.. code-block:: shell
+
+  $ ssm-dox publish-ssm
+  $ ssm-dox publish-ssm ./ssm_documents --prefix dev
+  $ ssm-dox publish-ssm ./ssm_documents --region us-east-1
+
+"""
+import logging
+from pathlib import Path
+from typing import Optional
+
+import boto3
+import click
+
+from ...cache import DiscoveryIndex
+from ...constants import DOCUMENTS_DIR
+from ...finder import Finder
+from ...publisher import SsmPublisher
+from .. import options
+from .utils import click_directory
+
+LOGGER = logging.getLogger(__name__)
+
+
+@click.command("publish-ssm", short_help="publish documents directly to SSM")
+@options.serializer
+@click.argument("documents_directory", callback=click_directory, default=DOCUMENTS_DIR)
+@click.option(
+    "-c",
+    "--concurrency",
+    default=3,
+    help="number of documents to publish at the same time",
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--force",
+    default=False,
+    help="update every document, even if its SSM Document is unchanged",
+    is_flag=True,
+)
+@options.no_index
+@click.option(
+    "-p",
+    "--prefix",
+    default=None,
+    help="prefix to prepend to the name of each SSM Document",
+)
+@click.option("--profile", default=None, help="AWS profile name")
+@click.option(
+    "--region", default=None, help="AWS region where the SSM Documents are published"
+)
+@click.pass_context
+def publish_ssm(
+    ctx: click.Context,
+    documents_directory: Path,
+    *,
+    concurrency: int = 3,
+    force: bool = False,
+    no_index: bool = False,
+    prefix: Optional[str] = None,
+    profile: Optional[str] = None,
+    region: Optional[str] = None,
+) -> None:
+    """Publish SSM Documents from DOCUMENTS_DIRECTORY directly to SSM.
+
+    If DOCUMENTS_DIRECTORY (absolute or relative) is omitted, ./ssm_documents is used.
+
+    """
+    finder = Finder(
+        root_dir=documents_directory,
+        index=None if no_index else DiscoveryIndex.for_root(documents_directory),
+    )
+    session = boto3.Session(profile_name=profile, region_name=region)  # type: ignore
+    publisher = SsmPublisher(
+        SsmPublisher.create_client(session, concurrency=concurrency),
+        concurrency=concurrency,
+        force=force,
+        prefix=prefix,
+    )
+    summary = publisher.publish(finder.iter_documents())
+    summary.log()
+    if summary.failed:
+        ctx.exit(1)
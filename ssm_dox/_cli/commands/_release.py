@@ -0,0 +1,188 @@
+"""Build Dox in ``DOX_DIRECTORY`` and publish the documents to an S3 ``BUCKET``.
+
+If ``DOX_DIRECTORY`` (absolute or relative) is omitted, ``./dox`` is used.
+
+This is equivalent to running ``build`` then ``publish`` except that each
+document is serialized once and uploaded as soon as it has been built, without
+being read back from disk.
+
+.. rubric:: Usage
+.. code-block:: shell
+
+  $ ssm-dox release [OPTIONS] BUCKET [DOX_DIRECTORY]
+
+.. rubric:: Options
+.. code-block:: text
+
+  -c, --concurrency INTEGER RANGE
+                     number of documents to upload at the same time
+                     [default: 10; x>=1]
+  --delete           delete objects under the prefix that do not correspond
+                     to a document (requires a non-empty prefix)
+  --force            upload every document, even if its object is unchanged
+  --incremental      only build Dox whose template, included files, or built
+                     document changed since they were last built
+  -j, --jobs INTEGER RANGE
+                     number of Dox to process in parallel  [default: number
+                     of CPUs; x>=1]
+  --no-index         walk the entire directory tree instead of using the
+                     discovery index
+  -o, --output TEXT  path where built files should be placed
+                     [default: ./ssm_documents]
+  -p, --prefix TEXT  prefix to append to S3 Object key  [default: dev]
+  --profile TEXT     AWS profile name
+  --region TEXT      AWS region where the bucket is located
+  -h, --help         Show this message and exit.
+
+.. rubric:: Example
+.. code-block:: shell
+
+  $ ssm-dox release example-bucket
+  $ ssm-dox release example-bucket ./dox --output ./ssm_documents
+  $ ssm-dox release example-bucket --prefix latest --delete
+
+"""
+import logging
+from pathlib import Path
+from typing import Optional
+
+import boto3
+import click
+
+from ...builder import Builder
+from ...cache import (
+    SCRIPT_CACHE,
+    BuildCache,
+    DependencyGraph,
+    DiscoveryIndex,
+    TemplateCache,
+)
+from ...constants import DOCUMENTS_DIR, DOX_DIR
+from ...finder import Finder
+from ...manifest import BuildManifest
+from ...publisher import Publisher
+from ...releaser import Releaser
+from .. import options
+from .utils import click_directory
+
+LOGGER = logging.getLogger(__name__)
+
+
+@click.command("release", short_help="build dox and publish documents")
+@options.serializer
+@click.argument("bucket", required=True)
+@click.argument("dox_directory", callback=click_directory, default=DOX_DIR)
+@click.option(
+    "-c",
+    "--concurrency",
+    default=10,
+    help="number of documents to upload at the same time",
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--delete",
+    default=False,
+    help="delete objects under the prefix that do not correspond to a document "
+    "(requires a non-empty prefix)",
+    is_flag=True,
+)
+@click.option(
+    "--force",
+    default=False,
+    help="upload every document, even if its object is unchanged",
+    is_flag=True,
+)
+@click.option(
+    "--incremental",
+    default=False,
+    help="only build Dox whose template, included files, or built document "
+    "changed since they were last built",
+    is_flag=True,
+)
+@options.jobs
+@options.no_index
+@click.option(
+    "-o",
+    "--output",
+    callback=click_directory,
+    default=DOCUMENTS_DIR,
+    help="path where built files should be placed",
+    show_default=True,
+)
+@click.option(
+    "-p",
+    "--prefix",
+    default="dev",
+    help="prefix to append to S3 Object key",
+    show_default=True,
+)
+@click.option("--profile", default=None, help="AWS profile name")
+@click.option("--region", default=None, help="AWS region where the bucket is located")
+@click.pass_context
+def release(
+    ctx: click.Context,
+    bucket: str,
+    dox_directory: Path,
+    output: Path,
+    *,
+    concurrency: int = 10,
+    delete: bool = False,
+    force: bool = False,
+    incremental: bool = False,
+    jobs: int = 1,
+    no_index: bool = False,
+    prefix: Optional[str] = None,
+    profile: Optional[str] = None,
+    region: Optional[str] = None,
+) -> None:
+    """Build Dox in DOX_DIRECTORY and publish the documents to an S3 BUCKET.
+
+    If DOX_DIRECTORY (absolute or relative) is omitted, ./dox is used.
+
+    """
+    if delete and not prefix:
+        raise click.UsageError(
+            "--delete requires a non-empty --prefix; it would delete every "
+            "object in the bucket"
+        )
+    template_cache = TemplateCache.from_cache_dir()
+    finder = Finder(
+        root_dir=dox_directory,
+        index=None if no_index else DiscoveryIndex.for_root(dox_directory),
+        template_cache=template_cache,
+    )
+    manifest = BuildManifest(output)
+    builder = Builder(
+        output,
+        cache=BuildCache.for_output(output) if incremental else None,
+        graph=DependencyGraph.for_root(dox_directory),
+        jobs=jobs,
+        manifest=manifest,
+    )
+    session = boto3.Session(profile_name=profile, region_name=region)  # type: ignore
+    publisher = Publisher(
+        Publisher.create_client(session, concurrency=concurrency),
+        bucket=bucket,
+        concurrency=concurrency,
+        delete=delete,
+        force=force,
+        manifest=manifest,
+        prefix=prefix,
+    )
+    summary = Releaser(builder, publisher).release(finder.iter_dox())
+    template_cache.prune()
+    SCRIPT_CACHE.log_stats()
+    template_cache.log_stats()
+    LOGGER.info(
+        "built %s dox (%s written, %s unchanged); skipped %s up-to-date dox",
+        summary.build.built,
+        summary.build.built - summary.build.unchanged,
+        summary.build.unchanged,
+        summary.build.skipped,
+    )
+    summary.publish.log()
+    if summary.build.failed:
+        LOGGER.error("failed to build %s dox", summary.build.failed)
+    if summary.build.failed or summary.publish.failed:
+        ctx.exit(1)
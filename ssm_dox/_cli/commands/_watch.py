@@ -0,0 +1,110 @@
+"""Build SSM Documents from Dox in ``DOX_DIRECTORY`` as they change.
+
+Every Dox is built once, then the templates and included files of each Dox
+are watched for changes. When one changes, only the Dox affected by it are
+built again. Dox that are added or removed are detected as well.
+
+Changes are detected using inotify on Linux. On other platforms, or when
+``--polling`` is used, the watched directories are listed periodically.
+
+If ``DOX_DIRECTORY`` (absolute or relative) is omitted, ``./dox`` is used.
+
+.. rubric:: Usage
+.. code-block:: shell
+
+  $ ssm-dox watch [OPTIONS] [DOX_DIRECTORY]
+
+.. rubric:: Options
+.. code-block:: text
+
+  --debounce FLOAT RANGE  seconds to wait for more changes before rebuilding
+                          [default: 0.1; x>=0]
+  --no-index              walk the entire directory tree instead of using the
+                          discovery index
+  -o, --output TEXT       path where built files should be placed  [default:
+                          ./ssm_documents]
+  --poll-interval FLOAT RANGE
+                          seconds between each check for changes when polling
+                          [default: 0.5; x>0]
+  --polling               poll for changes instead of using inotify
+
+.. rubric:: Example
+.. code-block:: shell
+
+  $ ssm-dox watch
+  $ ssm-dox watch ./dox --output ./ssm_documents
+  $ ssm-dox watch --polling
+
+"""
+import logging
+from pathlib import Path
+
+import click
+
+from ...cache import DiscoveryIndex, TemplateCache
+from ...constants import DOCUMENTS_DIR, DOX_DIR
+from ...watcher import DoxWatcher, get_watcher
+from .. import options
+from .utils import click_directory
+
+LOGGER = logging.getLogger(__name__)
+
+
+@click.command("watch", short_help="build dox as they change")
+@options.serializer
+@click.argument("dox_directory", callback=click_directory, default=DOX_DIR)
+@click.option(
+    "--debounce",
+    default=0.1,
+    help="seconds to wait for more changes before rebuilding",
+    show_default=True,
+    type=click.FloatRange(min=0),
+)
+@options.no_index
+@click.option(
+    "-o",
+    "--output",
+    callback=click_directory,
+    default=DOCUMENTS_DIR,
+    help="path where built files should be placed",
+    show_default=True,
+)
+@click.option(
+    "--poll-interval",
+    default=0.5,
+    help="seconds between each check for changes when polling",
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+)
+@click.option(
+    "--polling",
+    default=False,
+    help="poll for changes instead of using inotify",
+    is_flag=True,
+)
+def watch(
+    dox_directory: Path,
+    output: Path,
+    *,
+    debounce: float = 0.1,
+    no_index: bool = False,
+    poll_interval: float = 0.5,
+    polling: bool = False,
+) -> None:
+    """Build SSM Documents from Dox in DOX_DIRECTORY as they change.
+
+    If DOX_DIRECTORY (absolute or relative) is omitted, ./dox is used.
+
+    """
+    watcher = DoxWatcher(
+        dox_directory,
+        output,
+        debounce=debounce,
+        index=None if no_index else DiscoveryIndex.for_root(dox_directory),
+        template_cache=TemplateCache.from_cache_dir(),
+        watcher=get_watcher(polling=polling, interval=poll_interval),
+    )
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        LOGGER.info("stopped watching %s", dox_directory)
@@ -6,6 +6,8 @@ from typing import Any, Dict
 
 import coloredlogs
 
+from .._logging import LogLevels
+
 LOGGER = logging.getLogger("ssm_dox")
 
 LOG_FORMAT = "[%(programname)s] %(message)s"
@@ -121,7 +123,7 @@ class LogSettings:  # cov: ignore
         if self.debug:
             return logging.DEBUG
         if self.verbose:
-            return logging.DEBUG
+            return LogLevels.VERBOSE
         return logging.INFO
 
 
@@ -17,9 +17,21 @@ CLICK_CONTEXT_SETTINGS: Dict[str, Any] = {
 
 @click.group(context_settings=CLICK_CONTEXT_SETTINGS)
 @click.version_option(__version__, message="%(version)s")
-def cli() -> None:
+@click.option(
+    "--debug",
+    count=True,
+    help="enable debug logs; provide twice to include dependency logs",
+)
+@click.option("--no-color", default=False, help="disable colorized logs", is_flag=True)
+@click.option(
+    "--verbose",
+    default=False,
+    help="enable verbose logs (e.g. cache statistics)",
+    is_flag=True,
+)
+def cli(debug: int = 0, no_color: bool = False, verbose: bool = False) -> None:
     """SSM Document Builder CLI."""
-    setup_logging()
+    setup_logging(debug=debug, no_color=no_color, verbose=verbose)
 
 
 for cmd in commands.__all__:
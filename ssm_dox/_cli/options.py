@@ -0,0 +1,71 @@
+"""Common CLI options."""
+import os
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, List, Optional, TypeVar, cast
+
+import click
+
+from ..exceptions import GitError
+from ..git import get_changed_files
+from ..serializer import get_default_serializer
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _get_changed_files(
+    ctx: click.Context,  # pylint: disable=unused-argument
+    param: click.Parameter,  # pylint: disable=unused-argument
+    value: Optional[str],
+) -> Optional[List[Path]]:
+    """Click callback to get the files changed since a git ref."""
+    if value is None:
+        return None
+    try:
+        return get_changed_files(value)
+    except GitError as exc:
+        raise click.BadParameter(str(exc)) from exc
+
+
+changed_since = click.option(
+    "--changed-since",
+    callback=_get_changed_files,
+    help="only process Dox affected by files that changed since this git ref "
+    "(e.g. a branch, tag, or commit), including uncommitted changes",
+    metavar="REF",
+)
+
+jobs = click.option(
+    "-j",
+    "--jobs",
+    default=os.cpu_count() or 1,
+    help="number of Dox to process in parallel",
+    show_default="number of CPUs",
+    type=click.IntRange(min=1),
+)
+
+no_index = click.option(
+    "--no-index",
+    default=False,
+    help="walk the entire directory tree instead of using the discovery index",
+    is_flag=True,
+)
+
+
+def serializer(func: _F) -> _F:
+    """Check the serializer selected by ``SSM_DOX_SERIALIZER`` when running a command.
+
+    The check happens after the options of the command are parsed so that
+    ``--help`` works even if the environment variable is invalid.
+
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            get_default_serializer()
+        except ValueError as exc:
+            raise click.UsageError(f"invalid SSM_DOX_SERIALIZER: {exc}") from exc
+        return func(*args, **kwargs)
+
+    return cast(_F, wrapper)
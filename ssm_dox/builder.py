@@ -0,0 +1,198 @@
+"""Build many Dox, optionally in parallel."""
+from __future__ import annotations
+
+import logging
+import time
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    cast,
+)
+
+from .manifest import BuildManifest
+from .parallel import imap_dox
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ._logging import CustomLogger
+    from .cache.build import BuildCache
+    from .cache.dependencies import DependencyGraph
+    from .dox import Dox
+
+LOGGER = cast("CustomLogger", logging.getLogger(__name__))
+
+
+class BuildResult(NamedTuple):
+    """Result of building a single Dox."""
+
+    body: Optional[bytes]
+    dependencies: List[Path]
+    document: Path
+    error: Optional[str]
+    manifest_entry: Optional[Dict[str, Any]]
+    name: str
+    template: Path
+    written: bool
+
+
+class BuildSummary(NamedTuple):
+    """Summary of building many Dox."""
+
+    built: int
+    failed: int
+    skipped: int
+    unchanged: int
+
+
+def build_dox(
+    dox: Dox, output_dir: Path, *, body: bool = False, manifest: bool = False
+) -> BuildResult:
+    """Build a single Dox, capturing any error that occurs.
+
+    Args:
+        dox: The Dox to build.
+        output_dir: Path where built documents will be saved.
+        body: Include the serialized document in the result so it can be
+            used without reading it from disk.
+        manifest: Include the entry of the document in the build manifest.
+
+    """
+    start = time.perf_counter()
+    document = dox.get_document(output_dir)
+    error: Optional[str] = None
+    manifest_entry: Optional[Dict[str, Any]] = None
+    try:
+        dox.build(output_dir, document=document)
+        if manifest:
+            manifest_entry = BuildManifest.create_entry(
+                dox, document, duration=time.perf_counter() - start
+            )
+    except Exception as exc:  # pylint: disable=broad-except
+        error = str(exc)
+        LOGGER.error("failed to build %s: %s", dox.name, exc)
+    return BuildResult(
+        body=document.body if body and not error else None,
+        dependencies=dox.dependencies,
+        document=document.path,
+        error=error,
+        manifest_entry=manifest_entry,
+        name=dox.name,
+        template=dox.template,
+        written=bool(document.written),
+    )
+
+
+class Builder:
+    """Build many Dox, optionally in parallel.
+
+    When building in parallel, Dox are built in worker processes but results
+    are handled, and logs emitted, in the order the Dox were provided.
+
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        *,
+        body: bool = False,
+        cache: Optional[BuildCache] = None,
+        graph: Optional[DependencyGraph] = None,
+        jobs: int = 1,
+        manifest: Optional[BuildManifest] = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            output_dir: Path where built documents will be saved.
+            body: Include the serialized document in each result.
+            cache: Used to skip Dox whose inputs and output are unchanged.
+            graph: Updated with the files included by each Dox that is built.
+            jobs: Number of Dox to build in parallel.
+            manifest: Updated with each document that is built. Entries of
+                documents that were not built are kept as long as the
+                document exists.
+
+        """
+        self.body = body
+        self.cache = cache
+        self.graph = graph
+        self.jobs = max(jobs, 1)
+        self.manifest = manifest
+        self.output_dir = output_dir
+
+    def build(
+        self,
+        dox: Iterable[Dox],
+        *,
+        callback: Optional[Callable[[Dox, Optional[BuildResult]], None]] = None,
+    ) -> BuildSummary:
+        """Build Dox.
+
+        Args:
+            dox: Dox to build. This can be a generator so building can start
+                before all Dox have been found.
+            callback: Called with each Dox and its result, in order, as soon
+                as it has been built. The result is ``None`` if the Dox was
+                skipped.
+
+        """
+        built = failed = skipped = unchanged = 0
+        for item, result in imap_dox(
+            partial(build_dox, body=self.body, manifest=bool(self.manifest)),
+            dox,
+            self.output_dir,
+            jobs=self.jobs,
+            skip=self._is_current,
+        ):
+            if callback:
+                callback(item, result)
+            if not result:
+                LOGGER.debug("skipped %s; inputs and output are unchanged", item.name)
+                skipped += 1
+            elif result.error:
+                failed += 1
+            else:
+                if self.cache:
+                    self.cache.record(
+                        result.template, result.dependencies, result.document
+                    )
+                if self.graph:
+                    self.graph.record(result.template, result.dependencies[1:])
+                if self.manifest and result.manifest_entry:
+                    self.manifest.record(result.document, result.manifest_entry)
+                built += 1
+                if not result.written:
+                    unchanged += 1
+        if self.cache:
+            self.cache.save()
+        if self.graph:
+            self.graph.save()
+        if self.manifest:
+            self.manifest.prune()
+            if self.manifest.modified:
+                self.manifest.save()
+        return BuildSummary(
+            built=built, failed=failed, skipped=skipped, unchanged=unchanged
+        )
+
+    def _is_current(self, dox: Dox) -> bool:
+        """Determine if a Dox can be skipped.
+
+        Args:
+            dox: The Dox being built.
+
+        """
+        return bool(
+            self.cache
+            and self.cache.is_current(
+                dox.template, dox.get_document_path(self.output_dir)
+            )
+        )
@@ -0,0 +1,17 @@
+"""Caches used to avoid repeating work within and across runs."""
+from .base import CacheStats
+from .build import BuildCache
+from .dependencies import DependencyGraph
+from .discovery import DiscoveryIndex
+from .scripts import SCRIPT_CACHE, ScriptCache
+from .templates import TemplateCache
+
+__all__ = [
+    "SCRIPT_CACHE",
+    "BuildCache",
+    "CacheStats",
+    "DependencyGraph",
+    "DiscoveryIndex",
+    "ScriptCache",
+    "TemplateCache",
+]
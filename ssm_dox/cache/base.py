@@ -0,0 +1,77 @@
+"""Base classes for persistent caches."""
+from __future__ import annotations
+
+import json
+import logging
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, NamedTuple
+
+from ..utils import write_atomic
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+RACY_WINDOW_NS = 2_000_000_000
+"""Files modified this close to being recorded can't be trusted by their stat.
+
+Filesystems with coarse timestamps can record the same mtime for a change
+made immediately after a file or directory was read.
+
+"""
+
+
+class CacheStats(NamedTuple):
+    """Statistics of a cache."""
+
+    hits: int
+    misses: int
+    entries: int
+    size: int
+
+
+class JsonCacheFile:
+    """Cache persisted to disk as a JSON file.
+
+    A cache file that can't be read, is malformed, or was written with a
+    different :attr:`VERSION` is treated as empty.
+
+    """
+
+    VERSION: ClassVar[int] = 1
+    """Version of the data structure stored in the cache file."""
+
+    def __init__(self, path: Path) -> None:
+        """Instantiate class.
+
+        Args:
+            path: Path to the cache file.
+
+        """
+        self.path = path
+
+    @cached_property
+    def data(self) -> Dict[str, Any]:
+        """Data stored in the cache file."""
+        try:
+            raw = json.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            LOGGER.debug("ignoring unreadable cache file %s: %s", self.path, exc)
+            return {}
+        if not isinstance(raw, dict) or raw.get("version") != self.VERSION:  # type: ignore
+            LOGGER.debug("ignoring incompatible cache file %s", self.path)
+            return {}
+        return raw.get("data") or {}  # type: ignore
+
+    def save(self) -> None:
+        """Save the data to the cache file."""
+        write_atomic(
+            self.path,
+            json.dumps(
+                {"version": self.VERSION, "data": self.data}, separators=(",", ":")
+            ).encode(),
+        )
+        LOGGER.debug("saved cache file %s", self.path)
@@ -0,0 +1,145 @@
+"""Record of the inputs and output of each Dox that has been built."""
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from .. import __version__
+from ..constants import CACHE_DIR
+from ..utils import digest_file
+from .base import RACY_WINDOW_NS, JsonCacheFile
+
+
+class BuildCache(JsonCacheFile):
+    """Record of the inputs and output of each Dox that has been built.
+
+    For each Dox, the SHA-256 digest of its template, every file it includes,
+    and the document it was built into are recorded. A Dox does not need to be
+    built again as long as all of these digests still match.
+
+    To avoid reading every file on every run, the size and mtime of each file
+    are recorded alongside its digest. A file whose size and mtime are
+    unchanged is assumed to have the same digest unless it was modified within
+    :data:`~ssm_dox.cache.base.RACY_WINDOW_NS` of being recorded.
+
+    Each version of ssm-dox uses its own cache file since documents may be
+    built differently after an upgrade.
+
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Instantiate class.
+
+        Args:
+            path: Path to the cache file.
+
+        """
+        super().__init__(path)
+        self._digests: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    @classmethod
+    def for_output(cls, output_dir: Path, cache_dir: Path = CACHE_DIR) -> BuildCache:
+        """Get the cache for an output directory.
+
+        Args:
+            output_dir: Directory where documents are built.
+            cache_dir: Directory where cache files are stored.
+
+        """
+        digest = hashlib.sha1(
+            f"{__version__}\0{output_dir.absolute()}".encode()
+        ).hexdigest()
+        return cls(cache_dir / "build" / f"{digest}.json")
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Recorded entries keyed by the path to the template of a Dox."""
+        return self.data.setdefault("dox", {})
+
+    def is_current(self, template: Path, document: Path) -> bool:
+        """Determine if a Dox's document is up to date with its inputs.
+
+        Args:
+            template: Path to the template of the Dox.
+            document: Path to the document the Dox is built into.
+
+        """
+        entry = self.entries.get(str(template))
+        if not entry or entry["document"] != str(document):
+            return False
+        for path, recorded in [
+            *entry["inputs"].items(),
+            (str(document), entry["output"]),
+        ]:
+            current = self.stat(path, recorded)
+            if not current or current["sha256"] != recorded["sha256"]:
+                return False
+        return True
+
+    def record(self, template: Path, inputs: Iterable[Path], document: Path) -> None:
+        """Record the inputs and output of a Dox after it has been built.
+
+        Args:
+            template: Path to the template of the Dox.
+            inputs: Files the Dox was built from, including its template.
+            document: Path to the document the Dox was built into.
+
+        """
+        self._digests.pop(str(document), None)  # it was just written
+        recorded_inputs: Dict[str, Any] = {}
+        for path in inputs:
+            state = self.stat(str(path))
+            if state:
+                recorded_inputs[str(path)] = state
+        output = self.stat(str(document))
+        if not output:
+            self.entries.pop(str(template), None)
+            return
+        self.entries[str(template)] = {
+            "document": str(document),
+            "inputs": recorded_inputs,
+            "output": output,
+        }
+
+    def stat(
+        self, path: str, recorded: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get the size, mtime, and digest of a file.
+
+        Each file is only read once per run. If it was previously ``recorded``
+        and neither its size nor mtime have changed, it is not read at all.
+
+        Args:
+            path: Path to the file.
+            recorded: Previously recorded state of the file.
+
+        Returns:
+            State of the file or ``None`` if it does not exist.
+
+        """
+        if path in self._digests:
+            return self._digests[path]
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._digests[path] = None
+            return None
+        if (
+            recorded
+            and recorded["size"] == stat.st_size
+            and recorded["mtime_ns"] == stat.st_mtime_ns
+            and stat.st_mtime_ns < recorded["recorded_ns"] - RACY_WINDOW_NS
+        ):
+            state = recorded
+        else:
+            state = {
+                "mtime_ns": stat.st_mtime_ns,
+                "recorded_ns": time.time_ns(),
+                "sha256": digest_file(Path(path)),
+                "size": stat.st_size,
+            }
+        self._digests[path] = state
+        return state
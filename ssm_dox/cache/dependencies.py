@@ -0,0 +1,80 @@
+"""Persistent graph of the files each Dox is built from."""
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import ClassVar, Dict, Iterable, List
+
+from ..constants import CACHE_DIR
+from .base import JsonCacheFile
+
+
+class DependencyGraph(JsonCacheFile):
+    """Persistent graph of the files each Dox is built from.
+
+    Each Dox is recorded by the path to its template along with the files it
+    included via ``!IncludeScript`` the last time it was loaded. This is used
+    to determine which Dox are affected by a change to a file without loading
+    every Dox.
+
+    Included files are recorded by their resolved path so that a file
+    included by several Dox through different relative paths (e.g.
+    ``../scripts/common.sh`` and ``../../scripts/common.sh``) is only
+    recorded once.
+
+    """
+
+    VERSION: ClassVar[int] = 2
+
+    @classmethod
+    def for_root(cls, root_dir: Path, cache_dir: Path = CACHE_DIR) -> DependencyGraph:
+        """Get the graph for a root directory.
+
+        Args:
+            root_dir: Root directory containing Dox.
+            cache_dir: Directory where cache files are stored.
+
+        """
+        digest = hashlib.sha1(str(root_dir.absolute()).encode()).hexdigest()
+        return cls(cache_dir / "dependencies" / f"{digest}.json")
+
+    @property
+    def entries(self) -> Dict[str, List[str]]:
+        """Included files keyed by the path to the template of a Dox."""
+        return self.data.setdefault("dox", {})
+
+    def is_affected(self, template: Path, changed: Iterable[Path]) -> bool:
+        """Determine if a Dox is affected by changes to files.
+
+        A Dox is affected when a changed path is its template, is within its
+        directory, or is (or contains) a file it includes. A Dox that has not
+        been recorded is always considered affected since what it includes
+        is unknown.
+
+        Args:
+            template: Absolute path to the template of the Dox.
+            changed: Resolved paths to files or directories that changed.
+
+        """
+        includes = self.entries.get(str(template))
+        if includes is None:
+            return True
+        dox_dir = template.parent.resolve()
+        include_paths = [Path(i) for i in includes]
+        for path in changed:
+            if path == dox_dir or dox_dir in path.parents or path in dox_dir.parents:
+                return True
+            for include in include_paths:
+                if path == include or path in include.parents:
+                    return True
+        return False
+
+    def record(self, template: Path, includes: Iterable[Path]) -> None:
+        """Record the files included by a Dox.
+
+        Args:
+            template: Absolute path to the template of the Dox.
+            includes: Resolved paths to the files it includes.
+
+        """
+        self.entries[str(template)] = sorted({str(i) for i in includes})
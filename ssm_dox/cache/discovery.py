@@ -0,0 +1,109 @@
+"""Persistent index of the result of walking a directory tree."""
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional
+
+from ..constants import CACHE_DIR
+from .base import RACY_WINDOW_NS, JsonCacheFile
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class IndexEntry(NamedTuple):
+    """Names of the items of interest in a directory."""
+
+    documents: List[str]
+    subdirectories: List[str]
+    template: Optional[str]
+
+
+class DiscoveryIndex(JsonCacheFile):
+    """Persistent index of the result of walking a directory tree.
+
+    Each directory is recorded with its mtime. A directory's mtime changes
+    whenever an entry is added, removed, or renamed within it so a directory
+    whose mtime has not changed since it was indexed does not need to be
+    listed again.
+
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Instantiate class.
+
+        Args:
+            path: Path to the cache file.
+
+        """
+        super().__init__(path)
+        self._started_ns = time.time_ns()
+        self._visited: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def for_root(cls, root_dir: Path, cache_dir: Path = CACHE_DIR) -> DiscoveryIndex:
+        """Get the index for a root directory.
+
+        Args:
+            root_dir: Root directory that will be walked.
+            cache_dir: Directory where cache files are stored.
+
+        """
+        digest = hashlib.sha1(str(root_dir.absolute()).encode()).hexdigest()
+        return cls(cache_dir / "discovery" / f"{digest}.json")
+
+    def set_ignore_digest(self, digest: str) -> None:
+        """Set the digest of the rules used to exclude paths from the walk.
+
+        The index is discarded if it was built using different rules.
+
+        Args:
+            digest: Digest of the ignore rules.
+
+        """
+        if self.data.get("ignore") != digest:
+            self.data.clear()
+        self.data["ignore"] = digest
+
+    def lookup(self, path: Path, mtime_ns: int) -> Optional[IndexEntry]:
+        """Get the indexed entry for a directory if it is still valid.
+
+        Args:
+            path: Path to the directory.
+            mtime_ns: Current mtime of the directory.
+
+        """
+        key = str(path)
+        entry = self.data.get("directories", {}).get(key)
+        if not entry or entry.get("mtime_ns") != mtime_ns:
+            return None
+        self._visited[key] = entry
+        return IndexEntry(
+            documents=entry["documents"],
+            subdirectories=entry["subdirectories"],
+            template=entry["template"],
+        )
+
+    def update(self, path: Path, mtime_ns: int, entry: IndexEntry) -> None:
+        """Record the entry for a directory.
+
+        Args:
+            path: Path to the directory.
+            mtime_ns: mtime of the directory before it was listed.
+            entry: Items of interest found in the directory.
+
+        """
+        if mtime_ns >= self._started_ns - RACY_WINDOW_NS:
+            return
+        self._visited[str(path)] = {"mtime_ns": mtime_ns, **entry._asdict()}
+
+    def save(self) -> None:
+        """Save the directories visited since the index was loaded.
+
+        Directories that were not visited no longer exist in the tree so
+        they are dropped from the index.
+
+        """
+        self.data["directories"] = self._visited
+        super().save()
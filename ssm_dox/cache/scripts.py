@@ -0,0 +1,102 @@
+"""In-memory cache of the contents of included scripts."""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Tuple, cast
+
+from .base import CacheStats
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .._logging import CustomLogger
+
+LOGGER = cast("CustomLogger", logging.getLogger(__name__))
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+"""Default maximum size of the cached contents."""
+
+_Key = Tuple[str, int, int]
+
+
+class ScriptCache:
+    """In-memory cache of the contents of included scripts.
+
+    Scripts are cached by their resolved path, mtime, and size so a script
+    that is modified is read again. When the cached contents exceed
+    ``max_bytes``, the least recently used scripts are evicted.
+
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Instantiate class.
+
+        Args:
+            max_bytes: Maximum size of the cached contents.
+
+        """
+        self._entries: OrderedDict[_Key, Tuple[str, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.max_bytes = max_bytes
+        self.misses = 0
+        self.size = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Statistics of the cache."""
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            entries=len(self._entries),
+            size=self.size,
+        )
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.size = 0
+
+    def log_stats(self) -> None:
+        """Log statistics of the cache."""
+        LOGGER.verbose(
+            "IncludeScript cache: %s hit(s), %s miss(es), %s script(s) cached "
+            "using %s byte(s)",
+            *self.stats,
+        )
+
+    def read_lines(self, path: Path) -> List[str]:
+        """Read a script, returning its lines with trailing whitespace removed.
+
+        Args:
+            path: Path to the script.
+
+        """
+        resolved = path.resolve()
+        stat = os.stat(resolved)
+        key = (str(resolved), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            lines = self._entries.get(key)
+            if lines is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(lines)
+        with open(resolved, "r", encoding="UTF-8") as f:
+            lines = tuple(line.rstrip() for line in f.readlines())
+        with self._lock:
+            self.misses += 1
+            if stat.st_size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = lines
+                self.size += stat.st_size
+                while self.size > self.max_bytes:
+                    (_, _, evicted_size), _ = self._entries.popitem(last=False)
+                    self.size -= evicted_size
+        return list(lines)
+
+
+SCRIPT_CACHE = ScriptCache()
+"""Cache shared by everything that loads Dox in the current process."""
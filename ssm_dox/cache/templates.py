@@ -0,0 +1,226 @@
+"""Persistent cache of the validated contents of Dox templates."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, List, NamedTuple, Optional, Tuple, cast
+
+import pydantic
+
+from .. import __version__
+from ..constants import CACHE_DIR
+from ..models.document import SsmDocumentDataModel
+from ..utils import digest_file, write_atomic
+from .base import CacheStats
+
+if TYPE_CHECKING:
+    from .._logging import CustomLogger
+
+LOGGER = cast("CustomLogger", logging.getLogger(__name__))
+
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+"""Default maximum size of the cache directory."""
+
+
+class TemplateCacheEntry(NamedTuple):
+    """Validated contents of a template and the files it includes.
+
+    Included files are recorded as their path and SHA-256 digest.
+
+    """
+
+    content: SsmDocumentDataModel
+    includes: List[Tuple[str, str]]
+
+
+class TemplateCache:
+    """Persistent cache of the validated contents of Dox templates.
+
+    Each entry is stored in its own file named for a digest of the template's
+    path and bytes along with the versions of ssm-dox and pydantic. The
+    digests of the files the template includes are stored in the entry and
+    must also match for it to be used. This allows loading a Dox without
+    parsing its template or validating the result.
+
+    Entries are stored as JSON and the content is validated again when an
+    entry is used, which is still much faster than loading the template.
+    Entries are not pickled since the cache directory is inside the repository
+    and a crafted entry could run arbitrary code when it is loaded.
+
+    The mtime of an entry is updated each time it is used so that
+    :meth:`prune` can evict the least recently used entries.
+
+    """
+
+    VERSION: ClassVar[int] = 3
+    """Version of the data structure stored in each entry."""
+
+    def __init__(self, path: Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Instantiate class.
+
+        Args:
+            path: Directory where entries are stored.
+            max_bytes: Maximum size of the entries kept by :meth:`prune`.
+
+        """
+        self.hits = 0
+        self.max_bytes = max_bytes
+        self.misses = 0
+        self.path = path
+
+    @classmethod
+    def from_cache_dir(cls, cache_dir: Path = CACHE_DIR) -> TemplateCache:
+        """Get the template cache stored in a cache directory.
+
+        Args:
+            cache_dir: Directory where cache files are stored.
+
+        """
+        return cls(cache_dir / "templates")
+
+    @property
+    def stats(self) -> CacheStats:
+        """Statistics of the cache."""
+        entries = self._list_entries()
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            entries=len(entries),
+            size=sum(size for _, _, size in entries),
+        )
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        for path, _, _ in self._list_entries():
+            path.unlink()
+        self.hits = self.misses = 0
+
+    def get(self, template: Path, data: bytes) -> Optional[TemplateCacheEntry]:
+        """Get the entry of a template if none of its inputs have changed.
+
+        Args:
+            template: Path to the template.
+            data: Contents of the template.
+
+        """
+        path = self.get_entry_path(template, data)
+        try:
+            raw = json.loads(path.read_bytes())
+            includes = [
+                (str(include), str(digest)) for include, digest in raw["includes"]
+            ]
+            for include, digest in includes:
+                if digest_file(Path(include)) != digest:
+                    raise ValueError(f"{include} has changed")
+            entry = TemplateCacheEntry(
+                SsmDocumentDataModel.parse_obj(raw["content"]), includes
+            )
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.debug("ignoring cached content of %s: %s", template, exc)
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:  # cov: ignore
+            pass
+        self.hits += 1
+        LOGGER.debug("using cached content of %s", template)
+        return entry
+
+    def get_entry_path(self, template: Path, data: bytes) -> Path:
+        """Get the path to the entry of a template.
+
+        Args:
+            template: Path to the template.
+            data: Contents of the template.
+
+        """
+        digest = hashlib.sha256(
+            f"{self.VERSION}\0{__version__}\0{pydantic.VERSION}\0"
+            f"{template.absolute()}\0".encode()
+        )
+        digest.update(data)
+        return self.path / f"{digest.hexdigest()}.json"
+
+    def log_stats(self) -> None:
+        """Log statistics of the cache."""
+        LOGGER.verbose(
+            "template cache: %s hit(s), %s miss(es), %s template(s) cached "
+            "using %s byte(s)",
+            *self.stats,
+        )
+
+    def prune(self) -> int:
+        """Remove the least recently used entries until within :attr:`max_bytes`.
+
+        Returns:
+            Number of entries removed.
+
+        """
+        entries = sorted(self._list_entries(), key=lambda e: e[1])
+        size = sum(size for _, _, size in entries)
+        removed = 0
+        for path, _, entry_size in entries:
+            if size <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:  # cov: ignore
+                pass
+            size -= entry_size
+            removed += 1
+        if removed:
+            LOGGER.debug("removed %s entries from the template cache", removed)
+        return removed
+
+    def put(
+        self,
+        template: Path,
+        data: bytes,
+        content: SsmDocumentDataModel,
+        includes: List[Path],
+    ) -> None:
+        """Store the validated content of a template.
+
+        Args:
+            template: Path to the template.
+            data: Contents of the template that ``content`` was loaded from.
+            content: Validated contents of the template.
+            includes: Files included by the template.
+
+        """
+        entry = {
+            "content": content.dict(exclude_unset=True),
+            "includes": [(str(path), digest_file(path)) for path in includes],
+        }
+        write_atomic(
+            self.get_entry_path(template, data),
+            json.dumps(entry, separators=(",", ":")).encode(),
+        )
+
+    def _list_entries(self) -> List[Tuple[Path, int, int]]:
+        """List the path, mtime, and size of each entry.
+
+        Pickled entries written by older versions are listed so that they are
+        removed by :meth:`clear` and :meth:`prune`.
+
+        """
+        try:
+            scan = os.scandir(self.path)
+        except FileNotFoundError:
+            return []
+        result: List[Tuple[Path, int, int]] = []
+        with scan:
+            for item in scan:
+                if item.name.endswith((".json", ".pickle")) and item.is_file():
+                    stat = item.stat()
+                    result.append(
+                        (self.path / item.name, stat.st_mtime_ns, stat.st_size)
+                    )
+        return result
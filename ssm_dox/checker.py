@@ -0,0 +1,233 @@
+"""Check many Dox against their built documents, optionally in parallel."""
+from __future__ import annotations
+
+import logging
+from functools import lru_cache, partial
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    cast,
+)
+
+from .exceptions import DocumentDoesNotExist, DocumentDrift
+from .manifest import MANIFEST_FILE_NAME, BuildManifest
+from .parallel import imap_dox
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ._logging import CustomLogger
+    from .document import Document
+    from .dox import Dox
+
+LOGGER = cast("CustomLogger", logging.getLogger(__name__))
+
+CheckStatus = Literal["current", "drifted", "error", "missing"]
+
+
+class CheckResult(NamedTuple):
+    """Result of checking a single Dox."""
+
+    document: Path
+    dox_path: Path
+    error: Optional[str]
+    status: CheckStatus
+
+
+@lru_cache(maxsize=1)
+def _load_manifest(
+    documents_dir: Path, mtime_ns: int, size: int  # pylint: disable=unused-argument
+) -> BuildManifest:
+    """Load a build manifest once per process.
+
+    Args:
+        documents_dir: Path where built documents are stored.
+        mtime_ns: mtime of the manifest so it is loaded again if it changes.
+        size: Size of the manifest so it is loaded again if it changes.
+
+    """
+    return BuildManifest(documents_dir)
+
+
+def get_manifest(documents_dir: Path) -> Optional[BuildManifest]:
+    """Get the build manifest of a documents directory.
+
+    The manifest is only loaded once per process, including worker processes,
+    until it changes.
+
+    Args:
+        documents_dir: Path where built documents are stored.
+
+    Returns:
+        The manifest or ``None`` if it does not exist.
+
+    """
+    try:
+        stat = (documents_dir / MANIFEST_FILE_NAME).stat()
+    except OSError:
+        return None
+    return _load_manifest(documents_dir, stat.st_mtime_ns, stat.st_size)
+
+
+def check_dox(dox: Dox, documents_dir: Path, *, manifest: bool = False) -> CheckResult:
+    """Check a single Dox, capturing any error that occurs.
+
+    Args:
+        dox: The Dox to check.
+        documents_dir: Path where built documents are stored.
+        manifest: Use the build manifest of the documents directory, if it
+            exists, to avoid reading documents that have not changed.
+
+    """
+    error: Optional[str] = None
+    status: CheckStatus = "current"
+    try:
+        dox.check(
+            documents_dir, manifest=get_manifest(documents_dir) if manifest else None
+        )
+    except DocumentDrift as exc:
+        LOGGER.error(exc)
+        status = "drifted"
+    except DocumentDoesNotExist as exc:
+        LOGGER.error(exc)
+        status = "missing"
+    except Exception as exc:  # pylint: disable=broad-except
+        LOGGER.error("failed to check %s: %s", dox.name, exc)
+        error = str(exc)
+        status = "error"
+    return CheckResult(
+        document=dox.get_document_path(documents_dir),
+        dox_path=dox.path,
+        error=error,
+        status=status,
+    )
+
+
+class CheckReport:
+    """Aggregated result of checking many Dox."""
+
+    def __init__(self) -> None:
+        """Instantiate class."""
+        self.orphaned: List[Path] = []
+        self.results: List[CheckResult] = []
+
+    @property
+    def current(self) -> List[CheckResult]:
+        """Results of Dox whose document is up to date."""
+        return [r for r in self.results if r.status == "current"]
+
+    @property
+    def drifted(self) -> List[CheckResult]:
+        """Results of Dox whose document does not match."""
+        return [r for r in self.results if r.status == "drifted"]
+
+    @property
+    def errors(self) -> List[CheckResult]:
+        """Results of Dox that could not be checked."""
+        return [r for r in self.results if r.status == "error"]
+
+    @property
+    def missing(self) -> List[CheckResult]:
+        """Results of Dox whose document does not exist."""
+        return [r for r in self.results if r.status == "missing"]
+
+    @property
+    def ok(self) -> bool:
+        """Whether all documents are up to date with no orphans."""
+        return not self.orphaned and len(self.current) == len(self.results)
+
+    def log(self) -> None:
+        """Log the report."""
+        if self.ok:
+            LOGGER.info("all %s document(s) are up to date", len(self.results))
+            return
+        LOGGER.error(
+            "checked %s dox; %s up to date, %s drifted, %s missing, "
+            "%s orphaned, %s error(s)",
+            len(self.results),
+            len(self.current),
+            len(self.drifted),
+            len(self.missing),
+            len(self.orphaned),
+            len(self.errors),
+        )
+        for result in self.drifted:
+            LOGGER.error("drifted: %s (Dox: %s)", result.document, result.dox_path)
+        for result in self.missing:
+            LOGGER.error("missing: %s (Dox: %s)", result.document, result.dox_path)
+        for path in self.orphaned:
+            LOGGER.error("orphaned: %s (no corresponding Dox)", path)
+        for result in self.errors:
+            LOGGER.error("error: %s: %s", result.dox_path, result.error)
+
+
+class Checker:
+    """Check many Dox against their built documents, optionally in parallel.
+
+    Checking continues after a document is found to be out of date so that
+    every problem can be reported at once.
+
+    """
+
+    def __init__(
+        self, documents_dir: Path, *, jobs: int = 1, manifest: bool = False
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            documents_dir: Path where built documents are stored.
+            jobs: Number of Dox to check in parallel.
+            manifest: Use the build manifest of the documents directory, if
+                it exists, to avoid reading documents that have not changed.
+
+        """
+        self.documents_dir = documents_dir
+        self.jobs = max(jobs, 1)
+        self.manifest = manifest
+
+    def check(
+        self,
+        dox: Iterable[Dox],
+        documents: Optional[Iterable[Document]] = None,
+        *,
+        skipped: Sequence[Dox] = (),
+    ) -> CheckReport:
+        """Check Dox.
+
+        Args:
+            dox: Dox to check. This can be a generator so checking can start
+                before all Dox have been found.
+            documents: Documents found in the documents directory. Any that
+                do not correspond to a Dox are reported as orphaned.
+            skipped: Dox that were intentionally not checked. Their documents
+                are not reported as orphaned. This is only read after all
+                ``dox`` have been checked so it can be populated while
+                iterating over ``dox``.
+
+        """
+        report = CheckReport()
+        for item, result in imap_dox(
+            partial(check_dox, manifest=self.manifest),
+            dox,
+            self.documents_dir,
+            jobs=self.jobs,
+        ):
+            if not result:  # cov: ignore
+                continue
+            report.results.append(result)
+            if result.status == "drifted":
+                item.diff(self.documents_dir)
+        if documents is not None:
+            expected = {r.document.absolute() for r in report.results}
+            expected.update(
+                d.get_document_path(self.documents_dir).absolute() for d in skipped
+            )
+            report.orphaned = [
+                doc.path for doc in documents if doc.path.absolute() not in expected
+            ]
+        return report
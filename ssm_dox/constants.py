@@ -1,5 +1,6 @@
 """Constant values."""
 from pathlib import Path
 
+CACHE_DIR = Path("./.ssm-dox-cache")
 DOCUMENTS_DIR = Path("./ssm_documents")
 DOX_DIR = Path("./dox")
@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import TYPE_CHECKING, Optional, cast
 
 from .exceptions import DocumentDoesNotExist
 from .mixins import NestedFileMixin
 from .models.document import SsmDocumentDataModel
+from .serializer import serialize
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -36,15 +38,40 @@ class Document(NestedFileMixin):
             root_dir: The root directory continaing the Document.
 
         """
+        self._body: Optional[bytes] = None
         self._content = content
         self.name = path.name
         self.path = path
         self.root = root_dir
+        self.written: Optional[bool] = None
+
+    @property
+    def body(self) -> bytes:
+        """Contents serialized as they are published.
+
+        This is computed once and reused until :attr:`content` is set. It can
+        be set directly when the contents were serialized elsewhere (e.g. in
+        a worker process) so they do not need to be read from disk.
+
+        """
+        if self._body is None:
+            self._body = serialize(self.content)
+        return self._body
+
+    @body.setter
+    def body(self, value: bytes) -> None:
+        """Set the value of body.
+
+        Args:
+            value: Serialized contents of the Document.
+
+        """
+        self._body = value
 
     @property
     def content(self) -> SsmDocumentDataModel:
         """Contents of the Document."""
-        if not self._content:
+        if self._content is None:
             if self.path.is_file():
                 self._content = SsmDocumentDataModel.parse_raw(self.path.read_bytes())
             else:
@@ -59,21 +86,56 @@ class Document(NestedFileMixin):
             value: New contents of the Document.
 
         """
+        self._body = None
         self._content = value
 
     def json(self, *, exclude_none: bool = True, indent: Optional[int] = 4) -> str:
         """Output contents as a JSON formatted string.
 
+        :attr:`body` is reused when called with the default arguments.
+
         Args:
             exclude_none: Exclude fields whose value is None.
             indent: Number of spaces per indent level.
 
         """
+        if exclude_none and indent == 4:
+            return self.body.decode()
         return self.content.json(exclude_none=exclude_none, indent=indent)
 
+    def get_key(self, prefix: Optional[str] = None) -> str:
+        """Get the S3 Object key the document is published to.
+
+        Args:
+            prefix: A prefix to append to the S3 Object key.
+
+        """
+        key = f"{self.relative_path.lstrip('./')}/{self.name}".lstrip("/")
+        if prefix:
+            key = f"{prefix.rstrip('/')}/{key}"
+        return key
+
+    def get_name(self, prefix: Optional[str] = None) -> str:
+        """Get the name of the SSM Document the document is published as.
+
+        Directories containing the document are joined with its name using
+        ``-`` since SSM Document names can't contain ``/``.
+
+        Args:
+            prefix: A prefix to prepend to the name.
+
+        """
+        parts = [
+            *(p for p in self.relative_path.lstrip("./").split(os.sep) if p),
+            self.path.stem,
+        ]
+        if prefix:
+            parts.insert(0, prefix.rstrip("-"))
+        return "-".join(parts)
+
     def publish(
         self, client: S3Client, *, bucket: str, prefix: Optional[str] = None
-    ) -> None:
+    ) -> int:
         """Publish document to S3.
 
         Args:
@@ -81,28 +143,66 @@ class Document(NestedFileMixin):
             bucket: Name of the S3 Bucket.
             prefix: A prefix to append to the S3 Object key.
 
+        Returns:
+            Size of the published object in bytes.
+
         """
-        key = f"{self.relative_path.lstrip('./')}/{self.name}".lstrip("/")
-        if prefix:
-            key = f"{prefix.rstrip('/')}/{key}"
+        key = self.get_key(prefix)
+        body = self.body
         client.put_object(
             ACL="private",
-            Body=self.json().encode(),
+            Body=body,
             Bucket=bucket,
             ContentType="application/json",
             Key=key,
         )
         LOGGER.success("published %s to s3://%s/%s", self.name, bucket, key)
+        return len(body)
+
+    def is_unchanged(self, data: bytes) -> bool:
+        """Determine if the file on disk already contains the provided data.
+
+        The size of the file is checked before its content is read.
+
+        Args:
+            data: Data that would be written to the file.
 
-    def write(self, content: Optional[SsmDocumentDataModel] = None) -> Path:
+        """
+        try:
+            if self.path.stat().st_size != len(data):
+                return False
+            return self.path.read_bytes() == data
+        except FileNotFoundError:
+            return False
+
+    def write(
+        self,
+        content: Optional[SsmDocumentDataModel] = None,
+        *,
+        body: Optional[bytes] = None,
+    ) -> Path:
         """Write contents to disk.
 
+        The file is not written if it already contains the same contents so
+        that its mtime is preserved. :attr:`written` reflects whether the file
+        was written.
+
         Args:
             content: What to write to the file.
+            body: ``content`` already serialized (e.g. :attr:`ssm_dox.dox.Dox.body`) so
+                it does not need to be serialized again.
 
         """
         if content:
             self.content = content
-        self.path.write_text(self.json() + "\n")  # insert new line at the end
-        LOGGER.success("wrote to %s", self.path)
+        if body is not None:
+            self.body = body
+        data = self.body + b"\n"  # insert new line at the end
+        if self.is_unchanged(data):
+            self.written = False
+            LOGGER.info("%s is unchanged", self.path)
+        else:
+            self.path.write_bytes(data)
+            self.written = True
+            LOGGER.success("wrote to %s", self.path)
         return self.path
@@ -5,37 +5,52 @@ import difflib
 import logging
 from functools import cached_property
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Any, Optional, cast
+from typing import IO, TYPE_CHECKING, Any, List, Optional, cast
 
 import yaml
 
+from .cache.scripts import SCRIPT_CACHE
 from .document import Document
 from .exceptions import DocumentDrift, TemplateNotFound
 from .mixins import NestedFileMixin
 from .models.document import SsmDocumentDataModel
+from .serializer import serialize
 
 if TYPE_CHECKING:
     from ._logging import CustomLogger
+    from .cache.templates import TemplateCache
+    from .manifest import BuildManifest
 
 LOGGER = cast("CustomLogger", logging.getLogger(__name__))
 
 
-class DoxLoader(yaml.SafeLoader):
-    """Dox YAML loader."""
+class DoxConstructorMixin:
+    """Constructors for the custom tags that can be used in a Dox."""
 
-    def __init__(self, stream: IO[Any]) -> None:
-        """Instantiate class."""
-        try:
-            self._root = Path(stream.name).parent
-        except AttributeError:
-            self._root = Path.cwd()
+    def __init__(self, stream: IO[Any], *, root: Optional[Path] = None) -> None:
+        """Instantiate class.
+
+        Args:
+            stream: YAML to load.
+            root: Directory that included files are relative to. If not
+                provided, the directory containing ``stream`` is used.
+
+        """
+        if root:
+            self._root = root
+        else:
+            try:
+                self._root = Path(stream.name).parent
+            except AttributeError:
+                self._root = Path.cwd()
+        self.includes: List[Path] = []
         super().__init__(stream)  # type: ignore
 
     def construct_include_script(self, node: yaml.Node) -> Any:
         """Handle !IncludeScript."""
         script = self._root / str(self.construct_scalar(node))  # type: ignore
-        with open(script, "r", encoding="UTF-8") as f:
-            return [line.rstrip() for line in f.readlines()]
+        self.includes.append(script.resolve())
+        return SCRIPT_CACHE.read_lines(script)
 
     # pylint: disable=no-self-use,unused-argument
     def construct_linux_only(self, node: yaml.Node) -> Any:
@@ -47,39 +62,141 @@ class DoxLoader(yaml.SafeLoader):
         """Handle !WindowsOnly."""
         return {"StringEquals": ["platformType", "Windows"]}
 
+    @classmethod
+    def add_dox_constructors(cls) -> None:
+        """Register the constructors of custom tags with the loader."""
+        cls.add_constructor("!IncludeScript", cls.construct_include_script)  # type: ignore
+        cls.add_constructor("!LinuxOnly", cls.construct_linux_only)  # type: ignore
+        cls.add_constructor("!WindowsOnly", cls.construct_windows_only)  # type: ignore
+
+
+class PyDoxLoader(DoxConstructorMixin, yaml.SafeLoader):
+    """Dox YAML loader implemented in pure Python."""
+
+
+PyDoxLoader.add_dox_constructors()
 
-DoxLoader.add_constructor("!IncludeScript", DoxLoader.construct_include_script)  # type: ignore
-DoxLoader.add_constructor("!LinuxOnly", DoxLoader.construct_linux_only)  # type: ignore
-DoxLoader.add_constructor("!WindowsOnly", DoxLoader.construct_windows_only)  # type: ignore
+if yaml.__with_libyaml__:
+
+    class CDoxLoader(DoxConstructorMixin, yaml.CSafeLoader):  # type: ignore
+        """Dox YAML loader backed by libyaml."""
+
+    CDoxLoader.add_dox_constructors()
+    DoxLoader = CDoxLoader
+else:  # cov: ignore
+    DoxLoader = PyDoxLoader  # type: ignore
+"""Dox YAML loader.
+
+:class:`CDoxLoader` is used when PyYAML was built with libyaml since it is
+significantly faster. Otherwise, :class:`PyDoxLoader` is used.
+
+"""
 
 
 class Dox(NestedFileMixin):
     """Object representation of a raw SSM Document to be build."""
 
-    def __init__(self, *, path: Path, root_dir: Path) -> None:
+    def __init__(
+        self,
+        *,
+        cache: Optional[TemplateCache] = None,
+        path: Path,
+        root_dir: Path,
+        template: Optional[Path] = None,
+    ) -> None:
         """Instantiate class.
 
         Args:
+            cache: Used to load the content of the Dox without parsing its
+                template if none of its inputs have changed.
             path: Path to the Dox directory.
             root_dir: The root directory continaing the Dox.
+            template: Path to the template file if it is already known
+                (e.g. discovered by :class:`~ssm_dox.finder.Finder`).
 
         """
+        self._body: Optional[bytes] = None
+        self._content: Optional[SsmDocumentDataModel] = None
+        self.cache = cache
         self.name = path.name
         self.path = path.absolute()
         self.root = root_dir.absolute()
+        self.includes: List[Path] = []
+        if template:
+            self.template = template.absolute()
 
-    @cached_property
+    @property
+    def body(self) -> bytes:
+        """Content serialized as it is written to its document.
+
+        This is computed once and reused until :attr:`content` is set or
+        reloaded.
+
+        """
+        if self._body is None:
+            self._body = serialize(self.content)
+        return self._body
+
+    @property
     def content(self) -> SsmDocumentDataModel:
-        """Content of the Dox."""
+        """Content of the Dox.
+
+        This is loaded from the template the first time it is accessed.
+
+        """
+        if self._content is None:
+            self._content = self._load_content()
+        return self._content
+
+    @content.setter
+    def content(self, value: SsmDocumentDataModel) -> None:
+        """Set the value of content.
+
+        Args:
+            value: New content of the Dox.
+
+        """
+        self._body = None
+        self._content = value
+
+    def _load_content(self) -> SsmDocumentDataModel:
+        """Load the content of the Dox from its template."""
+        data = self.template.read_bytes()
+        if self.cache:
+            entry = self.cache.get(self.template, data)
+            if entry:
+                self.includes = [Path(path) for path, _ in entry.includes]
+                return entry.content
         LOGGER.debug("loading %s...", self.template)
-        with open(self.template, "r", encoding="UTF-8") as f:
-            content = yaml.load(f, Loader=DoxLoader)  # type: ignore
+        loader = DoxLoader(data.decode("UTF-8"), root=self.template.parent)
+        try:
+            raw_content = loader.get_single_data()  # type: ignore
+        finally:
+            loader.dispose()  # type: ignore
+        self.includes = loader.includes
         LOGGER.debug("parsing %s with data model...", self.template)
-        return SsmDocumentDataModel.parse_obj(content)
+        content = SsmDocumentDataModel.parse_obj(raw_content)
+        if self.cache:
+            self.cache.put(self.template, data, content, self.includes)
+        return content
+
+    @property
+    def dependencies(self) -> List[Path]:
+        """Files the Dox is built from.
+
+        This is the template followed by any files it includes. Included files
+        are only known once :attr:`content` has been loaded.
+
+        """
+        return [self.template, *self.includes]
 
     @cached_property
     def template(self) -> Path:
-        """Template file."""
+        """Template file.
+
+        Only probed for on disk if it was not provided when instantiating the class.
+
+        """
         extensions = ["yaml", "yml"]
         for ext in extensions:
             tmp_file = self.path / f"template.{ext}"
@@ -88,28 +205,49 @@ class Dox(NestedFileMixin):
                 return tmp_file
         raise TemplateNotFound(self.path)
 
-    def build(self, output_path: Path) -> Path:
+    def build(self, output_path: Path, *, document: Optional[Document] = None) -> Path:
         """Build Dox.
 
         Args:
             output_path: Path where built document will the saved.
+            document: The document to write to. If not provided, the document
+                that corresponds with this Dox in output path is used.
 
         """
-        document = self.get_document(output_path)
+        document = document or self.get_document(output_path)
         document.path.parent.mkdir(exist_ok=True, parents=True)
         LOGGER.warning("building %s...", self.name)
-        document.write(content=self.content)
-        LOGGER.success("output %s to %s", self.name, document.path)
+        document.write(content=self.content, body=self.body)
+        if document.written:
+            LOGGER.success("output %s to %s", self.name, document.path)
+        else:
+            LOGGER.success("%s is up to date at %s", self.name, document.path)
         return document.path
 
-    def check(self, output_path: Path) -> None:
+    def check(
+        self, output_path: Path, *, manifest: Optional[BuildManifest] = None
+    ) -> None:
         """Check Dox against corresponding built document in output path.
 
+        The serialized content of the Dox is compared to the digest recorded
+        in the build manifest, then to the bytes of the document. The document
+        is only parsed and compared to the content of the Dox if they differ
+        (e.g. the document was formatted differently).
+
         Args:
             output_path: Path where built documents are stored.
+            manifest: Build manifest of the documents. The document is not
+                read if its digest is recorded and it has not changed since.
 
         """
         document = self.get_document(output_path)
+        data = self.body + b"\n"
+        if manifest and manifest.is_current(document.path, data):
+            LOGGER.success("%s is up to date", document.path)
+            return
+        if document.is_unchanged(data):
+            LOGGER.success("%s is up to date", document.path)
+            return
         if self.content != document.content:
             raise DocumentDrift(
                 document_content=document.content,
@@ -126,11 +264,17 @@ class Dox(NestedFileMixin):
             output_path: Path where built documents are stored.
 
         """
-        dox_content = self.json().split("\n")
-        doc_content = self.get_document(output_path).json().split("\n")
+        dox_content = self.body.decode().split("\n")
+        doc_content = self.get_document(output_path).body.decode().split("\n")
         differ = difflib.Differ()
         print("\n".join(differ.compare(doc_content, dox_content)))
 
+    def reload(self) -> None:
+        """Discard the loaded content so it is loaded again when next accessed."""
+        self._body = None
+        self._content = None
+        self.includes = []
+
     def get_document(self, output_path: Path) -> Document:
         """Get the built document that corresponds with this Dox in output path.
 
@@ -152,9 +296,13 @@ class Dox(NestedFileMixin):
     def json(self, *, exclude_none: bool = True, indent: Optional[int] = 4) -> str:
         """Output contents as a JSON formatted string.
 
+        :attr:`body` is reused when called with the default arguments.
+
         Args:
             exclude_none: Exclude fields whose value is None.
             indent: Number of spaces per indent level.
 
         """
+        if exclude_none and indent == 4:
+            return self.body.decode()
         return self.content.json(exclude_none=exclude_none, indent=indent)
@@ -1,7 +1,7 @@
 """Exceptions."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -55,6 +55,23 @@ class DocumentDrift(Exception):
         super().__init__(self.message)
 
 
+class GitError(Exception):
+    """A git command failed."""
+
+    def __init__(self, args: Sequence[str], reason: str) -> None:
+        """Instantiate class.
+
+        Args:
+            args: Arguments passed to git.
+            reason: Why the command failed.
+
+        """
+        self.command = ["git", *args]
+        self.message = f"{' '.join(self.command)} failed: {reason}"
+        self.reason = reason
+        super().__init__(self.message)
+
+
 class TemplateNotFound(Exception):
     """Template not found in Dox directory."""
 
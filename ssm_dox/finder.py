@@ -5,72 +5,290 @@ import logging
 import os
 from functools import cached_property
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterator, List, NamedTuple, Optional
 
+from .cache.discovery import IndexEntry
 from .document import Document
 from .dox import Dox
+from .ignore import DoxIgnore
+
+if TYPE_CHECKING:
+    from .cache.discovery import DiscoveryIndex
+    from .cache.templates import TemplateCache
 
 LOGGER = logging.getLogger(__name__)
 
+TEMPLATE_FILE_NAMES = ("template.yaml", "template.yml")
+"""Names of files that mark a directory as a Dox, in order of precedence."""
+
+
+class DirectoryScan(NamedTuple):
+    """Items of interest found while listing a single directory."""
+
+    path: Path
+    documents: List[Path]
+    subdirectories: List[Path]
+    template: Optional[Path]
+
+
+class ScanResult:
+    """Result of a single pass over a directory tree."""
+
+    def __init__(self, root_dir: Path) -> None:
+        """Instantiate class.
+
+        Args:
+            root_dir: The root directory that was scanned.
+
+        """
+        self.root = root_dir
+        self.directories: List[Path] = []
+        self.documents: List[Path] = []
+        self.templates: Dict[Path, Path] = {}
+
+    def add(self, scan: DirectoryScan) -> None:
+        """Add the scan of a single directory to the result.
+
+        Args:
+            scan: Scan of a directory.
+
+        """
+        self.documents.extend(scan.documents)
+        if scan.path != self.root:
+            self.directories.append(scan.path)
+            if scan.template:
+                self.templates[scan.path] = scan.template
+
+    def replay(self) -> Iterator[DirectoryScan]:
+        """Iterate over the result as if it were being walked.
+
+        Documents are not tracked per directory so they are all attributed
+        to the root directory.
+
+        """
+        yield DirectoryScan(
+            path=self.root, documents=self.documents, subdirectories=[], template=None
+        )
+        for path in self.directories:
+            yield DirectoryScan(
+                path=path,
+                documents=[],
+                subdirectories=[],
+                template=self.templates.get(path),
+            )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the object."""
+        return (
+            f"ScanResult(root={self.root!r}, directories={len(self.directories)}, "
+            f"documents={len(self.documents)}, templates={len(self.templates)})"
+        )
+
 
 class Finder:
     """Explore a directory."""
 
-    def __init__(self, root_dir: Path) -> None:
+    def __init__(
+        self,
+        root_dir: Path,
+        *,
+        ignore: Optional[DoxIgnore] = None,
+        index: Optional[DiscoveryIndex] = None,
+        template_cache: Optional[TemplateCache] = None,
+    ) -> None:
         """Instantiate class.
 
         Args:
             root_dir: The root directory to explore.
+            ignore: Rules used to exclude paths from discovery. If not provided,
+                they are loaded from the ``.doxignore`` file in the root directory.
+            index: Persistent index used to skip listing directories that
+                have not changed since the last time they were walked.
+            template_cache: Cache used by the Dox that are found to load
+                their content.
 
         """
+        self.ignore = ignore
+        self.index = index
         self.root = root_dir
+        self.template_cache = template_cache
 
     @cached_property
     def documents(self) -> List[Document]:
         """List of documents found in the root directory."""
-        result = [
-            Document(path=f, root_dir=self.root) for f in self.root.rglob("*.json")
-        ]
-        LOGGER.info("found %s document(s)", len(result))
-        return result
+        return list(self.iter_documents())
 
     @cached_property
     def dox(self) -> List[Dox]:
         """List of Dox found in the root directory."""
-        result = [
-            Dox(path=d, root_dir=self.root)
-            for d in self.subdirectories
-            if self.has_template(d)
-        ]
-        LOGGER.info("found %s dox", len(result))
-        return result
+        return list(self.iter_dox())
+
+    @cached_property
+    def scan(self) -> ScanResult:
+        """Result of scanning the root directory."""
+        return self.scandir(self.root, ignore=self.ignore, index=self.index)
 
     @cached_property
     def subdirectories(self) -> List[Path]:
         """List of subdirectories."""
-        return self.scandir(self.root)
+        return self.scan.directories
+
+    def iter_documents(self) -> Iterator[Document]:
+        """Iterate over documents as they are found in the root directory.
+
+        If the root directory has not been scanned yet, documents are yielded
+        while the scan is in progress.
+
+        """
+        count = 0
+        for scan in self._iter_scan():
+            for path in scan.documents:
+                count += 1
+                yield Document(path=path, root_dir=self.root)
+        LOGGER.info("found %s document(s)", count)
+
+    def iter_dox(self) -> Iterator[Dox]:
+        """Iterate over Dox as they are found in the root directory.
+
+        If the root directory has not been scanned yet, Dox are yielded
+        while the scan is in progress.
+
+        """
+        count = 0
+        for scan in self._iter_scan():
+            if scan.template and scan.path != self.root:
+                count += 1
+                yield Dox(
+                    cache=self.template_cache,
+                    path=scan.path,
+                    root_dir=self.root,
+                    template=scan.template,
+                )
+        LOGGER.info("found %s dox", count)
+
+    def _iter_scan(self) -> Iterator[DirectoryScan]:
+        """Iterate over the scan of each directory in the root directory.
+
+        If :attr:`scan` has already been computed, it is replayed as a single
+        item. Otherwise, the root directory is walked and the result is cached
+        once the walk is complete.
+
+        """
+        if "scan" in self.__dict__:
+            yield from self.scan.replay()
+            return
+        result = ScanResult(self.root)
+        for scan in self.walk(self.root, ignore=self.ignore, index=self.index):
+            result.add(scan)
+            yield scan
+        self.__dict__["scan"] = result
 
     @staticmethod
-    def has_template(path: Path) -> bool:
-        """Check if a directory contains a template file.
+    def scandir(
+        path: Path,
+        *,
+        ignore: Optional[DoxIgnore] = None,
+        index: Optional[DiscoveryIndex] = None,
+    ) -> ScanResult:
+        """Scan a directory tree once, collecting everything of interest.
 
         Args:
-            path: Path to check for a template file.
+            path: Path to scan.
+            ignore: Rules used to exclude paths from the scan.
+            index: Persistent index of a previous scan.
 
         """
-        if list(path.glob("template.*")):
-            return True
-        return False
+        result = ScanResult(path)
+        for scan in Finder.walk(path, ignore=ignore, index=index):
+            result.add(scan)
+        return result
 
     @staticmethod
-    def scandir(path: Path) -> List[Path]:
-        """Scan directory to find all subdirectories.
+    def walk(
+        path: Path,
+        *,
+        ignore: Optional[DoxIgnore] = None,
+        index: Optional[DiscoveryIndex] = None,
+    ) -> Iterator[DirectoryScan]:
+        """Walk a directory tree, yielding the scan of each directory as it is listed.
+
+        Each directory is listed at most once. The entries returned by
+        :func:`os.scandir` are used to find subdirectories, template files,
+        and documents so no additional filesystem calls are required.
+
+        Entries matching the ``ignore`` rules are dropped while a directory is
+        listed so ignored subtrees are never stat'ed or listed.
+
+        When an ``index`` is provided, directories whose mtime matches the
+        index are not listed at all. The index is saved once the walk is
+        complete.
 
         Args:
-            path: Path to scan.
+            path: Path to walk.
+            ignore: Rules used to exclude paths from the walk. If not provided,
+                they are loaded from the ``.doxignore`` file in ``path``.
+            index: Persistent index of a previous walk.
+
+        """
+        if ignore is None:
+            ignore = DoxIgnore.from_root(path)
+        if index:
+            index.set_ignore_digest(ignore.digest)
+        stack = [(path, "")]
+        while stack:
+            current, relative = stack.pop()
+            entry: Optional[IndexEntry] = None
+            mtime_ns = 0
+            if index:
+                mtime_ns = os.stat(current).st_mtime_ns
+                entry = index.lookup(current, mtime_ns)
+            if not entry:
+                entry = Finder._list_directory(current, relative, ignore)
+                if index:
+                    index.update(current, mtime_ns, entry)
+            if entry.template:
+                LOGGER.debug("found template file %s in %s", entry.template, current)
+            subdirs = [current / name for name in entry.subdirectories]
+            yield DirectoryScan(
+                path=current,
+                documents=[current / name for name in entry.documents],
+                subdirectories=subdirs,
+                template=current / entry.template if entry.template else None,
+            )
+            stack.extend(
+                (subdir, f"{relative}{subdir.name}/") for subdir in reversed(subdirs)
+            )
+        if index:
+            index.save()
+
+    @staticmethod
+    def _list_directory(path: Path, relative: str, ignore: DoxIgnore) -> IndexEntry:
+        """List a directory, collecting the names of items of interest.
+
+        Args:
+            path: Path to the directory.
+            relative: POSIX style path of the directory relative to the root
+                directory, ending with ``/`` unless it is the root directory.
+            ignore: Rules used to exclude entries.
 
         """
-        dirs: List[Path] = [Path(d.path) for d in os.scandir(path) if d.is_dir()]
-        for d in list(dirs):
-            dirs.extend(Finder.scandir(d))
-        return dirs
+        documents: List[str] = []
+        subdirs: List[str] = []
+        templates: List[str] = []
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            is_dir = entry.is_dir()
+            if ignore.is_ignored(relative + entry.name, is_dir=is_dir):
+                continue
+            if is_dir:
+                subdirs.append(entry.name)
+            elif entry.name in TEMPLATE_FILE_NAMES and entry.is_file():
+                templates.append(entry.name)
+            elif entry.name.endswith(".json") and entry.is_file():
+                documents.append(entry.name)
+        return IndexEntry(
+            documents=documents,
+            subdirectories=subdirs,
+            template=next((n for n in TEMPLATE_FILE_NAMES if n in templates), None),
+        )
@@ -0,0 +1,64 @@
+"""Interact with the local git repository."""
+from __future__ import annotations
+
+import logging
+import subprocess
+from pathlib import Path
+from typing import List, Optional
+
+from .exceptions import GitError
+
+LOGGER = logging.getLogger(__name__)
+
+
+def git(*args: str, cwd: Optional[Path] = None) -> str:
+    """Run a git command, returning its output.
+
+    Args:
+        *args: Arguments passed to git.
+        cwd: Directory where the command is run.
+
+    Raises:
+        GitError: The command failed or git is not installed.
+
+    """
+    try:
+        return subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            check=True,
+            cwd=cwd,
+            text=True,
+        ).stdout
+    except FileNotFoundError as exc:
+        raise GitError(args, "git is not installed") from exc
+    except subprocess.CalledProcessError as exc:
+        raise GitError(args, exc.stderr.strip()) from exc
+
+
+def get_changed_files(ref: str, cwd: Optional[Path] = None) -> List[Path]:
+    """Get the files that changed since a ref.
+
+    This includes changes that have not been committed and files that are not
+    yet tracked. Both the old and new path of a renamed file are included.
+
+    Args:
+        ref: Commit, branch, or tag to compare against.
+        cwd: Directory within the repository.
+
+    Returns:
+        Absolute paths to the files that changed.
+
+    """
+    top_level = Path(git("rev-parse", "--show-toplevel", cwd=cwd).strip())
+    names = git("diff", "--name-only", "--no-renames", "-z", ref, "--", cwd=top_level)
+    untracked = git("ls-files", "--others", "--exclude-standard", "-z", cwd=top_level)
+    result = sorted(
+        {
+            top_level / name
+            for name in [*names.split("\0"), *untracked.split("\0")]
+            if name
+        }
+    )
+    LOGGER.debug("found %s file(s) changed since %s", len(result), ref)
+    return result
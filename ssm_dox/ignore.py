@@ -0,0 +1,186 @@
+"""Exclude paths from discovery using gitignore-style patterns."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterable, List, NamedTuple, Optional, Pattern
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PATTERNS = (".git/", ".ssm-dox-cache/")
+"""Patterns that are always applied before those read from a file."""
+
+
+class IgnoreRule(NamedTuple):
+    """A single parsed pattern."""
+
+    directory_only: bool
+    negate: bool
+    pattern: str
+    regex: Pattern[str]
+
+
+class DoxIgnore:
+    """Gitignore-style rules used to exclude paths from discovery.
+
+    Patterns follow the same syntax as a ``.gitignore`` file. They are matched
+    against the path of an entry relative to the root directory being
+    explored. Once a directory is ignored, nothing beneath it is explored so
+    it can't be re-included by a negated pattern.
+
+    """
+
+    FILE_NAME = ".doxignore"
+    """Name of the file containing patterns."""
+
+    def __init__(self, patterns: Iterable[str] = ()) -> None:
+        """Instantiate class.
+
+        Args:
+            patterns: Lines of a ``.doxignore`` file.
+
+        """
+        self.patterns = [*DEFAULT_PATTERNS, *patterns]
+        self.rules: List[IgnoreRule] = []
+        for line in self.patterns:
+            rule = self.parse(line)
+            if rule:
+                self.rules.append(rule)
+
+    @cached_property
+    def digest(self) -> str:
+        """Digest of the rules that can be used to detect when they change."""
+        return hashlib.sha1(
+            "\n".join(r.pattern for r in self.rules).encode()
+        ).hexdigest()
+
+    @classmethod
+    def from_root(cls, root_dir: Path) -> DoxIgnore:
+        """Load rules from the ``.doxignore`` file in a root directory.
+
+        Args:
+            root_dir: Root directory that will be explored.
+
+        """
+        path = root_dir / cls.FILE_NAME
+        try:
+            lines = path.read_text(encoding="UTF-8").splitlines()
+        except FileNotFoundError:
+            return cls()
+        LOGGER.debug("loaded ignore rules from %s", path)
+        return cls(lines)
+
+    def is_ignored(self, relative_path: str, *, is_dir: bool = False) -> bool:
+        """Determine if a path is ignored.
+
+        Args:
+            relative_path: POSIX style path relative to the root directory.
+            is_dir: Whether the path is a directory.
+
+        """
+        ignored = False
+        for rule in self.rules:
+            if rule.directory_only and not is_dir:
+                continue
+            if ignored == rule.negate and rule.regex.match(relative_path):
+                ignored = not rule.negate
+        return ignored
+
+    @staticmethod
+    def parse(line: str) -> Optional[IgnoreRule]:
+        """Parse a line of a ``.doxignore`` file.
+
+        Args:
+            line: The line to parse.
+
+        Returns:
+            The parsed rule or ``None`` if the line does not contain a pattern.
+
+        """
+        pattern = line.rstrip("\n")
+        if not pattern.endswith("\\ "):
+            pattern = pattern.rstrip(" ")
+        if not pattern or pattern.startswith("#"):
+            return None
+        negate = pattern.startswith("!")
+        if negate:
+            pattern = pattern[1:]
+        elif pattern.startswith(("\\!", "\\#")):
+            pattern = pattern[1:]
+        directory_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        if not pattern:
+            return None
+        anchored = "/" in pattern
+        regex = DoxIgnore.translate(pattern.lstrip("/"))
+        if not anchored:
+            regex = f"(?:.*/)?{regex}"
+        return IgnoreRule(
+            directory_only=directory_only,
+            negate=negate,
+            pattern=line.strip(),
+            regex=re.compile(f"{regex}$", re.DOTALL),
+        )
+
+    @staticmethod
+    def translate(pattern: str) -> str:
+        """Translate a gitignore-style pattern into a regular expression.
+
+        Args:
+            pattern: Pattern without a leading ``!`` or trailing ``/``.
+
+        """
+        result: List[str] = []
+        segments = pattern.split("/")
+        for index, segment in enumerate(segments):
+            last = index == len(segments) - 1
+            if segment == "**":
+                if last:
+                    result.append(".*")
+                else:
+                    result.append("(?:.*/)?")
+                continue
+            result.append(DoxIgnore._translate_segment(segment))
+            if not last:
+                result.append("/")
+        return "".join(result)
+
+    @staticmethod
+    def _translate_segment(segment: str) -> str:
+        """Translate a single path segment of a pattern.
+
+        Args:
+            segment: Segment of a pattern that does not contain ``/``.
+
+        """
+        result: List[str] = []
+        i = 0
+        while i < len(segment):
+            char = segment[i]
+            i += 1
+            if char == "\\" and i < len(segment):
+                result.append(re.escape(segment[i]))
+                i += 1
+            elif char == "*":
+                result.append("[^/]*")
+            elif char == "?":
+                result.append("[^/]")
+            elif char == "[":
+                start = i + 1 if segment[i : i + 1] in ("!", "^") else i
+                end = segment.find("]", start + 1)
+                if end == -1:
+                    result.append(re.escape(char))
+                    continue
+                body = segment[i:end]
+                if body[:1] in ("!", "^"):
+                    body = "^" + body[1:]
+                result.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                i = end + 1
+            else:
+                result.append(re.escape(char))
+        return "".join(result)
@@ -0,0 +1,199 @@
+"""Record of the documents produced by a build."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from .cache.base import JsonCacheFile
+from .utils import digest_file, write_atomic
+
+if TYPE_CHECKING:
+    from .document import Document
+    from .dox import Dox
+
+LOGGER = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = ".ssm-dox-manifest"
+"""Name of the manifest file in the root of an output directory.
+
+It does not end with ``.json`` so it can't collide with a document or be
+found as one.
+
+"""
+
+
+def _relpath(path: Path, start: Path) -> str:
+    """Get the POSIX style path of a file relative to a directory.
+
+    Args:
+        path: Path to the file.
+        start: Directory the result is relative to. ``path`` does not need to
+            be inside of it.
+
+    """
+    return Path(os.path.relpath(path.absolute(), start.absolute())).as_posix()
+
+
+class BuildManifest(JsonCacheFile):
+    """Record of the documents produced by a build.
+
+    The manifest is stored in the root of the output directory. For each
+    document, it records the Dox it was built from, a digest of the files the
+    Dox was built from, the SHA-256 digest, MD5 digest (the ETag of its S3
+    Object), size, and mtime of the document, and how long it took to build.
+
+    A document whose size and mtime match the manifest is assumed to be
+    unchanged since it was built so it does not need to be read to find its
+    digests. Documents are recorded right after they are written so, unlike
+    the inputs recorded by :class:`~ssm_dox.cache.build.BuildCache`, they are
+    only expected to be modified by a later build.
+
+    It is not used to skip building a Dox. Verifying the recorded inputs
+    digest requires reading every file the Dox was built from, which is what
+    the per-file stats of :class:`~ssm_dox.cache.build.BuildCache` avoid.
+
+    """
+
+    def __init__(self, output_dir: Path) -> None:
+        """Instantiate class.
+
+        Args:
+            output_dir: Directory where documents are built.
+
+        """
+        super().__init__(output_dir / MANIFEST_FILE_NAME)
+        self.modified = False
+        self.output_dir = output_dir
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Recorded entries keyed by the POSIX path of a document.
+
+        Paths are relative to the output directory.
+
+        """
+        return self.data.setdefault("documents", {})
+
+    @staticmethod
+    def create_entry(
+        dox: Dox, document: Document, *, duration: float
+    ) -> Optional[Dict[str, Any]]:
+        """Create the entry for a document that was just built.
+
+        This does not require the manifest so it can be done in a worker
+        process.
+
+        Args:
+            dox: The Dox that was built.
+            document: The document that was written.
+            duration: Seconds it took to build the Dox.
+
+        Returns:
+            The entry or ``None`` if the document does not exist.
+
+        """
+        try:
+            stat = document.path.stat()
+        except FileNotFoundError:
+            return None
+        inputs = hashlib.sha256()
+        for path in dox.dependencies:
+            digest = digest_file(path)
+            inputs.update(f"{_relpath(path, dox.root)}\0{digest}\0".encode())
+        return {
+            "dox": _relpath(dox.path, dox.root),
+            "duration": round(duration, 6),
+            "inputs_sha256": inputs.hexdigest(),
+            "md5": hashlib.md5(document.body).hexdigest(),
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": hashlib.sha256(document.body + b"\n").hexdigest(),
+            "size": stat.st_size,
+        }
+
+    def get(self, document: Path) -> Optional[Dict[str, Any]]:
+        """Get the entry of a document if the document has not changed.
+
+        Args:
+            document: Path to the document.
+
+        Returns:
+            The entry or ``None`` if the document is not recorded, does not
+            exist, or its size or mtime changed since it was recorded.
+
+        """
+        entry = self.entries.get(self.get_key(document))
+        if not entry:
+            return None
+        try:
+            stat = document.stat()
+        except OSError:
+            return None
+        if stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime_ns"]:
+            return None
+        return entry
+
+    def get_key(self, document: Path) -> str:
+        """Get the key of a document.
+
+        Args:
+            document: Path to the document.
+
+        """
+        return _relpath(document, self.output_dir)
+
+    def is_current(self, document: Path, data: bytes) -> bool:
+        """Determine if a document contains data without reading it.
+
+        Args:
+            document: Path to the document.
+            data: Data the document should contain.
+
+        """
+        entry = self.get(document)
+        return bool(entry and entry["sha256"] == hashlib.sha256(data).hexdigest())
+
+    def prune(self) -> None:
+        """Remove entries of documents that no longer exist."""
+        for key in list(self.entries):
+            if not (self.output_dir / key).is_file():
+                del self.entries[key]
+                self.modified = True
+
+    def record(self, document: Path, entry: Dict[str, Any]) -> None:
+        """Record a document.
+
+        An entry that only differs from the recorded one by its duration is
+        not recorded so a build that did not change anything does not modify
+        the manifest.
+
+        Args:
+            document: Path to the document.
+            entry: Entry created by :meth:`create_entry`.
+
+        """
+        key = self.get_key(document)
+        recorded = self.entries.get(key)
+        if recorded and {**recorded, "duration": entry.get("duration")} == entry:
+            return
+        self.entries[key] = entry
+        self.modified = True
+
+    def save(self) -> None:
+        """Save the manifest, replacing the previous one atomically."""
+        write_atomic(
+            self.path,
+            (
+                json.dumps(
+                    {"version": self.VERSION, "data": self.data},
+                    indent=2,
+                    sort_keys=True,
+                )
+                + "\n"
+            ).encode(),
+        )
+        self.modified = False
+        LOGGER.debug("saved manifest %s", self.path)
@@ -1,24 +1,137 @@
 """Base classes for data models."""
+from typing import Any, Dict, FrozenSet, Optional
+
 from pydantic import BaseModel as _BaseModel
+from pydantic import PrivateAttr
+
+from ..serializer import serialize
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a value to a hashable structure with the same equality.
+
+    Dicts are converted to a :class:`frozenset` of their items, lists and
+    tuples to a :class:`tuple`, and data models to their fingerprint.
+
+    Args:
+        value: Value to convert.
+
+    """
+    if isinstance(value, BaseModel):
+        return value.fingerprint
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    return value
 
 
 class BaseModel(_BaseModel):
-    """Custom base class for data models."""
+    """Custom base class for data models.
+
+    Data models are immutable so their fingerprint, boolean value, and JSON
+    are computed the first time they are needed and reused.
+
+    """
+
+    _bool: Optional[bool] = PrivateAttr(default=None)
+    _fingerprint: Optional[FrozenSet[Any]] = PrivateAttr(default=None)
+    _json: Optional[str] = PrivateAttr(default=None)
+
+    class Config:
+        """Model configuration."""
+
+        allow_mutation = False
+
+    @property
+    def fingerprint(self) -> FrozenSet[Any]:
+        """Hashable structure equal to that of any equal data model or dict.
+
+        The fingerprint of each nested data model is reused and the hash of
+        the fingerprint is cached so comparing the fingerprints of data models
+        that differ rarely needs to look past the hash.
+
+        """
+        if self._fingerprint is None:
+            fingerprint = frozenset((k, _freeze(v)) for k, v in self.__dict__.items())
+            hash(fingerprint)  # frozenset caches its hash
+            self._fingerprint = fingerprint
+        return self._fingerprint
+
+    def copy(self, **kwargs: Any) -> Any:  # type: ignore
+        """Duplicate a model.
+
+        The cached fingerprint, boolean value, and JSON are not copied since
+        they would not match the values of the copy if any were updated.
+
+        Args:
+            **kwargs: Arguments passed to :meth:`pydantic.BaseModel.copy`.
+
+        """
+        result = super().copy(**kwargs)
+        result._bool = None  # pylint: disable=protected-access
+        result._fingerprint = None  # pylint: disable=protected-access
+        result._json = None  # pylint: disable=protected-access
+        return result
 
     def __bool__(self) -> bool:
-        """Calculate the boolean value of the object."""
-        return bool(
-            self.dict(exclude_defaults=True, exclude_none=True, exclude_unset=True)
-        )
+        """Calculate the boolean value of the object.
+
+        A data model is ``True`` if a field was set to a value that is not
+        ``None`` or its default value.
+
+        """
+        if self._bool is None:
+            fields = self.__fields__
+            self._bool = any(
+                value is not None
+                and (fields[name].required or fields[name].default != value)
+                for name, value in self.__dict__.items()
+                if name in self.__fields_set__
+            )
+        return self._bool
 
     def __eq__(self, other: object) -> bool:
-        """Calculate equality (==)."""
+        """Calculate equality (==).
+
+        A string is compared to the JSON of the data model as it is written
+        to a document.
+
+        """
+        if self is other:
+            return True
         if isinstance(other, BaseModel):
-            return self.dict() == other.dict()
+            return self.fingerprint == other.fingerprint
         if isinstance(other, str):
-            return self.json(exclude_none=True, indent=4) == other
-        return self.dict() == other
+            if self._json is None:
+                self._json = serialize(self).decode()
+            return self._json == other
+        return self.fingerprint == _freeze(other)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state of the object to pickle, excluding cached values."""
+        state = super().__getstate__()
+        state["__private_attribute_values__"] = {}
+        return state
+
+    def __hash__(self) -> int:
+        """Calculate the hash of the object."""
+        return hash(self.fingerprint)
 
     def __ne__(self, other: object) -> bool:
         """Calculate inequality (!=)."""
         return not self == other
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state of a pickled object.
+
+        Args:
+            state: State of the object.
+
+        """
+        super().__setstate__(state)
+        self._bool = None
+        self._fingerprint = None
+        self._json = None
@@ -1,9 +1,127 @@
-"""AWS SSM Document mainStep data models."""
-from typing import Union
+"""AWS SSM Document mainStep data models.
 
-from .aws_runpowershellscript import AwsRunPowerShellScript
-from .aws_runshellscript import AwsRunShellScript
+The data model of each mainStep is only imported when it is used.
 
-AnyMainStep = Union[AwsRunPowerShellScript, AwsRunShellScript]
+"""
+import importlib
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
-__all__ = ["AwsRunPowerShellScript", "AwsRunShellScript"]
+from pydantic.errors import PydanticValueError
+from pydantic.validators import dict_validator
+
+from .base import SsmDocumentMainStep
+from .registry import (
+    BUILTIN_MAIN_STEPS,
+    ENTRY_POINT_GROUP,
+    MainStepLoadError,
+    MainStepRegistry,
+)
+
+if TYPE_CHECKING:
+    from .aws_applications import AwsApplications
+    from .aws_configuredocker import AwsConfigureDocker
+    from .aws_configurepackage import AwsConfigurePackage
+    from .aws_domainjoin import AwsDomainJoin
+    from .aws_downloadcontent import AwsDownloadContent
+    from .aws_psmodule import AwsPsModule
+    from .aws_refreshassociation import AwsRefreshAssociation
+    from .aws_rundockeraction import AwsRunDockerAction
+    from .aws_rundocument import AwsRunDocument
+    from .aws_runpowershellscript import AwsRunPowerShellScript
+    from .aws_runshellscript import AwsRunShellScript
+    from .aws_softwareinventory import AwsSoftwareInventory
+    from .aws_updateagent import AwsUpdateAgent
+    from .aws_updatessmagent import AwsUpdateSsmAgent
+
+MAIN_STEP_TYPES = MainStepRegistry(BUILTIN_MAIN_STEPS)
+"""Data model of each supported mainStep keyed by its action."""
+
+_BUILTIN_MODELS = {
+    path.rpartition(":")[2]: path.partition(":")[0]
+    for path in BUILTIN_MAIN_STEPS.values()
+}
+
+
+class UnsupportedActionError(PydanticValueError):
+    """The action of a mainStep is missing or not supported."""
+
+    code = "main_step.action"
+    msg_template = "unsupported action {action!r}; expected one of {expected}"
+
+
+class AnyMainStep(SsmDocumentMainStep):
+    """Any supported AWS SSM Document mainStep.
+
+    This is only used as a type annotation. A mainStep is validated as the
+    data model for its action, found in :data:`MAIN_STEP_TYPES`, so the cost
+    of validating it does not depend on the number of supported actions and
+    only the errors of that data model are reported.
+
+    """
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[..., Any]]:
+        """Yield the validators of this type."""
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: Any) -> SsmDocumentMainStep:  # type: ignore
+        """Validate a mainStep as the data model for its action.
+
+        Args:
+            value: The mainStep to validate.
+
+        Raises:
+            MainStepLoadError: The data model of the action could not be
+                loaded.
+            UnsupportedActionError: The action is missing or not supported.
+
+        """
+        if isinstance(value, SsmDocumentMainStep):
+            if MAIN_STEP_TYPES.get(value.action) is type(value):
+                return value
+            value = value.dict(exclude_unset=True)
+        data = dict_validator(value)
+        action = data.get("action")
+        model = MAIN_STEP_TYPES.get(action) if isinstance(action, str) else None
+        if model is None:
+            raise UnsupportedActionError(
+                action=action, expected=", ".join(MAIN_STEP_TYPES)
+            )
+        return model.parse_obj(data)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the data models of built-in mainSteps when they are accessed.
+
+    Args:
+        name: Name of the attribute.
+
+    """
+    if name in _BUILTIN_MODELS:
+        return getattr(importlib.import_module(_BUILTIN_MODELS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "ENTRY_POINT_GROUP",
+    "MAIN_STEP_TYPES",
+    "AnyMainStep",
+    "AwsApplications",
+    "AwsConfigureDocker",
+    "AwsConfigurePackage",
+    "AwsDomainJoin",
+    "AwsDownloadContent",
+    "AwsPsModule",
+    "AwsRefreshAssociation",
+    "AwsRunDockerAction",
+    "AwsRunDocument",
+    "AwsRunPowerShellScript",
+    "AwsRunShellScript",
+    "AwsSoftwareInventory",
+    "AwsUpdateAgent",
+    "AwsUpdateSsmAgent",
+    "MainStepLoadError",
+    "MainStepRegistry",
+    "UnsupportedActionError",
+]
@@ -0,0 +1,30 @@
+"""AWS SSM Document mainStep aws:applications data model.
+
+https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-applications
+
+"""
+from __future__ import annotations
+
+from typing import Literal, Optional
+
+from .base import SsmDocumentMainStep, SsmDocumentMainStepInputs
+
+
+class AwsApplicationsInputs(SsmDocumentMainStepInputs):
+    """AWS SSM Document mainStep aws:applications inputs data model."""
+
+    action: str
+    parameters: Optional[str] = None
+    source: str
+    sourceHash: Optional[str] = None
+
+
+class AwsApplications(SsmDocumentMainStep):
+    """AWS SSM Document mainStep aws:applications data model.
+
+    https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-applications
+
+    """
+
+    action: Literal["aws:applications"]
+    inputs: AwsApplicationsInputs
@@ -0,0 +1,27 @@
+"""AWS SSM Document mainStep aws:configureDocker data model.
+
+https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-configureDocker
+
+"""
+from __future__ import annotations
+
+from typing import Literal
+
+from .base import SsmDocumentMainStep, SsmDocumentMainStepInputs
+
+
+class AwsConfigureDockerInputs(SsmDocumentMainStepInputs):
+    """AWS SSM Document mainStep aws:configureDocker inputs data model."""
+
+    action: str
+
+
+class AwsConfigureDocker(SsmDocumentMainStep):
+    """AWS SSM Document mainStep aws:configureDocker data model.
+
+    https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-configureDocker
+
+    """
+
+    action: Literal["aws:configureDocker"]
+    inputs: AwsConfigureDockerInputs
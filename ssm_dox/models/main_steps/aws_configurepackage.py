@@ -0,0 +1,31 @@
+"""AWS SSM Document mainStep aws:configurePackage data model.
+
+https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-configurePackage
+
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Literal, Optional, Union
+
+from .base import SsmDocumentMainStep, SsmDocumentMainStepInputs
+
+
+class AwsConfigurePackageInputs(SsmDocumentMainStepInputs):
+    """AWS SSM Document mainStep aws:configurePackage inputs data model."""
+
+    action: str
+    additionalArguments: Optional[Union[str, Dict[str, Any]]] = None
+    installationType: Optional[str] = None
+    name: str
+    version: Optional[str] = None
+
+
+class AwsConfigurePackage(SsmDocumentMainStep):
+    """AWS SSM Document mainStep aws:configurePackage data model.
+
+    https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-configurePackage
+
+    """
+
+    action: Literal["aws:configurePackage"]
+    inputs: AwsConfigurePackageInputs
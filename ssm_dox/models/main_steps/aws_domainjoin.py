@@ -0,0 +1,30 @@
+"""AWS SSM Document mainStep aws:domainJoin data model.
+
+https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-domainJoin
+
+"""
+from __future__ import annotations
+
+from typing import List, Literal, Optional
+
+from .base import SsmDocumentMainStep, SsmDocumentMainStepInputs
+
+
+class AwsDomainJoinInputs(SsmDocumentMainStepInputs):
+    """AWS SSM Document mainStep aws:domainJoin inputs data model."""
+
+    directoryId: str
+    directoryName: str
+    directoryOU: Optional[str] = None
+    dnsIpAddresses: Optional[List[str]] = None
+
+
+class AwsDomainJoin(SsmDocumentMainStep):
+    """AWS SSM Document mainStep aws:domainJoin data model.
+
+    https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-domainJoin
+
+    """
+
+    action: Literal["aws:domainJoin"]
+    inputs: AwsDomainJoinInputs
@@ -0,0 +1,29 @@
+"""AWS SSM Document mainStep aws:downloadContent data model.
+
+https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-downloadContent
+
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Literal, Optional, Union
+
+from .base import SsmDocumentMainStep, SsmDocumentMainStepInputs
+
+
+class AwsDownloadContentInputs(SsmDocumentMainStepInputs):
+    """AWS SSM Document mainStep aws:downloadContent inputs data model."""
+
+    destinationPath: Optional[str] = None
+    sourceInfo: Union[str, Dict[str, Any]]
+    sourceType: str
+
+
+class AwsDownloadContent(SsmDocumentMainStep):
+    """AWS SSM Document mainStep aws:downloadContent data model.
+
+    https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-downloadContent
+
+    """
+
+    action: Literal["aws:downloadContent"]
+    inputs: AwsDownloadContentInputs
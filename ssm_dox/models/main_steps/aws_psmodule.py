@@ -0,0 +1,31 @@
+"""AWS SSM Document mainStep aws:psModule data model.
+
+https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-psModule
+
+"""
+from __future__ import annotations
+
+from typing import List, Literal, Optional
+
+from .base import SsmDocumentMainStep, SsmDocumentMainStepInputs
+
+
+class AwsPsModuleInputs(SsmDocumentMainStepInputs):
+    """AWS SSM Document mainStep aws:psModule inputs data model."""
+
+    runCommand: List[str] = []
+    source: str
+    sourceHash: Optional[str] = None
+    timeoutSeconds: Optional[str] = None
+    workingDirectory: Optional[str] = None
+
+
+class AwsPsModule(SsmDocumentMainStep):
+    """AWS SSM Document mainStep aws:psModule data model.
+
+    https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-psModule
+
+    """
+
+    action: Literal["aws:psModule"]
+    inputs: AwsPsModuleInputs
@@ -0,0 +1,27 @@
+"""AWS SSM Document mainStep aws:refreshAssociation data model.
+
+https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-refreshAssociation
+
+"""
+from __future__ import annotations
+
+from typing import List, Literal, Optional
+
+from .base import SsmDocumentMainStep, SsmDocumentMainStepInputs
+
+
+class AwsRefreshAssociationInputs(SsmDocumentMainStepInputs):
+    """AWS SSM Document mainStep aws:refreshAssociation inputs data model."""
+
+    associationIds: Optional[List[str]] = None
+
+
+class AwsRefreshAssociation(SsmDocumentMainStep):
+    """AWS SSM Document mainStep aws:refreshAssociation data model.
+
+    https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-refreshAssociation
+
+    """
+
+    action: Literal["aws:refreshAssociation"]
+    inputs: AwsRefreshAssociationInputs = AwsRefreshAssociationInputs()
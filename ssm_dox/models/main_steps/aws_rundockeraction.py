@@ -0,0 +1,36 @@
+"""AWS SSM Document mainStep aws:runDockerAction data model.
+
+https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-runDockerAction
+
+"""
+from __future__ import annotations
+
+from typing import List, Literal, Optional
+
+from .base import SsmDocumentMainStep, SsmDocumentMainStepInputs
+
+
+class AwsRunDockerActionInputs(SsmDocumentMainStepInputs):
+    """AWS SSM Document mainStep aws:runDockerAction inputs data model."""
+
+    action: str
+    cmd: Optional[str] = None
+    container: Optional[str] = None
+    cpuShares: Optional[str] = None
+    env: Optional[str] = None
+    image: Optional[str] = None
+    memory: Optional[str] = None
+    publish: Optional[str] = None
+    user: Optional[str] = None
+    volume: Optional[List[str]] = None
+
+
+class AwsRunDockerAction(SsmDocumentMainStep):
+    """AWS SSM Document mainStep aws:runDockerAction data model.
+
+    https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-runDockerAction
+
+    """
+
+    action: Literal["aws:runDockerAction"]
+    inputs: AwsRunDockerActionInputs
@@ -0,0 +1,29 @@
+"""AWS SSM Document mainStep aws:runDocument data model.
+
+https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-runDocument
+
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Literal, Optional, Union
+
+from .base import SsmDocumentMainStep, SsmDocumentMainStepInputs
+
+
+class AwsRunDocumentInputs(SsmDocumentMainStepInputs):
+    """AWS SSM Document mainStep aws:runDocument inputs data model."""
+
+    documentParameters: Optional[Union[str, Dict[str, Any]]] = None
+    documentPath: str
+    documentType: str
+
+
+class AwsRunDocument(SsmDocumentMainStep):
+    """AWS SSM Document mainStep aws:runDocument data model.
+
+    https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-runDocument
+
+    """
+
+    action: Literal["aws:runDocument"]
+    inputs: AwsRunDocumentInputs
@@ -0,0 +1,37 @@
+"""AWS SSM Document mainStep aws:softwareInventory data model.
+
+https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-softwareInventory
+
+"""
+from __future__ import annotations
+
+from typing import Literal, Optional
+
+from .base import SsmDocumentMainStep, SsmDocumentMainStepInputs
+
+
+class AwsSoftwareInventoryInputs(SsmDocumentMainStepInputs):
+    """AWS SSM Document mainStep aws:softwareInventory inputs data model."""
+
+    applications: Optional[str] = None
+    awsComponents: Optional[str] = None
+    billingInfo: Optional[str] = None
+    customInventory: Optional[str] = None
+    files: Optional[str] = None
+    instanceDetailedInformation: Optional[str] = None
+    networkConfig: Optional[str] = None
+    services: Optional[str] = None
+    windowsRegistry: Optional[str] = None
+    windowsRoles: Optional[str] = None
+    windowsUpdates: Optional[str] = None
+
+
+class AwsSoftwareInventory(SsmDocumentMainStep):
+    """AWS SSM Document mainStep aws:softwareInventory data model.
+
+    https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-softwareInventory
+
+    """
+
+    action: Literal["aws:softwareInventory"]
+    inputs: AwsSoftwareInventoryInputs = AwsSoftwareInventoryInputs()
@@ -0,0 +1,32 @@
+"""AWS SSM Document mainStep aws:updateAgent data model.
+
+https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-updateAgent
+
+"""
+from __future__ import annotations
+
+from typing import Literal, Optional, Union
+
+from pydantic import StrictBool, StrictStr
+
+from .base import SsmDocumentMainStep, SsmDocumentMainStepInputs
+
+
+class AwsUpdateAgentInputs(SsmDocumentMainStepInputs):
+    """AWS SSM Document mainStep aws:updateAgent inputs data model."""
+
+    agentName: str
+    allowDowngrade: Optional[Union[StrictBool, StrictStr]] = None
+    source: str
+    targetVersion: Optional[str] = None
+
+
+class AwsUpdateAgent(SsmDocumentMainStep):
+    """AWS SSM Document mainStep aws:updateAgent data model.
+
+    https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-updateAgent
+
+    """
+
+    action: Literal["aws:updateAgent"]
+    inputs: AwsUpdateAgentInputs
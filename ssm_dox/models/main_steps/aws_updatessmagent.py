@@ -0,0 +1,32 @@
+"""AWS SSM Document mainStep aws:updateSsmAgent data model.
+
+https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-updateSsmAgent
+
+"""
+from __future__ import annotations
+
+from typing import Literal, Optional, Union
+
+from pydantic import StrictBool, StrictStr
+
+from .base import SsmDocumentMainStep, SsmDocumentMainStepInputs
+
+
+class AwsUpdateSsmAgentInputs(SsmDocumentMainStepInputs):
+    """AWS SSM Document mainStep aws:updateSsmAgent inputs data model."""
+
+    agentName: str
+    allowDowngrade: Optional[Union[StrictBool, StrictStr]] = None
+    source: str
+    targetVersion: Optional[str] = None
+
+
+class AwsUpdateSsmAgent(SsmDocumentMainStep):
+    """AWS SSM Document mainStep aws:updateSsmAgent data model.
+
+    https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-plugins.html#aws-updateSsmAgent
+
+    """
+
+    action: Literal["aws:updateSsmAgent"]
+    inputs: AwsUpdateSsmAgentInputs
@@ -0,0 +1,206 @@
+"""Registry of the data models of AWS SSM Document mainSteps."""
+from __future__ import annotations
+
+import importlib
+import logging
+from importlib.metadata import entry_points
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Type,
+    Union,
+    cast,
+)
+
+from pydantic.errors import PydanticValueError
+
+from .base import SsmDocumentMainStep
+
+if TYPE_CHECKING:
+    from ..._logging import CustomLogger
+
+LOGGER = cast("CustomLogger", logging.getLogger(__name__))
+
+ENTRY_POINT_GROUP = "ssm_dox.main_steps"
+"""Entry point group of plugins that provide data models for mainSteps.
+
+The name of each entry point is the action of the mainStep and its value is
+the data model (e.g. ``example:myAction = my_package.steps:MyAction``).
+
+"""
+
+BUILTIN_MAIN_STEPS: Dict[str, str] = {
+    "aws:applications": f"{__package__}.aws_applications:AwsApplications",
+    "aws:configureDocker": f"{__package__}.aws_configuredocker:AwsConfigureDocker",
+    "aws:configurePackage": f"{__package__}.aws_configurepackage:AwsConfigurePackage",
+    "aws:domainJoin": f"{__package__}.aws_domainjoin:AwsDomainJoin",
+    "aws:downloadContent": f"{__package__}.aws_downloadcontent:AwsDownloadContent",
+    "aws:psModule": f"{__package__}.aws_psmodule:AwsPsModule",
+    "aws:refreshAssociation": (
+        f"{__package__}.aws_refreshassociation:AwsRefreshAssociation"
+    ),
+    "aws:runDockerAction": f"{__package__}.aws_rundockeraction:AwsRunDockerAction",
+    "aws:runDocument": f"{__package__}.aws_rundocument:AwsRunDocument",
+    "aws:runPowerShellScript": (
+        f"{__package__}.aws_runpowershellscript:AwsRunPowerShellScript"
+    ),
+    "aws:runShellScript": f"{__package__}.aws_runshellscript:AwsRunShellScript",
+    "aws:softwareInventory": (
+        f"{__package__}.aws_softwareinventory:AwsSoftwareInventory"
+    ),
+    "aws:updateAgent": f"{__package__}.aws_updateagent:AwsUpdateAgent",
+    "aws:updateSsmAgent": f"{__package__}.aws_updatessmagent:AwsUpdateSsmAgent",
+}
+"""Import path of the data model of each built-in mainStep keyed by its action."""
+
+
+class MainStepLoadError(PydanticValueError):
+    """The data model of a mainStep could not be loaded."""
+
+    code = "main_step.load"
+    msg_template = "unable to load data model of action {action!r}: {error}"
+
+
+class MainStepRegistry(MutableMapping[str, Type[SsmDocumentMainStep]]):
+    """Data model of each supported mainStep keyed by its action.
+
+    Data models are registered by their import path (``module:attribute``)
+    and only imported the first time their action is used. Entry points of
+    plugins are only looked up when an action is not already registered or
+    when every action is listed. Plugins can't replace a registered action.
+
+    """
+
+    def __init__(
+        self,
+        paths: Optional[Mapping[str, str]] = None,
+        *,
+        group: Optional[str] = ENTRY_POINT_GROUP,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            paths: Import path of data models keyed by their action.
+            group: Entry point group of plugins. If ``None``, plugins are
+                not used.
+
+        """
+        self.group = group
+        self._paths: Dict[str, str] = dict(paths or {})
+        self._types: Dict[str, Type[SsmDocumentMainStep]] = {}
+        self._scanned = group is None
+
+    def scan(self) -> None:
+        """Register the data models provided by plugins without importing them."""
+        self._scanned = True
+        if not self.group:
+            return
+        eps = entry_points()
+        if hasattr(eps, "select"):
+            found = eps.select(group=self.group)  # type: ignore
+        else:  # cov: ignore
+            found = eps.get(self.group, [])  # type: ignore
+        for entry_point in found:
+            if entry_point.name in self:
+                LOGGER.debug(
+                    "ignoring plugin %s for registered action %s",
+                    entry_point.value,
+                    entry_point.name,
+                )
+                continue
+            LOGGER.debug(
+                "found plugin %s for action %s", entry_point.value, entry_point.name
+            )
+            self._paths[entry_point.name] = entry_point.value
+
+    def _load(self, action: str) -> Type[SsmDocumentMainStep]:
+        """Import the data model of an action.
+
+        Args:
+            action: The action.
+
+        Raises:
+            KeyError: The action is not registered.
+            MainStepLoadError: The data model could not be imported or is not
+                a mainStep data model.
+
+        """
+        path = self._paths[action]
+        module_name, _, attr = path.partition(":")
+        try:
+            result = getattr(importlib.import_module(module_name), attr)
+        except (AttributeError, ImportError, ValueError) as exc:
+            raise MainStepLoadError(action=action, error=exc) from exc
+        if not (isinstance(result, type) and issubclass(result, SsmDocumentMainStep)):
+            raise MainStepLoadError(
+                action=action, error=f"{path} is not a mainStep data model"
+            )
+        LOGGER.debug("loaded data model of action %s from %s", action, path)
+        return result
+
+    def __contains__(self, action: object) -> bool:
+        """Determine if an action is registered without importing its data model."""
+        return action in self._types or action in self._paths
+
+    def __delitem__(self, action: str) -> None:
+        """Unregister an action.
+
+        Args:
+            action: The action.
+
+        """
+        if action not in self:
+            raise KeyError(action)
+        self._paths.pop(action, None)
+        self._types.pop(action, None)
+
+    def __getitem__(self, action: str) -> Type[SsmDocumentMainStep]:
+        """Get the data model of an action, importing it if needed.
+
+        Args:
+            action: The action.
+
+        Raises:
+            KeyError: The action is not registered.
+            MainStepLoadError: The data model could not be imported.
+
+        """
+        try:
+            return self._types[action]
+        except KeyError:
+            pass
+        if action not in self and not self._scanned:
+            self.scan()
+        self._types[action] = self._load(action)
+        return self._types[action]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over every registered action, including those of plugins."""
+        if not self._scanned:
+            self.scan()
+        return iter(sorted({*self._paths, *self._types}))
+
+    def __len__(self) -> int:
+        """Number of registered actions, including those of plugins."""
+        return len(list(iter(self)))
+
+    def __setitem__(  # type: ignore
+        self, action: str, model: Union[str, Type[SsmDocumentMainStep]]
+    ) -> None:
+        """Register the data model of an action.
+
+        Args:
+            action: The action.
+            model: The data model or its import path (``module:attribute``).
+
+        """
+        self._types.pop(action, None)
+        self._paths.pop(action, None)
+        if isinstance(model, str):
+            self._paths[action] = model
+        else:
+            self._types[action] = model
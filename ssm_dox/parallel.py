@@ -0,0 +1,237 @@
+"""Process Dox in parallel while keeping results and logs in order."""
+from __future__ import annotations
+
+import logging
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from .cache.scripts import SCRIPT_CACHE
+from .dox import Dox
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .cache.templates import TemplateCache
+
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+_CacheCounters = Tuple[int, int, int, int]
+_WorkerResult = Tuple[_R, List[logging.LogRecord], _CacheCounters]
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _RecordCollector(logging.Handler):
+    """Collect log records so they can be sent to the parent process."""
+
+    def __init__(self) -> None:
+        """Instantiate class."""
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Collect a log record, formatting its message so it can be pickled."""
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+
+_COLLECTOR = _RecordCollector()
+
+
+def _init_worker(level: int) -> None:
+    """Route the logs of a worker process to the collector.
+
+    Args:
+        level: Log level of the parent process.
+
+    """
+    logger = logging.getLogger("ssm_dox")
+    logger.handlers = [_COLLECTOR]
+    logger.propagate = False
+    logger.setLevel(level)
+
+
+def _get_cache_counters(cache: Optional[TemplateCache]) -> _CacheCounters:
+    """Get the hits and misses of the script cache and a template cache.
+
+    Args:
+        cache: Template cache used by a Dox.
+
+    """
+    return (
+        SCRIPT_CACHE.hits,
+        SCRIPT_CACHE.misses,
+        cache.hits if cache else 0,
+        cache.misses if cache else 0,
+    )
+
+
+def _run_in_worker(
+    func: Callable[[Dox, Path], _R],
+    path: Path,
+    root_dir: Path,
+    template: Path,
+    cache: Optional[TemplateCache],
+    output_dir: Path,
+) -> _WorkerResult[_R]:
+    """Run a function for a Dox in a worker process.
+
+    Only paths are sent to the worker. Log records are collected and returned
+    with the result so the parent process can emit them in order. The number
+    of cache hits and misses are also returned so the parent can report them.
+
+    Args:
+        func: Function to run.
+        path: Path to the Dox directory.
+        root_dir: The root directory continaing the Dox.
+        template: Path to the template of the Dox.
+        cache: Template cache used by the Dox.
+        output_dir: Path where built documents are stored.
+
+    """
+    _COLLECTOR.records.clear()
+    before = _get_cache_counters(cache)
+    result = func(
+        Dox(cache=cache, path=path, root_dir=root_dir, template=template), output_dir
+    )
+    after = _get_cache_counters(cache)
+    return (
+        result,
+        list(_COLLECTOR.records),
+        cast(_CacheCounters, tuple(a - b for a, b in zip(after, before))),
+    )
+
+
+def imap_ordered(
+    executor_cls: Callable[..., Executor],
+    func: Callable[..., _R],
+    items: Iterable[_T],
+    jobs: int,
+    *,
+    args: Optional[Callable[[_T], Tuple[Any, ...]]] = None,
+    skip: Optional[Callable[[_T], bool]] = None,
+    **kwargs: Any,
+) -> Iterator[Tuple[_T, Optional[_R]]]:
+    """Run a function for each item in a pool, yielding results in order.
+
+    A bounded number of items are in flight at a time so ``items`` can be a
+    generator that is still producing items.
+
+    Args:
+        executor_cls: Executor used to run the function (e.g.
+            :class:`~concurrent.futures.ThreadPoolExecutor`).
+        func: Function to run. It is passed an item.
+        items: Items to process.
+        jobs: Number of items to process at the same time.
+        args: Get the arguments ``func`` is passed for an item instead of
+            the item itself (e.g. so less data is sent to a worker process).
+        skip: Determine if an item should be skipped. Skipped items are
+            yielded with a result of ``None``.
+        **kwargs: Passed to ``executor_cls``.
+
+    """
+    pending: Deque[Tuple[_T, Optional[Future[_R]]]] = deque()
+    with executor_cls(max_workers=jobs, **kwargs) as executor:
+        for item in items:
+            future = None
+            if not (skip and skip(item)):
+                future = executor.submit(func, *(args(item) if args else (item,)))
+            pending.append((item, future))
+            while len(pending) > jobs * 2:
+                yield _wait(*pending.popleft())
+        while pending:
+            yield _wait(*pending.popleft())
+
+
+def _wait(item: _T, future: Optional[Future[_R]]) -> Tuple[_T, Optional[_R]]:
+    """Wait for the result of an item.
+
+    Args:
+        item: The item being processed.
+        future: Future of processing the item or ``None`` if it was skipped.
+
+    """
+    return item, future.result() if future else None
+
+
+def imap_dox(
+    func: Callable[[Dox, Path], _R],
+    dox: Iterable[Dox],
+    output_dir: Path,
+    *,
+    jobs: int = 1,
+    skip: Optional[Callable[[Dox], bool]] = None,
+) -> Iterator[Tuple[Dox, Optional[_R]]]:
+    """Run a function for each Dox, yielding results in the order of ``dox``.
+
+    When ``jobs`` is greater than 1, ``func`` is run in a pool of worker
+    processes. ``func`` must be importable by the workers (e.g. a module level
+    function) and must return a picklable result. Log records emitted by the
+    workers are emitted by the parent process right before the corresponding
+    result is yielded. A bounded number of Dox are in flight at a time so
+    ``dox`` can be a generator that is still discovering Dox.
+
+    Args:
+        func: Function to run. It is passed the Dox and ``output_dir``.
+        dox: Dox to process.
+        output_dir: Path where built documents are stored.
+        jobs: Number of Dox to process in parallel.
+        skip: Determine if a Dox should be skipped. Skipped Dox are
+            yielded with a result of ``None``.
+
+    """
+    if jobs <= 1:
+        for item in dox:
+            yield item, None if skip and skip(item) else func(item, output_dir)
+        return
+    for item, result in imap_ordered(
+        ProcessPoolExecutor,
+        partial(_run_in_worker, func),
+        dox,
+        jobs,
+        args=lambda d: (d.path, d.root, d.template, d.cache, output_dir),
+        skip=skip,
+        initializer=_init_worker,
+        initargs=(logging.getLogger("ssm_dox").getEffectiveLevel(),),
+    ):
+        yield _resolve(item, result)
+
+
+def _resolve(
+    dox: Dox, worker_result: Optional[_WorkerResult[_R]]
+) -> Tuple[Dox, Optional[_R]]:
+    """Emit the logs of a worker, returning the result of a Dox.
+
+    Args:
+        dox: The Dox being processed.
+        worker_result: Result of processing the Dox in a worker or ``None``
+            if it was skipped.
+
+    """
+    if not worker_result:
+        return dox, None
+    result, records, counters = worker_result
+    for record in records:
+        logging.getLogger(record.name).handle(record)
+    SCRIPT_CACHE.hits += counters[0]
+    SCRIPT_CACHE.misses += counters[1]
+    if dox.cache:
+        dox.cache.hits += counters[2]
+        dox.cache.misses += counters[3]
+    return dox, result
@@ -0,0 +1,503 @@
+"""Publish many documents to S3 or SSM concurrently."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from .parallel import imap_ordered
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import boto3
+    from mypy_boto3_s3.client import S3Client
+    from mypy_boto3_ssm.client import SSMClient
+
+    from ._logging import CustomLogger
+    from .document import Document
+    from .manifest import BuildManifest
+
+LOGGER = cast("CustomLogger", logging.getLogger(__name__))
+
+DELETE_BATCH_SIZE = 1000
+"""Maximum number of keys that can be deleted with a single request."""
+
+SSM_FIND_VERSION_LIMIT = 5
+"""Maximum number of versions of an SSM Document searched for matching content."""
+
+SSM_MAX_ATTEMPTS = 10
+"""Maximum number of attempts for each SSM API call, including retries."""
+
+
+class PublishResult(NamedTuple):
+    """Result of publishing a single document."""
+
+    document: Path
+    error: Optional[str]
+    key: str
+    size: int
+    uploaded: bool
+
+
+class PublishSummary(NamedTuple):
+    """Summary of publishing many documents."""
+
+    deleted: int
+    failed: int
+    published: int
+    seconds: float
+    size: int
+    unchanged: int
+
+    @property
+    def throughput(self) -> float:
+        """Documents published per second."""
+        return self.published / self.seconds if self.seconds else 0.0
+
+    def log(self) -> None:
+        """Log the summary."""
+        LOGGER.info(
+            "published %s document(s) (%s byte(s)) in %.2fs; "
+            "%.1f document(s)/s, %.1f KiB/s; %s unchanged, %s deleted",
+            self.published,
+            self.size,
+            self.seconds,
+            self.throughput,
+            self.size / 1024 / self.seconds if self.seconds else 0.0,
+            self.unchanged,
+            self.deleted,
+        )
+        if self.failed:
+            LOGGER.error("failed to publish %s document(s)", self.failed)
+
+
+class Publisher:
+    """Publish many documents to S3 concurrently.
+
+    Documents are uploaded by a pool of threads that share a single client.
+    Results are handled in the order the documents were provided.
+
+    Unless ``force`` is used, the objects under the prefix are listed before
+    uploading. A document whose MD5 digest matches the ETag of its object is
+    not uploaded again. ETags of objects uploaded in multiple parts are not
+    an MD5 digest so they never match. If a build manifest is provided, the
+    digest of a document that has not changed since it was built is taken
+    from the manifest instead of reading the document.
+
+    """
+
+    def __init__(
+        self,
+        client: S3Client,
+        *,
+        bucket: str,
+        concurrency: int = 1,
+        delete: bool = False,
+        force: bool = False,
+        manifest: Optional[BuildManifest] = None,
+        prefix: Optional[str] = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            client: S3 client. Its connection pool should be at least as large
+                as ``concurrency`` (see :meth:`create_client`).
+            bucket: Name of the S3 Bucket.
+            concurrency: Number of documents to upload at the same time.
+            delete: Delete objects under the prefix that do not correspond
+                to a document.
+            force: Upload every document, even if its object is unchanged.
+            manifest: Build manifest of the documents.
+            prefix: A prefix to append to the S3 Object key.
+
+        """
+        self.bucket = bucket
+        self.client = client
+        self.concurrency = max(concurrency, 1)
+        self.delete = delete
+        self.force = force
+        self.manifest = manifest
+        self.prefix = prefix
+        self.existing: Dict[str, str] = {}
+        self.results: List[PublishResult] = []
+
+    @staticmethod
+    def create_client(session: boto3.Session, *, concurrency: int = 1) -> S3Client:
+        """Create an S3 client that can be shared by every upload thread.
+
+        Args:
+            session: boto3 session used to create the client.
+            concurrency: Number of threads that will use the client.
+
+        """
+        return session.client(  # type: ignore
+            "s3",
+            config=Config(
+                max_pool_connections=max(concurrency, 10),
+                retries={"mode": "standard"},
+            ),
+        )
+
+    def publish(
+        self, documents: Iterable[Document], *, skipped: Sequence[Document] = ()
+    ) -> PublishSummary:
+        """Publish documents.
+
+        Args:
+            documents: Documents to publish. This can be a generator so
+                uploading can start before all documents have been found.
+            skipped: Documents that were intentionally not published. Their
+                objects are not deleted. This is only read after all
+                ``documents`` have been published so it can be populated
+                while iterating over ``documents``.
+
+        """
+        start = time.perf_counter()
+        if self.delete or not self.force:
+            self.existing = self.list_objects()
+        self.results.extend(
+            cast(PublishResult, result)
+            for _, result in imap_ordered(
+                ThreadPoolExecutor,
+                self.publish_document,
+                documents,
+                self.concurrency,
+                thread_name_prefix="ssm-dox-publish",
+            )
+        )
+        deleted = 0
+        if self.delete:
+            keep = {r.key for r in self.results}
+            keep.update(d.get_key(self.prefix) for d in skipped)
+            deleted = self.delete_objects(set(self.existing).difference(keep))
+        uploaded = [r for r in self.results if r.uploaded]
+        return PublishSummary(
+            deleted=deleted,
+            failed=sum(1 for r in self.results if r.error),
+            published=len(uploaded),
+            seconds=time.perf_counter() - start,
+            size=sum(r.size for r in uploaded),
+            unchanged=sum(1 for r in self.results if not (r.error or r.uploaded)),
+        )
+
+    def delete_objects(self, keys: Iterable[str]) -> int:
+        """Delete objects in batches.
+
+        Args:
+            keys: Keys of the objects to delete.
+
+        Returns:
+            Number of objects deleted.
+
+        """
+        sorted_keys = sorted(keys)
+        deleted = 0
+        for index in range(0, len(sorted_keys), DELETE_BATCH_SIZE):
+            batch = sorted_keys[index : index + DELETE_BATCH_SIZE]
+            response = self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            errors = response.get("Errors", [])
+            for error in errors:
+                LOGGER.error(
+                    "failed to delete s3://%s/%s: %s",
+                    self.bucket,
+                    error.get("Key"),
+                    error.get("Message"),
+                )
+            deleted += len(batch) - len(errors)
+        for key in sorted_keys:
+            LOGGER.debug("deleted s3://%s/%s", self.bucket, key)
+        return deleted
+
+    def get_digest(self, document: Document) -> Tuple[str, int]:
+        """Get the MD5 digest and size of the body of a document.
+
+        Args:
+            document: The document.
+
+        """
+        entry = self.manifest.get(document.path) if self.manifest else None
+        if entry:
+            return entry["md5"], entry["size"] - 1  # written with a trailing newline
+        body = document.body
+        return hashlib.md5(body).hexdigest(), len(body)
+
+    def list_objects(self) -> Dict[str, str]:
+        """List the objects under the prefix.
+
+        Returns:
+            ETag of each object keyed by its key.
+
+        """
+        kwargs = {"Bucket": self.bucket}
+        if self.prefix:
+            kwargs["Prefix"] = f"{self.prefix.rstrip('/')}/"
+        result: Dict[str, str] = {}
+        for page in self.client.get_paginator("list_objects_v2").paginate(**kwargs):
+            for obj in page.get("Contents", []):
+                result[obj["Key"]] = obj["ETag"].strip('"')
+        LOGGER.debug("found %s existing object(s) in s3://%s", len(result), self.bucket)
+        return result
+
+    def publish_document(self, document: Document) -> PublishResult:
+        """Publish a single document, capturing any error that occurs.
+
+        Args:
+            document: The document to publish.
+
+        """
+        key = document.get_key(self.prefix)
+        try:
+            if not self.force and key in self.existing:
+                digest, size = self.get_digest(document)
+                if digest == self.existing[key]:
+                    LOGGER.info("s3://%s/%s is unchanged", self.bucket, key)
+                    return PublishResult(
+                        document=document.path,
+                        error=None,
+                        key=key,
+                        size=size,
+                        uploaded=False,
+                    )
+            size = document.publish(self.client, bucket=self.bucket, prefix=self.prefix)
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.error("failed to publish %s: %s", document.path, exc)
+            return PublishResult(
+                document=document.path, error=str(exc), key=key, size=0, uploaded=False
+            )
+        return PublishResult(
+            document=document.path, error=None, key=key, size=size, uploaded=True
+        )
+
+
+class SsmPublisher:
+    """Publish many documents directly to SSM concurrently.
+
+    Documents are created or updated by a pool of threads that share a single
+    client. Results are handled in the order the documents were provided.
+
+    Unless ``force`` is used, each SSM Document is described first. A document
+    whose SHA-256 digest matches the hash of the default version of its SSM
+    Document is not updated. When a document is updated, the new version is
+    made the default version.
+
+    The SSM Documents API is heavily throttled so the client uses the adaptive
+    retry mode of botocore. Once throttled, it backs off and limits the rate
+    at which every thread sends requests.
+
+    """
+
+    def __init__(
+        self,
+        client: SSMClient,
+        *,
+        concurrency: int = 1,
+        force: bool = False,
+        prefix: Optional[str] = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            client: SSM client. Its connection pool should be at least as
+                large as ``concurrency`` (see :meth:`create_client`).
+            concurrency: Number of documents to publish at the same time.
+            force: Update every document, even if its SSM Document is
+                unchanged.
+            prefix: A prefix to prepend to the name of each SSM Document.
+
+        """
+        self.client = client
+        self.concurrency = max(concurrency, 1)
+        self.force = force
+        self.prefix = prefix
+        self.results: List[PublishResult] = []
+
+    @staticmethod
+    def create_client(session: boto3.Session, *, concurrency: int = 1) -> SSMClient:
+        """Create an SSM client that can be shared by every publishing thread.
+
+        Args:
+            session: boto3 session used to create the client.
+            concurrency: Number of threads that will use the client.
+
+        """
+        return session.client(  # type: ignore
+            "ssm",
+            config=Config(
+                max_pool_connections=max(concurrency, 10),
+                retries={"mode": "adaptive", "total_max_attempts": SSM_MAX_ATTEMPTS},
+            ),
+        )
+
+    def publish(self, documents: Iterable[Document]) -> PublishSummary:
+        """Publish documents.
+
+        Args:
+            documents: Documents to publish. This can be a generator so
+                publishing can start before all documents have been found.
+
+        """
+        start = time.perf_counter()
+        self.results.extend(
+            cast(PublishResult, result)
+            for _, result in imap_ordered(
+                ThreadPoolExecutor,
+                self.publish_document,
+                documents,
+                self.concurrency,
+                thread_name_prefix="ssm-dox-publish",
+            )
+        )
+        uploaded = [r for r in self.results if r.uploaded]
+        return PublishSummary(
+            deleted=0,
+            failed=sum(1 for r in self.results if r.error),
+            published=len(uploaded),
+            seconds=time.perf_counter() - start,
+            size=sum(r.size for r in uploaded),
+            unchanged=sum(1 for r in self.results if not (r.error or r.uploaded)),
+        )
+
+    def describe_document(
+        self, name: str, version: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Describe an SSM Document.
+
+        Args:
+            name: Name of the SSM Document.
+            version: Version to describe. If not provided, the default version
+                is described.
+
+        Returns:
+            Description of the SSM Document or ``None`` if it does not exist.
+
+        """
+        kwargs = {"Name": name}
+        if version:
+            kwargs["DocumentVersion"] = version
+        try:
+            return cast(
+                Dict[str, Any], self.client.describe_document(**kwargs)["Document"]
+            )
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") == "InvalidDocument":
+                return None
+            raise
+
+    def find_version(self, name: str, digest: str, latest: str) -> Optional[str]:
+        """Find the version of an SSM Document with matching content.
+
+        Versions are described from newest to oldest. Each one is a separate,
+        heavily throttled API call so only the newest
+        :data:`SSM_FIND_VERSION_LIMIT` versions are searched.
+
+        Args:
+            name: Name of the SSM Document.
+            digest: SHA-256 digest of the content.
+            latest: Latest version of the SSM Document.
+
+        """
+        oldest = max(int(latest) - SSM_FIND_VERSION_LIMIT, 0)
+        for version in range(int(latest), oldest, -1):
+            description = self.describe_document(name, str(version))
+            if description and description.get("Hash") == digest:
+                return str(version)
+        return None
+
+    def publish_document(self, document: Document) -> PublishResult:
+        """Publish a single document, capturing any error that occurs.
+
+        Args:
+            document: The document to publish.
+
+        """
+        name = document.get_name(self.prefix)
+        try:
+            data = document.body
+            body = data.decode()
+            digest = hashlib.sha256(data).hexdigest()
+            current = self.describe_document(name)
+            if current is None:
+                self.client.create_document(
+                    Content=body,
+                    DocumentFormat="JSON",
+                    DocumentType="Command",
+                    Name=name,
+                )
+                LOGGER.success("created SSM Document %s", name)
+            elif not self.force and current.get("Hash") == digest:
+                LOGGER.info("SSM Document %s is unchanged", name)
+                return PublishResult(
+                    document=document.path,
+                    error=None,
+                    key=name,
+                    size=len(data),
+                    uploaded=False,
+                )
+            else:
+                version = self._update_document(
+                    name, body, digest, current["LatestVersion"]
+                )
+                if version != current.get("DefaultVersion"):
+                    self.client.update_document_default_version(
+                        DocumentVersion=version, Name=name
+                    )
+                LOGGER.success("updated SSM Document %s to version %s", name, version)
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.error("failed to publish %s: %s", document.path, exc)
+            return PublishResult(
+                document=document.path, error=str(exc), key=name, size=0, uploaded=False
+            )
+        return PublishResult(
+            document=document.path, error=None, key=name, size=len(data), uploaded=True
+        )
+
+    def _update_document(self, name: str, body: str, digest: str, latest: str) -> str:
+        """Create a new version of an SSM Document.
+
+        If a version with the same content already exists, it is used instead.
+
+        Args:
+            name: Name of the SSM Document.
+            body: Content of the new version.
+            digest: SHA-256 digest of the content.
+            latest: Latest version of the SSM Document.
+
+        Returns:
+            The version containing the content.
+
+        """
+        try:
+            response = self.client.update_document(
+                Content=body,
+                DocumentFormat="JSON",
+                DocumentVersion="$LATEST",
+                Name=name,
+            )
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") != "DuplicateDocumentContent":
+                raise
+            version = self.find_version(name, digest, latest)
+            if not version:  # cov: ignore
+                raise
+            return version
+        return response["DocumentDescription"]["DocumentVersion"]
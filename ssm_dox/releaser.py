@@ -0,0 +1,124 @@
+"""Build Dox and publish their documents in a single streaming pipeline."""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Full, Queue
+from typing import TYPE_CHECKING, Iterable, List, NamedTuple, Optional, cast
+
+from .document import Document
+
+if TYPE_CHECKING:
+    from ._logging import CustomLogger
+    from .builder import Builder, BuildResult, BuildSummary
+    from .dox import Dox
+    from .publisher import Publisher, PublishSummary
+
+LOGGER = cast("CustomLogger", logging.getLogger(__name__))
+
+
+class ReleaseSummary(NamedTuple):
+    """Summary of releasing many Dox."""
+
+    build: BuildSummary
+    publish: PublishSummary
+
+
+class Releaser:
+    """Build Dox and publish their documents in a single streaming pipeline.
+
+    Dox are built by a :class:`~ssm_dox.builder.Builder` while the documents
+    that have already been built are published by a
+    :class:`~ssm_dox.publisher.Publisher` in another thread. Each document is
+    serialized once when it is built and the same bytes are written to disk
+    and uploaded. Built documents are passed between the two stages through
+    a bounded queue so building waits for publishing to catch up.
+
+    Documents of Dox that fail to build are not published and their objects
+    are never deleted.
+
+    """
+
+    def __init__(
+        self, builder: Builder, publisher: Publisher, *, queue_size: int = 0
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            builder: Used to build Dox. It is configured to include the
+                serialized document in each result.
+            publisher: Used to publish the built documents.
+            queue_size: Maximum number of built documents waiting to be
+                published. If ``0``, twice the concurrency of the publisher
+                is used.
+
+        """
+        builder.body = True
+        self.builder = builder
+        self.publisher = publisher
+        self.queue_size = queue_size or publisher.concurrency * 2
+        self._future: Optional[Future[PublishSummary]] = None
+        self._queue: Queue[Optional[Document]] = Queue(maxsize=self.queue_size)
+        self._skipped: List[Document] = []
+
+    def release(self, dox: Iterable[Dox]) -> ReleaseSummary:
+        """Build Dox and publish their documents.
+
+        Args:
+            dox: Dox to release. This can be a generator so building can start
+                before all Dox have been found.
+
+        """
+        self._skipped = []
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ssm-dox-release"
+        ) as executor:
+            self._future = executor.submit(
+                self.publisher.publish,
+                iter(self._queue.get, None),
+                skipped=self._skipped,
+            )
+            try:
+                build = self.builder.build(dox, callback=self._handle)
+            finally:
+                self._put(None)
+            return ReleaseSummary(build=build, publish=self._future.result())
+
+    def _handle(self, dox: Dox, result: Optional[BuildResult]) -> None:
+        """Queue the document of a Dox that was built to be published.
+
+        Args:
+            dox: The Dox that was built.
+            result: Result of building the Dox. ``None`` if it was skipped
+                because its document is current, in which case the document
+                is read from disk when it is published.
+
+        """
+        output_dir = self.builder.output_dir
+        document = Document(path=dox.get_document_path(output_dir), root_dir=output_dir)
+        if result and result.error:
+            self._skipped.append(document)
+            return
+        if result and result.body is not None:
+            document.body = result.body
+        self._put(document)
+
+    def _put(self, document: Optional[Document]) -> None:
+        """Put a document in the queue, waiting while it is full.
+
+        Args:
+            document: Document to publish or ``None`` to signal that there are
+                no more documents.
+
+        Raises:
+            Exception: Publishing stopped because of an error.
+
+        """
+        while True:
+            try:
+                self._queue.put(document, timeout=0.1)
+                return
+            except Full:
+                if self._future and self._future.done():
+                    self._future.result()  # raise the error that stopped it
+                    return
@@ -0,0 +1,66 @@
+"""Select the Dox affected by changes to files."""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Iterable, Iterator, List, cast
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ._logging import CustomLogger
+    from .cache.dependencies import DependencyGraph
+    from .dox import Dox
+
+LOGGER = cast("CustomLogger", logging.getLogger(__name__))
+
+
+class DoxSelector:
+    """Select the Dox affected by changes to files.
+
+    Which files a Dox includes is read from a
+    :class:`~ssm_dox.cache.dependencies.DependencyGraph` so Dox that are not
+    selected never need to be loaded.
+
+    """
+
+    def __init__(self, changed: Iterable[Path], graph: DependencyGraph) -> None:
+        """Instantiate class.
+
+        Args:
+            changed: Paths to files or directories that changed. They are
+                resolved so they match the paths of included files recorded
+                in ``graph``.
+            graph: Files included by each Dox.
+
+        """
+        self.changed = sorted({path.resolve() for path in changed})
+        self.graph = graph
+        self.selected: List[Dox] = []
+        self.skipped: List[Dox] = []
+
+    def select(self, dox: Iterable[Dox]) -> Iterator[Dox]:
+        """Iterate over the Dox that are affected by the changed paths.
+
+        Args:
+            dox: Dox to select from. This can be a generator so processing
+                can start before all Dox have been found.
+
+        """
+        for item in dox:
+            if self.graph.is_affected(item.template, self.changed):
+                self.selected.append(item)
+                yield item
+            else:
+                LOGGER.debug("%s is not affected by the changed paths", item.name)
+                self.skipped.append(item)
+
+    def log(self) -> None:
+        """Log the Dox that were skipped."""
+        LOGGER.info(
+            "selected %s dox affected by %s changed path(s); skipped %s dox",
+            len(self.selected),
+            len(self.changed),
+            len(self.skipped),
+        )
+        for item in self.skipped:
+            LOGGER.info("skipped %s (not affected)", item.name)
@@ -0,0 +1,217 @@
+"""Serialize data models to the JSON written to built documents.
+
+Every serializer produces the same bytes as
+``model.json(exclude_none=True, indent=4)`` so that documents built with one
+serializer are never reported as drifted when checked with another.
+
+"""
+from __future__ import annotations
+
+import logging
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Type, cast
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # cov: ignore
+    orjson = None  # type: ignore
+
+if TYPE_CHECKING:
+    from ._logging import CustomLogger
+
+LOGGER = cast("CustomLogger", logging.getLogger(__name__))
+
+_CONTAINERS = (dict, list, tuple)
+
+_DEL = b"\x7f"
+"""DEL is ASCII but the standard library escapes it where orjson does not.
+
+orjson escapes every other control character the same way as the standard
+library so its output is only checked for DEL and non-ASCII characters.
+
+"""
+
+
+class JsonSerializer:
+    """Serialize data models using the standard library."""
+
+    name = "json"
+
+    def dumps(self, model: BaseModel) -> bytes:
+        """Serialize a data model.
+
+        Args:
+            model: Data model to serialize. Fields whose value is ``None``
+                are excluded.
+
+        """
+        return model.json(exclude_none=True, indent=4).encode()
+
+
+class OrjsonSerializer(JsonSerializer):
+    """Serialize data models using orjson.
+
+    orjson only supports an indent of 2 spaces, does not escape non-ASCII
+    characters, and formats some floats differently than the standard
+    library. Its output is re-indented to 4 spaces and data models containing
+    non-ASCII characters, DEL, floats, or anything else orjson can't serialize
+    the same way are serialized by :class:`JsonSerializer` instead.
+
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Instantiate class.
+
+        Raises:
+            ImportError: orjson is not installed.
+
+        """
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def dumps(self, model: BaseModel) -> bytes:
+        """Serialize a data model.
+
+        Args:
+            model: Data model to serialize. Fields whose value is ``None``
+                are excluded.
+
+        """
+        try:
+            data = orjson.dumps(
+                model,
+                default=self._get_default(model.__json_encoder__),
+                option=orjson.OPT_INDENT_2,
+            )
+        except TypeError as exc:
+            LOGGER.debug("falling back to json serializer: %s", exc)
+            return super().dumps(model)
+        if not data.isascii() or _DEL in data:
+            return super().dumps(model)
+        return self.reindent(data)
+
+    @staticmethod
+    def reindent(data: bytes) -> bytes:
+        """Change the indent of JSON from 2 spaces to 4 spaces.
+
+        Raw newlines can only appear in JSON between values so any spaces
+        following one are indentation. Lines are re-indented from the deepest
+        level up, marking the lines that are done so that they do not match
+        the indentation of a shallower level.
+
+        Args:
+            data: JSON indented with 2 spaces.
+
+        """
+        depth = 0
+        while b"\n" + b"  " * (depth + 1) in data:
+            depth += 1
+        for level in range(depth, 0, -1):
+            data = data.replace(b"\n" + b"  " * level, b"\n" + b"\0" * level)
+        return data.replace(b"\0", b"    ")
+
+    @classmethod
+    def _get_default(cls, encoder: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        """Get the function orjson calls for objects it can't serialize.
+
+        Args:
+            encoder: JSON encoder of the data model being serialized.
+
+        """
+
+        def _default(obj: Any) -> Any:
+            if isinstance(obj, BaseModel):
+                result: Any = {k: v for k, v in obj.__dict__.items() if v is not None}
+                cls._check_values(result.values())
+            else:
+                result = encoder(obj)
+                cls._check_values([result])
+            return result
+
+        return _default
+
+    @classmethod
+    def _check_values(cls, values: Iterable[Any]) -> None:
+        """Check that orjson serializes values the same as the standard library.
+
+        Data models are not checked here since they are passed to the default
+        function when they are serialized.
+
+        Args:
+            values: Values to check, including any values they contain.
+
+        Raises:
+            TypeError: A value can't be serialized the same way.
+
+        """
+        values = list(values)
+        types = set(map(type, values))
+        if float in types:
+            raise TypeError("floats are formatted differently")
+        if types.intersection(_CONTAINERS):
+            for value in values:
+                if isinstance(value, dict):
+                    cls._check_values(value.values())
+                elif isinstance(value, (list, tuple)):
+                    cls._check_values(value)
+
+
+SERIALIZERS: Dict[str, Type[JsonSerializer]] = {
+    JsonSerializer.name: JsonSerializer,
+    OrjsonSerializer.name: OrjsonSerializer,
+}
+
+
+def get_serializer(name: Optional[str] = None) -> JsonSerializer:
+    """Get a serializer.
+
+    Args:
+        name: Name of the serializer. If not provided, the value of the
+            ``SSM_DOX_SERIALIZER`` environment variable is used. Otherwise,
+            the fastest serializer that is installed is used.
+
+    Raises:
+        ValueError: The serializer does not exist or is not installed.
+
+    """
+    name = name or os.getenv("SSM_DOX_SERIALIZER")
+    if not name:
+        return OrjsonSerializer() if orjson else JsonSerializer()
+    if name not in SERIALIZERS:
+        raise ValueError(
+            f"unknown serializer {name}; expected one of {', '.join(SERIALIZERS)}"
+        )
+    try:
+        return SERIALIZERS[name]()
+    except ImportError as exc:
+        raise ValueError(f"serializer {name} is not available: {exc}") from exc
+
+
+@lru_cache(maxsize=None)
+def get_default_serializer() -> JsonSerializer:
+    """Get the default serializer.
+
+    It is only resolved the first time it is needed so that an invalid
+    ``SSM_DOX_SERIALIZER`` environment variable does not prevent importing
+    this module.
+
+    Raises:
+        ValueError: The serializer does not exist or is not installed.
+
+    """
+    return get_serializer()
+
+
+def serialize(model: BaseModel) -> bytes:
+    """Serialize a data model using the default serializer.
+
+    Args:
+        model: Data model to serialize.
+
+    """
+    return get_default_serializer().dumps(model)
@@ -0,0 +1,93 @@
+"""Utilities."""
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+import tempfile
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@lru_cache(maxsize=4096)
+def _digest_file(
+    path: str, mtime_ns: int, size: int  # pylint: disable=unused-argument
+) -> str:
+    """Calculate the SHA-256 digest of a file once per process.
+
+    Args:
+        path: Resolved path to the file.
+        mtime_ns: mtime of the file so it is read again if it changes.
+        size: Size of the file so it is read again if it changes.
+
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def digest_file(path: Path) -> str:
+    """Calculate the SHA-256 digest of a file.
+
+    The digest is reused until the mtime or size of the file changes so that
+    a script included by many Dox is only read once per process.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Hex encoded digest.
+
+    """
+    resolved = path.resolve()
+    file_stat = os.stat(resolved)
+    return _digest_file(str(resolved), file_stat.st_mtime_ns, file_stat.st_size)
+
+
+@lru_cache(maxsize=None)
+def _get_umask() -> int:
+    """Get the umask of the process.
+
+    It can only be read by setting it so it is only read once instead of
+    changing it while other threads might be creating files.
+
+    """
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write data to a file atomically.
+
+    The data is written to a temporary file in the same directory that is then
+    moved into place so readers never see a partially written file. The file
+    keeps the mode of the file it replaces or, if there is none, gets the
+    mode a new file would get from the umask.
+
+    Args:
+        path: Path to the file that will be written.
+        data: Data to write to the file.
+
+    """
+    path.parent.mkdir(exist_ok=True, parents=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_get_umask()
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
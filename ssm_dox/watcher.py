@@ -0,0 +1,426 @@
+"""Watch Dox for changes and rebuild the affected documents."""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+from .builder import build_dox
+from .finder import Finder
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ._logging import CustomLogger
+    from .cache.discovery import DiscoveryIndex
+    from .cache.templates import TemplateCache
+    from .dox import Dox
+
+LOGGER = cast("CustomLogger", logging.getLogger(__name__))
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_INOTIFY_MASK = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_ONLYDIR
+)
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    """Detect changes to the files in directories by periodically listing them."""
+
+    def __init__(self, *, interval: float = 0.5) -> None:
+        """Instantiate class.
+
+        Args:
+            interval: Seconds between each time the directories are listed.
+
+        """
+        self.directories: List[Path] = []
+        self.interval = interval
+        self._snapshot: Dict[Path, Tuple[int, int]] = {}
+
+    def close(self) -> None:
+        """Stop watching."""
+        self.directories = []
+        self._snapshot = {}
+
+    def read(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Wait for changes.
+
+        Args:
+            timeout: Maximum number of seconds to wait. If ``None``, wait until
+                a change is detected.
+
+        Returns:
+            Paths that were created, modified, or deleted.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._take_snapshot()
+            changed = {
+                path
+                for path in {*snapshot, *self._snapshot}
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changed:
+                return changed
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return set()
+            time.sleep(
+                self.interval if remaining is None else min(self.interval, remaining)
+            )
+
+    def watch(self, directories: Iterable[Path]) -> None:
+        """Set the directories being watched.
+
+        Changes are detected relative to when this is called.
+
+        Args:
+            directories: Absolute paths to the directories to watch. They are
+                not watched recursively.
+
+        """
+        self.directories = sorted(set(directories))
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        """Get the mtime and size of each file in the watched directories.
+
+        Only the presence of subdirectories is tracked since their own
+        directory is watched if their contents are of interest.
+
+        """
+        result: Dict[Path, Tuple[int, int]] = {}
+        for directory in self.directories:
+            try:
+                with os.scandir(directory) as scan:
+                    for entry in scan:
+                        if entry.is_dir():
+                            result[directory / entry.name] = (0, 0)
+                            continue
+                        try:
+                            stat = entry.stat()
+                        except FileNotFoundError:  # cov: ignore
+                            continue
+                        result[directory / entry.name] = (
+                            stat.st_mtime_ns,
+                            stat.st_size,
+                        )
+            except (FileNotFoundError, NotADirectoryError):
+                result[directory] = (-1, -1)
+        return result
+
+
+class InotifyWatcher:
+    """Detect changes to the files in directories using Linux's inotify API."""
+
+    def __init__(self) -> None:
+        """Instantiate class.
+
+        Raises:
+            OSError: inotify is not available.
+
+        """
+        self._libc = _load_libc()
+        self._fd: int = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watches: Dict[int, Path] = {}
+
+    @property
+    def directories(self) -> List[Path]:
+        """Directories being watched."""
+        return sorted(self._watches.values())
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._watches = {}
+
+    def read(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Wait for changes.
+
+        Args:
+            timeout: Maximum number of seconds to wait. If ``None``, wait until
+                a change is detected.
+
+        Returns:
+            Paths that were created, modified, or deleted. If events were
+            lost, the watched directories themselves are returned.
+
+        """
+        changed: Set[Path] = set()
+        while not changed:
+            ready, _, _ = select.select([self._fd], [], [], timeout)
+            if not ready:
+                return changed
+            changed = self._read_events()
+        return changed
+
+    def watch(self, directories: Iterable[Path]) -> None:
+        """Set the directories being watched.
+
+        Args:
+            directories: Absolute paths to the directories to watch. They are
+                not watched recursively.
+
+        """
+        wanted = set(directories)
+        for wd, path in list(self._watches.items()):
+            if path not in wanted:
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._watches[wd]
+        for path in wanted.difference(self._watches.values()):
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(path), _INOTIFY_MASK
+            )
+            if wd < 0:
+                LOGGER.debug(
+                    "unable to watch %s: %s", path, os.strerror(ctypes.get_errno())
+                )
+                continue
+            self._watches[wd] = path
+
+    def _read_events(self) -> Set[Path]:
+        """Read the events that are available without blocking."""
+        changed: Set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+                offset += _INOTIFY_EVENT.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    LOGGER.debug("inotify queue overflowed")
+                    changed.update(self._watches.values())
+                    continue
+                directory = self._watches.get(wd)
+                if directory is None:
+                    continue
+                if mask & _IN_IGNORED:
+                    del self._watches[wd]
+                changed.add(directory / os.fsdecode(name) if name else directory)
+
+
+Watcher = Union[InotifyWatcher, PollingWatcher]
+
+
+def _load_libc() -> ctypes.CDLL:
+    """Load the C library, ensuring it provides the inotify API.
+
+    Raises:
+        OSError: inotify is not available.
+
+    """
+    if not sys.platform.startswith("linux"):
+        raise OSError(f"inotify is not available on {sys.platform}")
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    if not hasattr(libc, "inotify_init1"):  # cov: ignore
+        raise OSError("inotify is not available")
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+def get_watcher(*, polling: bool = False, interval: float = 0.5) -> Watcher:
+    """Get the best available watcher.
+
+    Args:
+        polling: Always use a :class:`PollingWatcher`.
+        interval: Seconds between each poll when polling.
+
+    """
+    if not polling:
+        try:
+            return InotifyWatcher()
+        except OSError as exc:
+            LOGGER.debug("falling back to polling: %s", exc)
+    return PollingWatcher(interval=interval)
+
+
+class DoxWatcher:
+    """Watch Dox for changes and rebuild the affected documents.
+
+    Every Dox found is kept in memory along with its loaded content so that
+    only the Dox whose template or included files change are loaded and built
+    again. Changes to any other files cause the directory tree to be scanned
+    again to find Dox that were added or removed.
+
+    """
+
+    def __init__(
+        self,
+        root_dir: Path,
+        output_dir: Path,
+        *,
+        debounce: float = 0.1,
+        index: Optional[DiscoveryIndex] = None,
+        template_cache: Optional[TemplateCache] = None,
+        watcher: Optional[Watcher] = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            root_dir: The root directory containing Dox.
+            output_dir: Path where built documents will be saved.
+            debounce: Seconds to wait for more changes after one is detected
+                before rebuilding. Editors often write several times when
+                saving a single file.
+            index: Persistent index used to scan the directory tree.
+            template_cache: Cache used by Dox to load their content.
+            watcher: Used to detect changes.
+
+        """
+        self.debounce = debounce
+        self.dox: Dict[Path, Dox] = {}
+        self.index = index
+        self.output_dir = output_dir
+        self.root = root_dir.absolute()
+        self.template_cache = template_cache
+        self.watcher = watcher or get_watcher()
+        self._directories: List[Path] = []
+
+    @property
+    def dependencies(self) -> Dict[Path, List[Dox]]:
+        """Dox keyed by each file they are built from."""
+        result: Dict[Path, List[Dox]] = {}
+        for dox in self.dox.values():
+            for path in dox.dependencies:
+                result.setdefault(path, []).append(dox)
+        return result
+
+    def build(self, dox: Iterable[Dox]) -> int:
+        """Build Dox, loading their content again.
+
+        Args:
+            dox: Dox to build.
+
+        Returns:
+            Number of Dox that failed to build.
+
+        """
+        failed = 0
+        for item in dox:
+            item.reload()
+            if build_dox(item, self.output_dir).error:
+                failed += 1
+        return failed
+
+    def handle(self, changed: Set[Path]) -> List[Dox]:
+        """Rebuild the Dox affected by changes.
+
+        Args:
+            changed: Absolute paths that were created, modified, or deleted.
+
+        Returns:
+            Dox that were built.
+
+        """
+        start = time.perf_counter()
+        dependencies = self.dependencies
+        affected: Dict[Path, Dox] = {}
+        for path in sorted(changed):
+            for dox in dependencies.get(path, []):
+                affected[dox.template] = dox
+        if changed.difference(dependencies) or not all(p.exists() for p in changed):
+            for dox in self.scan():
+                affected[dox.template] = dox
+        to_build = [d for t, d in affected.items() if t in self.dox]
+        if to_build:
+            self.build(to_build)
+            LOGGER.success(
+                "rebuilt %s dox in %.0fms",
+                len(to_build),
+                (time.perf_counter() - start) * 1000,
+            )
+        self.watch()
+        return to_build
+
+    def run(self, *, iterations: Optional[int] = None) -> None:
+        """Build every Dox then rebuild them as they change.
+
+        Args:
+            iterations: Stop after handling this many batches of changes.
+                If ``None``, run until interrupted.
+
+        """
+        self.build(self.scan())
+        self.watch()
+        LOGGER.info("watching %s for changes...", self.root)
+        count = 0
+        try:
+            while iterations is None or count < iterations:
+                changed = self.watcher.read()
+                while True:
+                    more = self.watcher.read(self.debounce)
+                    if not more:
+                        break
+                    changed.update(more)
+                LOGGER.debug("detected %s change(s)", len(changed))
+                self.handle(changed)
+                count += 1
+        finally:
+            self.watcher.close()
+
+    def scan(self) -> List[Dox]:
+        """Scan the root directory for Dox that were added or removed.
+
+        Returns:
+            Dox that were added.
+
+        """
+        finder = Finder(self.root, index=self.index, template_cache=self.template_cache)
+        found = {dox.template: dox for dox in finder.iter_dox()}
+        for template in set(self.dox).difference(found):
+            LOGGER.info("%s was removed", self.dox.pop(template).name)
+        added = [dox for template, dox in found.items() if template not in self.dox]
+        self.dox.update((dox.template, dox) for dox in added)
+        self._directories = [self.root, *finder.scan.directories]
+        return added
+
+    def watch(self) -> None:
+        """Update the directories being watched."""
+        directories = set(self._directories)
+        directories.update(path.parent for path in self.dependencies)
+        self.watcher.watch(directories)
@@ -0,0 +1,64 @@
+"""Pytest configuration, fixtures, and plugins."""
+# pylint: disable=redefined-outer-name
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+import pytest
+
+if TYPE_CHECKING:
+    from _pytest.config import Config
+
+LOGGER = logging.getLogger(__name__)
+
+
+# pylint: disable=unused-argument
+def pytest_ignore_collect(path: Any, config: Config) -> bool:
+    """Determine if this directory should have its tests collected.
+
+    Benchmarks are only collected when explicitly requested.
+
+    """
+    return not config.option.benchmark
+
+
+def best_of(func: Callable[[], Any], *, number: int = 1, repeat: int = 5) -> float:
+    """Return the fastest time, in seconds, to run a function ``number`` times."""
+    result = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        result = min(result, time.perf_counter() - start)
+    return result
+
+
+@pytest.fixture
+def benchmark(capsys: pytest.CaptureFixture[str]) -> Callable[..., float]:
+    """Compare the time taken by a baseline and a candidate function.
+
+    The timings are printed so they are visible when running benchmarks.
+
+    """
+
+    def _benchmark(
+        name: str,
+        baseline: Callable[[], Any],
+        candidate: Callable[[], Any],
+        *,
+        number: int = 1,
+        repeat: int = 5,
+    ) -> float:
+        baseline_time = best_of(baseline, number=number, repeat=repeat)
+        candidate_time = best_of(candidate, number=number, repeat=repeat)
+        speedup = baseline_time / candidate_time
+        with capsys.disabled():
+            print(
+                f"\n{name}: baseline {baseline_time * 1000:.2f}ms, "
+                f"candidate {candidate_time * 1000:.2f}ms ({speedup:.1f}x)"
+            )
+        return speedup
+
+    return _benchmark
@@ -0,0 +1,66 @@
+"""Benchmark ssm_dox.dox."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Type
+
+import pytest
+import yaml
+
+from ssm_dox.dox import Dox, DoxLoader, PyDoxLoader
+from ssm_dox.models.document import SsmDocumentDataModel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+STEP = """
+  - action: aws:runShellScript
+    name: step{index}
+    precondition: !LinuxOnly
+    inputs:
+      timeoutSeconds: 3600
+      workingDirectory: /tmp
+      runCommand: !IncludeScript script.sh
+"""
+
+
+@pytest.fixture
+def template(tmp_path: Path) -> Path:
+    """Large Dox template."""
+    path = tmp_path / "template.yml"
+    path.write_text(
+        'schemaVersion: "2.2"\ndescription: benchmark\nmainSteps:'
+        + "".join(STEP.format(index=i) for i in range(200))
+    )
+    (tmp_path / "script.sh").write_text("#!/bin/bash\necho 'hello world'\n")
+    return path
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="requires libyaml")
+def test_dox_loader(benchmark: Callable[..., float], template: Path) -> None:
+    """Benchmark DoxLoader using libyaml against the pure Python loader."""
+
+    def load(loader_class: Type[Any]) -> Callable[[], Any]:
+        def _load() -> Any:
+            with open(template, "r", encoding="UTF-8") as f:
+                return yaml.load(f, Loader=loader_class)
+
+        return _load
+
+    assert benchmark("DoxLoader", load(PyDoxLoader), load(DoxLoader)) > 1
+
+
+def test_check(benchmark: Callable[..., float], template: Path) -> None:
+    """Benchmark checking an unchanged document against comparing models."""
+    dox = Dox(path=template.parent, root_dir=template.parent)
+    output_dir = template.parent / "output"
+    document_path = dox.build(output_dir)
+
+    def compare_models() -> None:
+        assert dox.content == SsmDocumentDataModel.parse_raw(document_path.read_bytes())
+
+    def check() -> None:
+        dox.content = dox.content  # serialize the content again
+        dox.check(output_dir)
+
+    assert benchmark("Dox.check", compare_models, check) > 1
@@ -0,0 +1,120 @@
+"""Benchmark ssm_dox.models."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Type, Union
+
+import pytest
+from pydantic import create_model
+
+from ssm_dox.models.base import BaseModel
+from ssm_dox.models.document import SsmDocumentDataModel
+from ssm_dox.models.main_steps import MAIN_STEP_TYPES
+from ssm_dox.models.main_steps.base import SsmDocumentMainStep
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+@pytest.fixture
+def data() -> Dict[str, Any]:
+    """Data of a large document with embedded scripts."""
+    script = ["#!/bin/bash", *(f"echo 'line {i}'" for i in range(100))]
+    return {
+        "description": "benchmark",
+        "mainSteps": [
+            {
+                "action": "aws:runShellScript",
+                "name": f"step{index}",
+                "precondition": {"StringEquals": ["platformType", "Linux"]},
+                "inputs": {
+                    "runCommand": script,
+                    "timeoutSeconds": 3600,
+                    "workingDirectory": "/tmp",
+                },
+            }
+            for index in range(200)
+        ],
+    }
+
+
+def test_eq(benchmark: Callable[..., float], data: Dict[str, Any]) -> None:
+    """Benchmark comparing documents repeatedly against comparing dicts."""
+    first = SsmDocumentDataModel.parse_obj(data)
+    data["mainSteps"][-1]["name"] = "changed"
+    second = SsmDocumentDataModel.parse_obj(data)
+
+    def compare_dicts() -> None:
+        assert first.dict() != second.dict()
+
+    def compare() -> None:
+        assert first != second
+
+    assert benchmark("BaseModel.__eq__", compare_dicts, compare, number=10) > 1
+
+
+def test_bool(benchmark: Callable[..., float], data: Dict[str, Any]) -> None:
+    """Benchmark the truthiness of a document against creating a dict."""
+    document = SsmDocumentDataModel.parse_obj(data)
+
+    def create_dict() -> None:
+        assert document.dict(
+            exclude_defaults=True, exclude_none=True, exclude_unset=True
+        )
+
+    def truthiness() -> None:
+        assert document
+
+    assert benchmark("BaseModel.__bool__", create_dict, truthiness, number=10) > 1
+
+
+def test_main_step_dispatch(
+    benchmark: Callable[..., float], data: Dict[str, Any], monkeypatch: MonkeyPatch
+) -> None:
+    """Benchmark dispatching mainSteps on their action against a Union.
+
+    mainSteps use the last of 20 step types so a Union tries every other type
+    first. Dispatching should cost the same as it does with the 2 built-in
+    step types.
+
+    """
+    builtin = dict(MAIN_STEP_TYPES)
+    for index in range(18):
+        action = f"test:step{index}"
+        monkeypatch.setitem(
+            MAIN_STEP_TYPES,
+            action,
+            create_model(
+                f"Step{index}",
+                __base__=SsmDocumentMainStep,
+                action=(Literal[action], ...),  # type: ignore
+            ),
+        )
+    types: List[Type[SsmDocumentMainStep]] = [
+        *[t for a, t in MAIN_STEP_TYPES.items() if a not in builtin],
+        *builtin.values(),
+    ]
+    data["mainSteps"] = [
+        {**step, "action": "aws:runShellScript"} for step in data["mainSteps"]
+    ]
+    union_model = create_model(
+        "UnionDocument",
+        __base__=BaseModel,
+        mainSteps=(List[Union[tuple(types)]], ...),  # type: ignore
+    )
+    assert isinstance(union_model.parse_obj(data), BaseModel)
+
+    def validate_union() -> None:
+        union_model.parse_obj(data)
+
+    def validate() -> None:
+        SsmDocumentDataModel.parse_obj(data)
+
+    assert benchmark("AnyMainStep (20 types)", validate_union, validate) > 1
+
+    def validate_builtin() -> None:
+        with monkeypatch.context() as ctx:
+            for action in set(MAIN_STEP_TYPES).difference(builtin):
+                ctx.delitem(MAIN_STEP_TYPES, action)
+            SsmDocumentDataModel.parse_obj(data)
+
+    assert benchmark("AnyMainStep (2 vs 20 types)", validate_builtin, validate) > 0.8
@@ -0,0 +1,51 @@
+"""Benchmark ssm_dox.serializer."""
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from ssm_dox.models.document import SsmDocumentDataModel
+from ssm_dox.serializer import JsonSerializer, OrjsonSerializer, orjson
+
+
+@pytest.fixture
+def document() -> SsmDocumentDataModel:
+    """Large document with embedded scripts."""
+    script = ["#!/bin/bash", *(f"echo 'line {i}'" for i in range(100))]
+    return SsmDocumentDataModel.parse_obj(
+        {
+            "description": "benchmark",
+            "mainSteps": [
+                {
+                    "action": "aws:runShellScript",
+                    "name": f"step{index}",
+                    "precondition": {"StringEquals": ["platformType", "Linux"]},
+                    "inputs": {
+                        "runCommand": script,
+                        "timeoutSeconds": 3600,
+                        "workingDirectory": "/tmp",
+                    },
+                }
+                for index in range(200)
+            ],
+        }
+    )
+
+
+@pytest.mark.skipif(not orjson, reason="requires orjson")
+def test_orjson_serializer(
+    benchmark: Callable[..., float], document: SsmDocumentDataModel
+) -> None:
+    """Benchmark OrjsonSerializer against the standard library."""
+    baseline = JsonSerializer()
+    candidate = OrjsonSerializer()
+    assert candidate.dumps(document) == baseline.dumps(document)
+    assert (
+        benchmark(
+            "OrjsonSerializer",
+            lambda: baseline.dumps(document),
+            lambda: candidate.dumps(document),
+        )
+        > 1
+    )
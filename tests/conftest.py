@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from _pytest.tmpdir import TempPathFactory
+
 
 def pytest_addoption(parser):  # type: ignore
     """Add pytest CLI options."""
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="run only benchmarks",
+    )
     parser.addoption(
         "--functional",
         action="store_true",
@@ -29,6 +40,25 @@ def pytest_addoption(parser):  # type: ignore
     )
 
 
+@pytest.fixture(autouse=True)
+def cwd(monkeypatch: MonkeyPatch, tmp_path_factory: TempPathFactory) -> Path:
+    """Change the working directory to an empty temporary directory.
+
+    Caches are stored in the working directory by default so this keeps tests
+    from sharing cache files with each other or writing them to the repository.
+
+    """
+    result = tmp_path_factory.mktemp("cwd")
+    monkeypatch.chdir(result)
+    return result
+
+
+@pytest.fixture(scope="session")
+def benchmarks_dir(tests_dir: Path) -> Path:
+    """Return a path object to the benchmarks directory."""
+    return tests_dir / "benchmarks"
+
+
 @pytest.fixture(scope="session")
 def integration_tests_dir(tests_dir: Path) -> Path:
     """Return a path object to the integration tests directory."""
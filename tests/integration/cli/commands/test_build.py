@@ -1,22 +1,55 @@
 """Test build command."""
 from __future__ import annotations
 
+import logging
+import shutil
+import subprocess
 from typing import TYPE_CHECKING
 
 from click.testing import CliRunner
+from mock import ANY
 
 from ssm_dox._cli.main import cli
-from ssm_dox.constants import DOCUMENTS_DIR, DOX_DIR
+from ssm_dox._logging import LogLevels
+from ssm_dox.cache import DiscoveryIndex
+from ssm_dox.constants import CACHE_DIR, DOCUMENTS_DIR, DOX_DIR
 from ssm_dox.dox import Dox
 from ssm_dox.finder import Finder
+from ssm_dox.manifest import BuildManifest
+from ssm_dox.serializer import get_default_serializer
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
     from pytest_mock import MockerFixture
 
 MODULE = "ssm_dox._cli.commands._build"
 
+SHARED_TEMPLATE = """
+mainSteps:
+  - action: aws:runShellScript
+    inputs:
+      runCommand: !IncludeScript {script}
+    name: Shared
+"""
+
+
+def write_shared_dox(dox_dir: Path, root: Path) -> None:
+    """Write Dox that include a shared script through relative paths."""
+    (root / "scripts").mkdir(parents=True)
+    (root / "scripts" / "common.sh").write_text("echo common\n")
+    for name, script in [
+        ("A", "../../scripts/common.sh"),
+        ("group/B", "../../../scripts/common.sh"),
+    ]:
+        (root / "dox" / name).mkdir(parents=True)
+        (root / "dox" / name / "template.yml").write_text(
+            SHARED_TEMPLATE.format(script=script)
+        )
+    shutil.copytree(dox_dir / "ExampleLinux", root / "dox" / "C")
+
 
 def test_build(dox_dir: Path, mocker: MockerFixture, tmp_path: Path) -> None:
     """Test build."""
@@ -25,9 +58,12 @@ def test_build(dox_dir: Path, mocker: MockerFixture, tmp_path: Path) -> None:
         f"{MODULE}.Finder", return_value=Finder(root_dir=dox_dir)
     )
     runner = CliRunner()
-    result = runner.invoke(cli, ["build", str(dox_dir), "--output", str(tmp_path)])
-    mock_finder.assert_called_once_with(root_dir=dox_dir)
-    mock_dox_build.assert_called_once_with(tmp_path)
+    result = runner.invoke(
+        cli, ["build", str(dox_dir), "--output", str(tmp_path), "--jobs", "1"]
+    )
+    mock_finder.assert_called_once_with(root_dir=dox_dir, index=ANY, template_cache=ANY)
+    assert isinstance(mock_finder.call_args.kwargs["index"], DiscoveryIndex)
+    mock_dox_build.assert_called_once_with(tmp_path, document=ANY)
     assert result.exit_code == 0
 
 
@@ -38,10 +74,87 @@ def test_build_default(dox_dir: Path, mocker: MockerFixture) -> None:
         f"{MODULE}.Finder", return_value=Finder(root_dir=dox_dir)
     )
     runner = CliRunner()
-    result = runner.invoke(cli, ["build"])
-    mock_finder.assert_called_once_with(root_dir=DOX_DIR)
-    mock_dox_build.assert_called_once_with(DOCUMENTS_DIR)
+    result = runner.invoke(cli, ["build", "--jobs", "1"])
+    mock_finder.assert_called_once_with(root_dir=DOX_DIR, index=ANY, template_cache=ANY)
+    mock_dox_build.assert_called_once_with(DOCUMENTS_DIR, document=ANY)
+    assert result.exit_code == 0
+
+
+def test_build_no_index(dox_dir: Path, mocker: MockerFixture, tmp_path: Path) -> None:
+    """Test build --no-index."""
+    mocker.patch.object(Dox, "build", return_value=None)
+    mock_finder = mocker.patch(
+        f"{MODULE}.Finder", return_value=Finder(root_dir=dox_dir)
+    )
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["build", str(dox_dir), "--output", str(tmp_path), "--no-index", "-j", "1"],
+    )
+    mock_finder.assert_called_once_with(
+        root_dir=dox_dir, index=None, template_cache=ANY
+    )
+    assert result.exit_code == 0
+
+
+def test_build_failed(dox_dir: Path, mocker: MockerFixture, tmp_path: Path) -> None:
+    """Test build exits non-zero when a Dox fails to build."""
+    mocker.patch.object(Dox, "build", side_effect=ValueError("invalid"))
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["build", str(dox_dir), "--output", str(tmp_path), "--jobs", "1"]
+    )
+    assert result.exit_code == 1
+
+
+def test_build_jobs(
+    dox_dir: Path, documents_dir: Path, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test build --jobs."""
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["build", str(dox_dir), "--output", str(tmp_path), "--jobs", "2"]
+    )
+    assert result.exit_code == 0
+    assert (tmp_path / "ExampleLinux.json").read_bytes() == (
+        documents_dir / "ExampleLinux.json"
+    ).read_bytes()
+    assert list(BuildManifest(tmp_path).entries) == ["ExampleLinux.json"]
+
+
+def test_build_manifest_dox(dox_dir: Path, tmp_path: Path) -> None:
+    """Test build of a top-level Dox named like the manifest."""
+    root = tmp_path / "dox"
+    shutil.copytree(dox_dir / "ExampleLinux", root / "manifest")
+    output = tmp_path / "output"
+    runner = CliRunner()
+    result = runner.invoke(cli, ["build", str(root), "-o", str(output), "-j", "1"])
     assert result.exit_code == 0
+    assert [document.path for document in Finder(root_dir=output).iter_documents()] == [
+        output / "manifest.json"
+    ]
+    assert list(BuildManifest(output).entries) == ["manifest.json"]
+
+
+def test_build_invalid_serializer(
+    dox_dir: Path, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test build with an invalid SSM_DOX_SERIALIZER."""
+    monkeypatch.setenv("SSM_DOX_SERIALIZER", "invalid")
+    get_default_serializer.cache_clear()
+    runner = CliRunner()
+    try:
+        assert runner.invoke(cli, ["build", "--help"]).exit_code == 0
+        result = runner.invoke(cli, ["build", str(dox_dir), "-o", str(tmp_path)])
+    finally:
+        get_default_serializer.cache_clear()
+    assert result.exit_code == 2
+    assert (
+        "invalid SSM_DOX_SERIALIZER: unknown serializer invalid; "
+        "expected one of json, orjson" in result.output
+    )
+    assert not (tmp_path / "ExampleLinux.json").exists()
 
 
 def test_build_is_file(tmp_path: Path) -> None:
@@ -51,3 +164,213 @@ def test_build_is_file(tmp_path: Path) -> None:
     runner = CliRunner()
     result = runner.invoke(cli, ["build", str(file_path)])
     assert result.exit_code == 1
+
+
+def test_build_incremental(
+    caplog: LogCaptureFixture,
+    dox_dir: Path,
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test build --incremental."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    monkeypatch.chdir(tmp_path)
+    output = tmp_path / "output"
+    spy_dox_build = mocker.spy(Dox, "build")
+    runner = CliRunner()
+    args = ["build", str(dox_dir), "-o", str(output), "--incremental", "-j", "1"]
+
+    assert runner.invoke(cli, args).exit_code == 0
+    assert spy_dox_build.call_count == 1
+    assert (
+        "built 1 dox (1 written, 0 unchanged); skipped 0 up-to-date and 0 unaffected dox"
+        in caplog.messages
+    )
+    assert (tmp_path / CACHE_DIR / "build").is_dir()
+
+    caplog.clear()
+    assert runner.invoke(cli, args).exit_code == 0
+    assert spy_dox_build.call_count == 1
+    assert (
+        "built 0 dox (0 written, 0 unchanged); skipped 1 up-to-date and 0 unaffected dox"
+        in caplog.messages
+    )
+
+    (output / "ExampleLinux.json").write_text("{}")
+    assert runner.invoke(cli, args).exit_code == 0
+    assert spy_dox_build.call_count == 2
+
+    caplog.clear()
+    assert runner.invoke(cli, [*args[:-3], "-j", "1"]).exit_code == 0
+    assert (
+        "built 1 dox (0 written, 1 unchanged); skipped 0 up-to-date and 0 unaffected dox"
+        in caplog.messages
+    )
+
+
+def test_build_verbose(
+    caplog: LogCaptureFixture, dox_dir: Path, tmp_path: Path
+) -> None:
+    """Test build with verbose logs."""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["--verbose", "build", str(dox_dir), "--output", str(tmp_path), "-j", "1"],
+    )
+    assert result.exit_code == 0
+    assert logging.getLogger("ssm_dox").getEffectiveLevel() == LogLevels.VERBOSE
+    assert any(msg.startswith("IncludeScript cache: ") for msg in caplog.messages)
+    assert any(msg.startswith("template cache: ") for msg in caplog.messages)
+    assert not [r for r in caplog.records if r.levelno < LogLevels.VERBOSE]
+
+
+def test_build_changed(
+    caplog: LogCaptureFixture,
+    dox_dir: Path,
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test build --changed."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    monkeypatch.chdir(tmp_path)
+    root = tmp_path / "dox"
+    shutil.copytree(dox_dir / "ExampleLinux", root / "First")
+    shutil.copytree(dox_dir / "ExampleLinux", root / "Second")
+    spy_dox_build = mocker.spy(Dox, "build")
+    runner = CliRunner()
+    args = ["build", str(root), "-o", str(tmp_path / "output"), "-j", "1"]
+
+    assert runner.invoke(cli, [*args, "--changed", "dox/First"]).exit_code == 0
+    assert spy_dox_build.call_count == 2  # dependencies were not known yet
+
+    caplog.clear()
+    assert (
+        runner.invoke(cli, [*args, "--changed", "dox/Second/script.sh"]).exit_code == 0
+    )
+    assert spy_dox_build.call_count == 3
+    assert spy_dox_build.call_args.args[0].name == "Second"
+    assert "skipped First (not affected)" in caplog.messages
+
+    caplog.clear()
+    assert runner.invoke(cli, [*args, "--changed", "other.sh"]).exit_code == 0
+    assert spy_dox_build.call_count == 3
+    assert (
+        "selected 0 dox affected by 1 changed path(s); skipped 2 dox" in caplog.messages
+    )
+
+
+def test_build_changed_shared_script(
+    caplog: LogCaptureFixture,
+    dox_dir: Path,
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test build --changed with a script included through ``../``."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    monkeypatch.chdir(tmp_path)
+    write_shared_dox(dox_dir, tmp_path)
+    runner = CliRunner()
+    assert runner.invoke(cli, ["build", "-j", "1"]).exit_code == 0
+    spy_dox_build = mocker.spy(Dox, "build")
+
+    caplog.clear()
+    assert (
+        runner.invoke(
+            cli, ["build", "-j", "1", "--changed", "scripts/common.sh"]
+        ).exit_code
+        == 0
+    )
+    assert sorted(c.args[0].name for c in spy_dox_build.call_args_list) == ["A", "B"]
+    assert "skipped C (not affected)" in caplog.messages
+
+
+def test_build_changed_since(
+    caplog: LogCaptureFixture,
+    dox_dir: Path,
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test build --changed-since."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    monkeypatch.chdir(tmp_path)
+    shutil.copytree(dox_dir / "ExampleLinux", tmp_path / "dox" / "First")
+    shutil.copytree(dox_dir / "ExampleLinux", tmp_path / "dox" / "Second")
+    (tmp_path / ".gitignore").write_text(f"{CACHE_DIR.name}/\n")
+    runner = CliRunner()
+    assert runner.invoke(cli, ["build", "-j", "1"]).exit_code == 0
+    for args in [
+        ("init", "-q"),
+        ("add", "."),
+        ("-c", "user.name=test", "-c", "user.email=test@example.com", "commit")
+        + ("-qm", "initial"),
+    ]:
+        subprocess.run(["git", *args], check=True, cwd=tmp_path)
+    spy_dox_build = mocker.spy(Dox, "build")
+
+    caplog.clear()
+    assert runner.invoke(cli, ["build", "--changed-since", "HEAD"]).exit_code == 0
+    assert spy_dox_build.call_count == 0
+    assert (
+        "selected 0 dox affected by 0 changed path(s); skipped 2 dox" in caplog.messages
+    )
+    assert (
+        "built 0 dox (0 written, 0 unchanged); skipped 0 up-to-date and 2 unaffected dox"
+        in caplog.messages
+    )
+
+    (tmp_path / "dox" / "Second" / "script.sh").write_text("echo changed\n")
+    caplog.clear()
+    assert runner.invoke(cli, ["build", "--changed-since", "HEAD"]).exit_code == 0
+    assert spy_dox_build.call_count == 1
+    assert spy_dox_build.call_args.args[0].name == "Second"
+    assert "skipped First (not affected)" in caplog.messages
+
+
+def test_build_changed_since_shared_script(
+    caplog: LogCaptureFixture,
+    dox_dir: Path,
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test build --changed-since with a script included through ``../``."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    monkeypatch.chdir(tmp_path)
+    write_shared_dox(dox_dir, tmp_path)
+    (tmp_path / ".gitignore").write_text(f"{CACHE_DIR.name}/\n")
+    runner = CliRunner()
+    assert runner.invoke(cli, ["build", "-j", "1"]).exit_code == 0
+    subprocess.run(["git", "init", "-q"], check=True, cwd=tmp_path)
+    for message in ["initial", "change shared script"]:
+        subprocess.run(["git", "add", "."], check=True, cwd=tmp_path)
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+            + ["commit", "-qm", message],
+            check=True,
+            cwd=tmp_path,
+        )
+        (tmp_path / "scripts" / "common.sh").write_text("echo changed\n")
+    spy_dox_build = mocker.spy(Dox, "build")
+
+    caplog.clear()
+    assert (
+        runner.invoke(cli, ["build", "-j", "1", "--changed-since", "HEAD~1"]).exit_code
+        == 0
+    )
+    assert sorted(c.args[0].name for c in spy_dox_build.call_args_list) == ["A", "B"]
+    assert "skipped C (not affected)" in caplog.messages
+
+
+def test_build_changed_since_invalid(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """Test build --changed-since outside of a git repository."""
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["build", str(tmp_path), "--changed-since", "HEAD", "-j", "1"]
+    )
+    assert result.exit_code == 2
+    assert "Invalid value for '--changed-since'" in result.output
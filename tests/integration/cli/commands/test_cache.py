@@ -0,0 +1,56 @@
+"""Test cache command."""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from click.testing import CliRunner
+
+from ssm_dox._cli.main import cli
+from ssm_dox.constants import CACHE_DIR
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+def test_cache_clear(
+    caplog: LogCaptureFixture, dox_dir: Path, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test cache clear."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    assert runner.invoke(cli, ["cache", "clear"]).exit_code == 0
+    assert "cache is already empty" in caplog.messages
+    assert (
+        runner.invoke(
+            cli, ["build", str(dox_dir), "-o", str(tmp_path / "out"), "-j", "1"]
+        ).exit_code
+        == 0
+    )
+    assert (tmp_path / CACHE_DIR).is_dir()
+    assert runner.invoke(cli, ["cache", "clear"]).exit_code == 0
+    assert not (tmp_path / CACHE_DIR).exists()
+
+
+def test_cache_stats(
+    caplog: LogCaptureFixture, dox_dir: Path, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test cache stats."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    assert (
+        runner.invoke(
+            cli, ["build", str(dox_dir), "-o", str(tmp_path / "out"), "-j", "1"]
+        ).exit_code
+        == 0
+    )
+    caplog.clear()
+    assert runner.invoke(cli, ["cache", "stats"]).exit_code == 0
+    assert caplog.messages[0].startswith("templates: 1 entries using ")
+    assert caplog.messages[1] == "build: 0 file(s) using 0 byte(s)"
+    assert caplog.messages[2].startswith("discovery: 1 file(s) using ")
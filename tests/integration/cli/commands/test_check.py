@@ -1,13 +1,16 @@
 """Test check command."""
 from __future__ import annotations
 
+import logging
+import shutil
+import subprocess
 from typing import TYPE_CHECKING
 
 from click.testing import CliRunner
-from mock import MagicMock
+from mock import ANY, MagicMock, call, patch
 
 from ssm_dox._cli.main import cli
-from ssm_dox.constants import DOCUMENTS_DIR, DOX_DIR
+from ssm_dox.constants import CACHE_DIR, DOCUMENTS_DIR, DOX_DIR
 from ssm_dox.dox import Dox
 from ssm_dox.exceptions import DocumentDrift
 from ssm_dox.finder import Finder
@@ -15,6 +18,8 @@ from ssm_dox.finder import Finder
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
     from pytest_mock import MockerFixture
 
 MODULE = "ssm_dox._cli.commands._check"
@@ -24,12 +29,20 @@ def test_check(documents_dir: Path, dox_dir: Path, mocker: MockerFixture) -> Non
     """Test check."""
     mock_dox_check = mocker.patch.object(Dox, "check", return_value=None)
     mock_finder = mocker.patch(
-        f"{MODULE}.Finder", return_value=Finder(root_dir=dox_dir)
+        f"{MODULE}.Finder",
+        side_effect=[Finder(root_dir=dox_dir), Finder(root_dir=documents_dir)],
     )
     runner = CliRunner()
-    result = runner.invoke(cli, ["check", str(dox_dir), str(documents_dir)])
-    mock_finder.assert_called_once_with(root_dir=dox_dir)
-    mock_dox_check.assert_called_once_with(documents_dir)
+    result = runner.invoke(
+        cli, ["check", str(dox_dir), str(documents_dir), "--jobs", "1"]
+    )
+    mock_finder.assert_has_calls(
+        [
+            call(root_dir=dox_dir, index=ANY, template_cache=ANY),
+            call(root_dir=documents_dir, index=ANY),
+        ]
+    )
+    mock_dox_check.assert_called_once_with(documents_dir, manifest=None)
     assert result.exit_code == 0
 
 
@@ -48,13 +61,15 @@ def test_check_drifted(
         ),
     )
     mock_dox_diff = mocker.patch.object(Dox, "diff")
-    mock_finder = mocker.patch(
-        f"{MODULE}.Finder", return_value=Finder(root_dir=dox_dir)
+    mocker.patch(
+        f"{MODULE}.Finder",
+        side_effect=[Finder(root_dir=dox_dir), Finder(root_dir=documents_dir)],
     )
     runner = CliRunner()
-    result = runner.invoke(cli, ["check", str(dox_dir), str(documents_dir)])
-    mock_finder.assert_called_once_with(root_dir=dox_dir)
-    mock_dox_check.assert_called_once_with(documents_dir)
+    result = runner.invoke(
+        cli, ["check", str(dox_dir), str(documents_dir), "--jobs", "1"]
+    )
+    mock_dox_check.assert_called_once_with(documents_dir, manifest=None)
     mock_dox_diff.assert_called_once_with(documents_dir)
     assert result.exit_code == 1
 
@@ -63,10 +78,97 @@ def test_check_default(dox_dir: Path, mocker: MockerFixture) -> None:
     """Test check default values."""
     mock_dox_check = mocker.patch.object(Dox, "check", return_value=None)
     mock_finder = mocker.patch(
-        f"{MODULE}.Finder", return_value=Finder(root_dir=dox_dir)
+        f"{MODULE}.Finder",
+        side_effect=[Finder(root_dir=dox_dir), Finder(root_dir=DOCUMENTS_DIR)],
     )
     runner = CliRunner()
-    result = runner.invoke(cli, ["check"])
-    mock_finder.assert_called_once_with(root_dir=DOX_DIR)
-    mock_dox_check.assert_called_once_with(DOCUMENTS_DIR)
+    result = runner.invoke(cli, ["check", "--jobs", "1"])
+    mock_finder.assert_has_calls(
+        [
+            call(root_dir=DOX_DIR, index=ANY, template_cache=ANY),
+            call(root_dir=DOCUMENTS_DIR, index=ANY),
+        ]
+    )
+    mock_dox_check.assert_called_once_with(DOCUMENTS_DIR, manifest=None)
     assert result.exit_code == 0
+
+
+def test_check_report(
+    caplog: LogCaptureFixture, dox_dir: Path, documents_dir: Path, tmp_path: Path
+) -> None:
+    """Test check reports every problem."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    dox = tmp_path / "dox"
+    shutil.copytree(dox_dir / "ExampleLinux", dox / "ExampleLinux")
+    shutil.copytree(dox_dir / "ExampleLinux", dox / "Drifted")
+    shutil.copytree(dox_dir / "ExampleLinux", dox / "Missing")
+    documents = tmp_path / "documents"
+    documents.mkdir()
+    shutil.copy(documents_dir / "ExampleLinux.json", documents)
+    (documents / "Drifted.json").write_text('{"mainSteps": []}')
+    (documents / "Orphan.json").write_text('{"mainSteps": []}')
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["check", str(dox), str(documents), "--jobs", "2", "--no-index"]
+    )
+    assert result.exit_code == 1
+    assert (
+        "checked 3 dox; 1 up to date, 1 drifted, 1 missing, 1 orphaned, 0 error(s)"
+        in caplog.messages
+    )
+    assert f"drifted: {documents / 'Drifted.json'} (Dox: {dox / 'Drifted'})" in (
+        caplog.messages
+    )
+    assert f"missing: {documents / 'Missing.json'} (Dox: {dox / 'Missing'})" in (
+        caplog.messages
+    )
+    assert f"orphaned: {documents / 'Orphan.json'} (no corresponding Dox)" in (
+        caplog.messages
+    )
+
+
+def test_check_template_cache(
+    documents_dir: Path, dox_dir: Path, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test check loading Dox from the template cache on a warm run."""
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    args = ["check", str(dox_dir), str(documents_dir), "-j", "1"]
+    assert runner.invoke(cli, args).exit_code == 0
+    with patch("ssm_dox.dox.DoxLoader") as mock_loader:
+        assert runner.invoke(cli, args).exit_code == 0
+    mock_loader.assert_not_called()
+
+
+def test_check_changed_since(
+    caplog: LogCaptureFixture,
+    dox_dir: Path,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test check --changed-since."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    monkeypatch.chdir(tmp_path)
+    shutil.copytree(dox_dir / "ExampleLinux", tmp_path / "dox" / "First")
+    shutil.copytree(dox_dir / "ExampleLinux", tmp_path / "dox" / "Second")
+    (tmp_path / ".gitignore").write_text(f"{CACHE_DIR.name}/\n")
+    runner = CliRunner()
+    assert runner.invoke(cli, ["build", "-j", "1"]).exit_code == 0
+    for args in [
+        ("init", "-q"),
+        ("add", "."),
+        ("-c", "user.name=test", "-c", "user.email=test@example.com", "commit")
+        + ("-qm", "initial"),
+    ]:
+        subprocess.run(["git", *args], check=True, cwd=tmp_path)
+
+    (tmp_path / "dox" / "Second" / "script.sh").write_text("echo changed\n")
+    caplog.clear()
+    result = runner.invoke(cli, ["check", "--changed-since", "HEAD", "-j", "1"])
+    assert result.exit_code == 1
+    assert "skipped First (not affected)" in caplog.messages
+    assert (
+        "checked 1 dox; 0 up to date, 1 drifted, 0 missing, 0 orphaned, 0 error(s)"
+        in caplog.messages
+    )
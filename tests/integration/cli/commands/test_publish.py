@@ -2,19 +2,25 @@
 # pylint: disable=unused-argument
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
+import boto3
 from click.testing import CliRunner
 from mock import ANY
+from moto import mock_aws
 
 from ssm_dox._cli.main import cli
 from ssm_dox.constants import DOCUMENTS_DIR
 from ssm_dox.document import Document
 from ssm_dox.finder import Finder
+from ssm_dox.publisher import Publisher
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
     from pytest_mock import MockerFixture
 
 MODULE = "ssm_dox._cli.commands._publish"
@@ -24,7 +30,8 @@ def test_publish(
     aws_credentials: None, documents_dir: Path, mocker: MockerFixture, tmp_path: Path
 ) -> None:
     """Test publish."""
-    mock_publish = mocker.patch.object(Document, "publish", return_value=None)
+    mock_publish = mocker.patch.object(Document, "publish", return_value=0)
+    mocker.patch.object(Publisher, "list_objects", return_value={})
     mock_finder = mocker.patch(
         f"{MODULE}.Finder", return_value=Finder(root_dir=documents_dir)
     )
@@ -32,7 +39,7 @@ def test_publish(
     result = runner.invoke(
         cli, ["publish", "test-bucket", str(documents_dir), "--prefix", "latest"]
     )
-    mock_finder.assert_called_once_with(root_dir=documents_dir)
+    mock_finder.assert_called_once_with(root_dir=documents_dir, index=ANY)
     mock_publish.assert_called_once_with(ANY, bucket="test-bucket", prefix="latest")
     assert result.exit_code == 0
 
@@ -41,12 +48,86 @@ def test_publish_default(
     aws_credentials: None, documents_dir: Path, mocker: MockerFixture, tmp_path: Path
 ) -> None:
     """Test publish default values."""
-    mock_publish = mocker.patch.object(Document, "publish", return_value=None)
+    mock_publish = mocker.patch.object(Document, "publish", return_value=0)
+    mocker.patch.object(Publisher, "list_objects", return_value={})
     mock_finder = mocker.patch(
         f"{MODULE}.Finder", return_value=Finder(root_dir=documents_dir)
     )
     runner = CliRunner()
     result = runner.invoke(cli, ["publish", "test-bucket"])
-    mock_finder.assert_called_once_with(root_dir=DOCUMENTS_DIR)
+    mock_finder.assert_called_once_with(root_dir=DOCUMENTS_DIR, index=ANY)
     mock_publish.assert_called_once_with(ANY, bucket="test-bucket", prefix="dev")
     assert result.exit_code == 0
+
+
+def test_publish_concurrency(
+    aws_credentials: None,
+    caplog: LogCaptureFixture,
+    documents_dir: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test publish --concurrency against a mocked bucket."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        boto3.client("s3").create_bucket(Bucket="test-bucket")
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            ["publish", "test-bucket", str(documents_dir), "--concurrency", "4"],
+        )
+        assert result.exit_code == 0
+        keys = [
+            obj["Key"]
+            for obj in boto3.client("s3").list_objects_v2(Bucket="test-bucket")[
+                "Contents"
+            ]
+        ]
+    assert keys == ["dev/ExampleLinux.json"]
+    assert any(msg.startswith("published 1 document(s) ") for msg in caplog.messages)
+
+
+def test_publish_failed(
+    aws_credentials: None, documents_dir: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test publish to a bucket that does not exist."""
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        runner = CliRunner()
+        result = runner.invoke(cli, ["publish", "test-bucket", str(documents_dir)])
+    assert result.exit_code == 1
+
+
+def test_publish_delete(
+    aws_credentials: None, documents_dir: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test publish --delete."""
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        client = boto3.client("s3")
+        client.create_bucket(Bucket="test-bucket")
+        client.put_object(Bucket="test-bucket", Body=b"{}", Key="dev/stale.json")
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["publish", "test-bucket", str(documents_dir), "--delete"]
+        )
+        assert result.exit_code == 0
+        keys = [
+            obj["Key"]
+            for obj in client.list_objects_v2(Bucket="test-bucket")["Contents"]
+        ]
+    assert keys == ["dev/ExampleLinux.json"]
+
+
+def test_publish_delete_empty_prefix(
+    aws_credentials: None, documents_dir: Path, mocker: MockerFixture
+) -> None:
+    """Test publish --delete with an empty prefix is rejected."""
+    mock_publisher = mocker.patch(f"{MODULE}.Publisher")
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["publish", "test-bucket", str(documents_dir), "--delete", "-p", ""]
+    )
+    assert result.exit_code == 2
+    assert "--delete requires a non-empty --prefix" in result.output
+    mock_publisher.assert_not_called()
@@ -0,0 +1,55 @@
+"""Test publish-ssm command."""
+# pylint: disable=unused-argument
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import boto3
+from click.testing import CliRunner
+from moto import mock_aws
+
+from ssm_dox._cli.main import cli
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.logging import LogCaptureFixture
+    from pytest_mock import MockerFixture
+
+
+def test_publish_ssm(
+    aws_credentials: None, caplog: LogCaptureFixture, documents_dir: Path
+) -> None:
+    """Test publish-ssm."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    with mock_aws():
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["publish-ssm", str(documents_dir), "--prefix", "dev"]
+        )
+        assert result.exit_code == 0
+        client = boto3.client("ssm")
+        assert client.get_document(Name="dev-ExampleLinux")["DocumentType"] == (
+            "Command"
+        )
+        result = runner.invoke(
+            cli, ["publish-ssm", str(documents_dir), "--prefix", "dev"]
+        )
+        assert result.exit_code == 0
+    assert "created SSM Document dev-ExampleLinux" in caplog.messages
+    assert "SSM Document dev-ExampleLinux is unchanged" in caplog.messages
+
+
+def test_publish_ssm_failed(
+    aws_credentials: None, documents_dir: Path, mocker: MockerFixture
+) -> None:
+    """Test publish-ssm exiting with an error when a document fails."""
+    mocker.patch(
+        "ssm_dox.publisher.SsmPublisher.describe_document",
+        side_effect=Exception("Throttled"),
+    )
+    with mock_aws():
+        runner = CliRunner()
+        result = runner.invoke(cli, ["publish-ssm", str(documents_dir)])
+    assert result.exit_code == 1
@@ -0,0 +1,89 @@
+"""Test release command."""
+# pylint: disable=unused-argument
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import boto3
+from click.testing import CliRunner
+from moto import mock_aws
+
+from ssm_dox._cli.main import cli
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock import MockerFixture
+
+MODULE = "ssm_dox._cli.commands._release"
+
+
+def test_release(
+    aws_credentials: None,
+    caplog: LogCaptureFixture,
+    dox_dir: Path,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test release."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    monkeypatch.chdir(tmp_path)
+    output = tmp_path / "output"
+    with mock_aws():
+        client = boto3.client("s3")
+        client.create_bucket(Bucket="test-bucket")
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            ["release", "test-bucket", str(dox_dir), "-o", str(output), "-j", "1"],
+        )
+        assert result.exit_code == 0
+        body = client.get_object(Bucket="test-bucket", Key="dev/ExampleLinux.json")[
+            "Body"
+        ].read()
+    assert body + b"\n" == (output / "ExampleLinux.json").read_bytes()
+    assert "built 1 dox (1 written, 0 unchanged); skipped 0 up-to-date dox" in (
+        caplog.messages
+    )
+    assert any(msg.startswith("published 1 document(s) ") for msg in caplog.messages)
+
+
+def test_release_failed(
+    aws_credentials: None, dox_dir: Path, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test release to a bucket that does not exist."""
+    monkeypatch.chdir(tmp_path)
+    with mock_aws():
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            ["release", "test-bucket", str(dox_dir), "-o", str(tmp_path), "--force"],
+        )
+    assert result.exit_code == 1
+
+
+def test_release_delete_empty_prefix(
+    aws_credentials: None, dox_dir: Path, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Test release --delete with an empty prefix is rejected."""
+    mock_releaser = mocker.patch(f"{MODULE}.Releaser")
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "release",
+            "test-bucket",
+            str(dox_dir),
+            "-o",
+            str(tmp_path),
+            "--delete",
+            "--prefix",
+            "",
+        ],
+    )
+    assert result.exit_code == 2
+    assert "--delete requires a non-empty --prefix" in result.output
+    mock_releaser.assert_not_called()
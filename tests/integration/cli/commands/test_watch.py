@@ -0,0 +1,55 @@
+"""Test watch command."""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from click.testing import CliRunner
+
+from ssm_dox._cli.main import cli
+from ssm_dox.watcher import DoxWatcher, PollingWatcher
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock import MockerFixture
+
+
+def test_watch(
+    caplog: LogCaptureFixture,
+    dox_dir: Path,
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test watch."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    monkeypatch.chdir(tmp_path)
+    mock_run = mocker.patch.object(
+        DoxWatcher, "run", autospec=True, side_effect=KeyboardInterrupt
+    )
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "watch",
+            str(dox_dir),
+            "-o",
+            str(tmp_path),
+            "--polling",
+            "--poll-interval",
+            "2",
+            "--debounce",
+            "0.5",
+        ],
+    )
+    assert result.exit_code == 0
+    obj: DoxWatcher = mock_run.call_args.args[0]
+    assert obj.debounce == 0.5
+    assert obj.output_dir == tmp_path
+    assert obj.root == dox_dir.absolute()
+    assert isinstance(obj.watcher, PollingWatcher)
+    assert obj.watcher.interval == 2
+    assert f"stopped watching {dox_dir}" in caplog.messages
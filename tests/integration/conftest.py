@@ -50,7 +50,7 @@ def aws_credentials() -> Iterator[None]:
 # pylint: disable=unused-argument
 def pytest_ignore_collect(path: Any, config: Config) -> bool:
     """Determine if this directory should have its tests collected."""
-    if config.option.functional or config.option.unit:
+    if config.option.benchmark or config.option.functional or config.option.unit:
         return True
     return False
 
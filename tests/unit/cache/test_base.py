@@ -0,0 +1,52 @@
+"""Test ssm_dox.cache.base."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ssm_dox.cache.base import JsonCacheFile
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestJsonCacheFile:
+    """Test JsonCacheFile."""
+
+    def test_data(self, tmp_path: Path) -> None:
+        """Test data."""
+        path = tmp_path / "cache.json"
+        path.write_text(json.dumps({"version": 1, "data": {"foo": "bar"}}))
+        assert JsonCacheFile(path).data == {"foo": "bar"}
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "",
+            "not json",
+            "[]",
+            json.dumps({"version": 0, "data": {"foo": "bar"}}),
+            json.dumps({"version": 1, "data": None}),
+        ],
+    )
+    def test_data_invalid(self, content: str, tmp_path: Path) -> None:
+        """Test data invalid."""
+        path = tmp_path / "cache.json"
+        path.write_text(content)
+        assert JsonCacheFile(path).data == {}
+
+    def test_data_not_exist(self, tmp_path: Path) -> None:
+        """Test data file does not exist."""
+        assert JsonCacheFile(tmp_path / "cache.json").data == {}
+
+    def test_save(self, tmp_path: Path) -> None:
+        """Test save."""
+        path = tmp_path / "parent" / "cache.json"
+        obj = JsonCacheFile(path)
+        obj.data["foo"] = "bar"
+        obj.save()
+        assert json.loads(path.read_text()) == {"version": 1, "data": {"foo": "bar"}}
+        assert JsonCacheFile(path).data == {"foo": "bar"}
@@ -0,0 +1,108 @@
+"""Test ssm_dox.cache.build."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+from ssm_dox.cache.base import RACY_WINDOW_NS
+from ssm_dox.cache.build import BuildCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+MODULE = "ssm_dox.cache.build"
+
+
+def make_old(*paths: Path) -> None:
+    """Set the mtime of files far enough in the past to be trusted."""
+    old_ns = time.time_ns() - RACY_WINDOW_NS * 2
+    for path in paths:
+        os.utime(path, ns=(old_ns, old_ns))
+
+
+class TestBuildCache:
+    """Test BuildCache."""
+
+    def test_for_output(self, tmp_path: Path) -> None:
+        """Test for_output."""
+        obj = BuildCache.for_output(tmp_path / "out", tmp_path)
+        assert obj.path.parent == tmp_path / "build"
+        assert obj.path != BuildCache.for_output(tmp_path / "other", tmp_path).path
+
+    def test_for_output_version(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test for_output changes with the version of ssm-dox."""
+        path = BuildCache.for_output(tmp_path / "out", tmp_path).path
+        assert path == BuildCache.for_output(tmp_path / "out", tmp_path).path
+        mocker.patch(f"{MODULE}.__version__", "99.0.0")
+        assert path != BuildCache.for_output(tmp_path / "out", tmp_path).path
+
+    def test_is_current(self, tmp_path: Path) -> None:
+        """Test is_current."""
+        template = tmp_path / "template.yml"
+        template.write_text("template")
+        script = tmp_path / "script.sh"
+        script.write_text("script")
+        document = tmp_path / "document.json"
+        document.write_text("{}")
+        obj = BuildCache(tmp_path / "cache.json")
+        assert not obj.is_current(template, document)
+        obj.record(template, [template, script], document)
+        obj.save()
+
+        assert BuildCache(obj.path).is_current(template, document)
+        assert not BuildCache(obj.path).is_current(template, tmp_path / "other.json")
+        assert not BuildCache(obj.path).is_current(tmp_path / "other.yml", document)
+        script.write_text("changed")
+        assert not BuildCache(obj.path).is_current(template, document)
+        script.write_text("script")
+        assert BuildCache(obj.path).is_current(template, document)
+        document.write_text("{ }")
+        assert not BuildCache(obj.path).is_current(template, document)
+        document.unlink()
+        assert not BuildCache(obj.path).is_current(template, document)
+
+    def test_record_document_missing(self, tmp_path: Path) -> None:
+        """Test record when the document was not written."""
+        template = tmp_path / "template.yml"
+        template.write_text("template")
+        obj = BuildCache(tmp_path / "cache.json")
+        obj.entries[str(template)] = {}
+        obj.record(template, [template], tmp_path / "document.json")
+        assert not obj.entries
+
+    def test_stat(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test stat only reads files that may have changed."""
+        path = tmp_path / "file.txt"
+        path.write_text("content")
+        make_old(path)
+        mock_digest_file = mocker.patch(f"{MODULE}.digest_file", return_value="digest")
+        obj = BuildCache(tmp_path / "cache.json")
+        state = obj.stat(str(path))
+        assert state and state["sha256"] == "digest"
+        assert obj.stat(str(path)) is state
+        mock_digest_file.assert_called_once()
+
+        assert BuildCache(obj.path).stat(str(path), state) is state
+        mock_digest_file.assert_called_once()
+
+        path.write_text("changed")
+        make_old(path)
+        assert BuildCache(obj.path).stat(str(path), state) is not state
+        assert mock_digest_file.call_count == 2
+
+    def test_stat_not_exist(self, tmp_path: Path) -> None:
+        """Test stat file does not exist."""
+        assert not BuildCache(tmp_path / "cache.json").stat(str(tmp_path / "x"))
+
+    def test_stat_racy(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test stat does not trust files modified close to being recorded."""
+        path = tmp_path / "file.txt"
+        path.write_text("content")
+        mock_digest_file = mocker.patch(f"{MODULE}.digest_file", return_value="digest")
+        state = BuildCache(tmp_path / "cache.json").stat(str(path))
+        assert BuildCache(tmp_path / "cache.json").stat(str(path), state) is not state
+        assert mock_digest_file.call_count == 2
@@ -0,0 +1,47 @@
+"""Test ssm_dox.cache.dependencies."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ssm_dox.cache.dependencies import DependencyGraph
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestDependencyGraph:
+    """Test DependencyGraph."""
+
+    def test_for_root(self, tmp_path: Path) -> None:
+        """Test for_root."""
+        obj = DependencyGraph.for_root(tmp_path / "dox", tmp_path)
+        assert obj.path.parent == tmp_path / "dependencies"
+        assert obj.path != DependencyGraph.for_root(tmp_path / "other", tmp_path).path
+
+    def test_is_affected(self, tmp_path: Path) -> None:
+        """Test is_affected."""
+        template = tmp_path / "dox" / "Example" / "template.yml"
+        script = tmp_path / "scripts" / "common.sh"
+        obj = DependencyGraph(tmp_path / "graph.json")
+        assert obj.is_affected(template, [])
+        obj.record(template, [script, script])
+        assert obj.entries == {str(template): [str(script)]}
+
+        assert not obj.is_affected(template, [])
+        assert obj.is_affected(template, [template])
+        assert obj.is_affected(template, [template.parent])
+        assert obj.is_affected(template, [template.parent / "new.sh"])
+        assert obj.is_affected(template, [tmp_path / "dox"])
+        assert obj.is_affected(template, [script])
+        assert obj.is_affected(template, [script.parent])
+        assert not obj.is_affected(template, [tmp_path / "scripts" / "other.sh"])
+        assert not obj.is_affected(template, [tmp_path / "dox" / "Other"])
+
+    def test_save(self, tmp_path: Path) -> None:
+        """Test save."""
+        template = tmp_path / "template.yml"
+        obj = DependencyGraph(tmp_path / "graph.json")
+        obj.record(template, [tmp_path / "script.sh"])
+        obj.save()
+        assert DependencyGraph(obj.path).entries == obj.entries
@@ -0,0 +1,73 @@
+"""Test ssm_dox.cache.discovery."""
+# pylint: disable=no-self-use,protected-access
+from __future__ import annotations
+
+from pathlib import Path
+
+from ssm_dox.cache.discovery import RACY_WINDOW_NS, DiscoveryIndex, IndexEntry
+
+ENTRY = IndexEntry(
+    documents=["doc.json"], subdirectories=["child"], template="template.yml"
+)
+
+
+class TestDiscoveryIndex:
+    """Test DiscoveryIndex."""
+
+    def test_for_root(self, tmp_path: Path) -> None:
+        """Test for_root."""
+        obj = DiscoveryIndex.for_root(Path("dox"), tmp_path)
+        assert obj.path.parent == tmp_path / "discovery"
+        assert (
+            obj.path == DiscoveryIndex.for_root(Path("dox").absolute(), tmp_path).path
+        )
+        assert obj.path != DiscoveryIndex.for_root(Path("other"), tmp_path).path
+
+    def test_lookup(self, tmp_path: Path) -> None:
+        """Test lookup."""
+        obj = DiscoveryIndex(tmp_path / "index.json")
+        mtime_ns = obj._started_ns - RACY_WINDOW_NS - 1
+        obj.update(tmp_path, mtime_ns, ENTRY)
+        obj.save()
+
+        index = DiscoveryIndex(obj.path)
+        assert index.lookup(tmp_path, mtime_ns) == ENTRY
+        assert not index.lookup(tmp_path, mtime_ns + 1)
+        assert not index.lookup(tmp_path / "child", mtime_ns)
+
+    def test_save_drops_unvisited(self, tmp_path: Path) -> None:
+        """Test save drops directories that were not visited."""
+        obj = DiscoveryIndex(tmp_path / "index.json")
+        mtime_ns = obj._started_ns - RACY_WINDOW_NS - 1
+        obj.update(tmp_path, mtime_ns, ENTRY)
+        obj.update(tmp_path / "child", mtime_ns, ENTRY)
+        obj.save()
+
+        index = DiscoveryIndex(obj.path)
+        assert index.lookup(tmp_path, mtime_ns)
+        index.save()
+        assert list(DiscoveryIndex(obj.path).data["directories"]) == [str(tmp_path)]
+
+    def test_set_ignore_digest(self, tmp_path: Path) -> None:
+        """Test set_ignore_digest."""
+        obj = DiscoveryIndex(tmp_path / "index.json")
+        obj.set_ignore_digest("foo")
+        mtime_ns = obj._started_ns - RACY_WINDOW_NS - 1
+        obj.update(tmp_path, mtime_ns, ENTRY)
+        obj.save()
+
+        index = DiscoveryIndex(obj.path)
+        index.set_ignore_digest("foo")
+        assert index.lookup(tmp_path, mtime_ns) == ENTRY
+
+        index = DiscoveryIndex(obj.path)
+        index.set_ignore_digest("bar")
+        assert not index.lookup(tmp_path, mtime_ns)
+        assert index.data == {"ignore": "bar"}
+
+    def test_update_racy(self, tmp_path: Path) -> None:
+        """Test update does not record recently modified directories."""
+        obj = DiscoveryIndex(tmp_path / "index.json")
+        obj.update(tmp_path, obj._started_ns, ENTRY)
+        obj.save()
+        assert not DiscoveryIndex(obj.path).lookup(tmp_path, obj._started_ns)
@@ -0,0 +1,98 @@
+"""Test ssm_dox.cache.scripts."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+import logging
+import os
+from typing import TYPE_CHECKING
+
+from ssm_dox.cache.base import CacheStats
+from ssm_dox.cache.scripts import ScriptCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.logging import LogCaptureFixture
+
+MODULE = "ssm_dox.cache.scripts"
+
+
+class TestScriptCache:
+    """Test ScriptCache."""
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Test clear."""
+        script = tmp_path / "script.sh"
+        script.write_text("echo hello\n")
+        obj = ScriptCache()
+        obj.read_lines(script)
+        obj.read_lines(script)
+        obj.clear()
+        assert obj.stats == CacheStats(hits=0, misses=0, entries=0, size=0)
+
+    def test_log_stats(self, caplog: LogCaptureFixture, tmp_path: Path) -> None:
+        """Test log_stats."""
+        caplog.set_level(logging.DEBUG, logger=MODULE)
+        script = tmp_path / "script.sh"
+        script.write_text("echo hello\n")
+        obj = ScriptCache()
+        obj.read_lines(script)
+        obj.read_lines(script)
+        obj.log_stats()
+        assert (
+            "IncludeScript cache: 1 hit(s), 1 miss(es), 1 script(s) cached "
+            "using 11 byte(s)" in caplog.messages
+        )
+
+    def test_read_lines(self, tmp_path: Path) -> None:
+        """Test read_lines."""
+        script = tmp_path / "script.sh"
+        script.write_text("echo hello  \necho world\n")
+        obj = ScriptCache()
+        assert obj.read_lines(script) == ["echo hello", "echo world"]
+        result = obj.read_lines(tmp_path / "." / "script.sh")
+        assert result == ["echo hello", "echo world"]
+        result.append("modified")
+        assert obj.read_lines(script) == ["echo hello", "echo world"]
+        assert obj.stats == CacheStats(hits=2, misses=1, entries=1, size=24)
+
+    def test_read_lines_evict(self, tmp_path: Path) -> None:
+        """Test read_lines evicting the least recently used script."""
+        first = tmp_path / "first.sh"
+        first.write_text("1234")
+        second = tmp_path / "second.sh"
+        second.write_text("5678")
+        third = tmp_path / "third.sh"
+        third.write_text("90")
+        obj = ScriptCache(max_bytes=8)
+        obj.read_lines(first)
+        obj.read_lines(second)
+        obj.read_lines(first)
+        obj.read_lines(third)
+        assert obj.stats == CacheStats(hits=1, misses=3, entries=2, size=6)
+        obj.read_lines(first)
+        obj.read_lines(third)
+        assert obj.hits == 3
+        obj.read_lines(second)
+        assert obj.misses == 4
+
+    def test_read_lines_modified(self, tmp_path: Path) -> None:
+        """Test read_lines after a script is modified."""
+        script = tmp_path / "script.sh"
+        script.write_text("echo hello\n")
+        obj = ScriptCache()
+        assert obj.read_lines(script) == ["echo hello"]
+        script.write_text("echo world\n")
+        stat = script.stat()
+        os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert obj.read_lines(script) == ["echo world"]
+        assert obj.misses == 2
+
+    def test_read_lines_too_large(self, tmp_path: Path) -> None:
+        """Test read_lines with a script larger than the cache."""
+        script = tmp_path / "script.sh"
+        script.write_text("echo hello\n")
+        obj = ScriptCache(max_bytes=1)
+        assert obj.read_lines(script) == ["echo hello"]
+        assert obj.read_lines(script) == ["echo hello"]
+        assert obj.stats == CacheStats(hits=0, misses=2, entries=0, size=0)
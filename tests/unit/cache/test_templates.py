@@ -0,0 +1,132 @@
+"""Test ssm_dox.cache.templates."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pickle
+from typing import TYPE_CHECKING
+
+from ssm_dox.cache.base import CacheStats
+from ssm_dox.cache.templates import TemplateCache
+from ssm_dox.models.document import SsmDocumentDataModel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.logging import LogCaptureFixture
+    from pytest_mock import MockerFixture
+
+MODULE = "ssm_dox.cache.templates"
+
+CONTENT = SsmDocumentDataModel.parse_obj(
+    {
+        "schemaVersion": "2.2",
+        "description": "test",
+        "mainSteps": [
+            {
+                "action": "aws:runShellScript",
+                "name": "test",
+                "inputs": {"runCommand": ["echo hello"]},
+            }
+        ],
+    }
+)
+
+
+class TestTemplateCache:
+    """Test TemplateCache."""
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Test clear."""
+        template = tmp_path / "template.yml"
+        obj = TemplateCache(tmp_path / "cache")
+        obj.clear()
+        obj.put(template, b"data", CONTENT, [])
+        (obj.path / "legacy.pickle").write_bytes(b"")
+        assert obj.get(template, b"data")
+        assert obj.stats.entries == 2
+        obj.clear()
+        assert obj.stats == CacheStats(hits=0, misses=0, entries=0, size=0)
+
+    def test_from_cache_dir(self, tmp_path: Path) -> None:
+        """Test from_cache_dir."""
+        assert TemplateCache.from_cache_dir(tmp_path).path == tmp_path / "templates"
+
+    def test_get(self, tmp_path: Path) -> None:
+        """Test get."""
+        template = tmp_path / "template.yml"
+        script = tmp_path / "script.sh"
+        script.write_text("echo hello")
+        obj = TemplateCache(tmp_path / "cache")
+        assert not obj.get(template, b"data")
+        obj.put(template, b"data", CONTENT, [script])
+
+        entry = obj.get(template, b"data")
+        assert entry
+        assert entry.content == CONTENT
+        assert entry.content.json() == CONTENT.json()
+        assert entry.content.__fields_set__ == CONTENT.__fields_set__
+        assert entry.includes[0][0] == str(script)
+        assert not obj.get(template, b"changed")
+        assert not obj.get(tmp_path / "other.yml", b"data")
+        script.write_text("echo changed")
+        assert not obj.get(template, b"data")
+        script.unlink()
+        assert not obj.get(template, b"data")
+        assert (obj.hits, obj.misses) == (1, 5)
+
+    def test_get_corrupt(self, tmp_path: Path) -> None:
+        """Test get with an unreadable entry."""
+        template = tmp_path / "template.yml"
+        obj = TemplateCache(tmp_path / "cache")
+        obj.put(template, b"data", CONTENT, [])
+        obj.get_entry_path(template, b"data").write_bytes(b"not json")
+        assert not obj.get(template, b"data")
+
+    def test_get_not_pickle(self, tmp_path: Path) -> None:
+        """Test get never unpickles an entry."""
+        template = tmp_path / "template.yml"
+        obj = TemplateCache(tmp_path / "cache")
+        obj.put(template, b"data", CONTENT, [])
+        path = obj.get_entry_path(template, b"data")
+        assert json.loads(path.read_bytes())["content"]["description"] == "test"
+        path.write_bytes(pickle.dumps((CONTENT, [])))
+        assert not obj.get(template, b"data")
+
+    def test_get_entry_path(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test get_entry_path changes with the version of ssm-dox."""
+        template = tmp_path / "template.yml"
+        obj = TemplateCache(tmp_path)
+        path = obj.get_entry_path(template, b"data")
+        assert path.parent == tmp_path
+        assert path == obj.get_entry_path(template, b"data")
+        mocker.patch(f"{MODULE}.__version__", "99.0.0")
+        assert path != obj.get_entry_path(template, b"data")
+
+    def test_log_stats(self, caplog: LogCaptureFixture, tmp_path: Path) -> None:
+        """Test log_stats."""
+        caplog.set_level(logging.DEBUG, logger=MODULE)
+        obj = TemplateCache(tmp_path)
+        obj.log_stats()
+        assert (
+            "template cache: 0 hit(s), 0 miss(es), 0 template(s) cached "
+            "using 0 byte(s)" in caplog.messages
+        )
+
+    def test_prune(self, tmp_path: Path) -> None:
+        """Test prune."""
+        obj = TemplateCache(tmp_path)
+        for index in range(3):
+            template = tmp_path / f"{index}.yml"
+            obj.put(template, b"data", CONTENT, [])
+            entry = obj.get_entry_path(template, b"data")
+            os.utime(entry, ns=(index * 10**9, index * 10**9))
+        size = obj.stats.size
+        assert obj.prune() == 0
+        obj.max_bytes = size - 1
+        assert obj.get(tmp_path / "0.yml", b"data")  # mark as recently used
+        assert obj.prune() == 1
+        assert not obj.get_entry_path(tmp_path / "1.yml", b"data").exists()
+        assert obj.stats.entries == 2
@@ -18,7 +18,7 @@ LOGGER = logging.getLogger(__name__)
 # pylint: disable=unused-argument
 def pytest_ignore_collect(path: Any, config: Config) -> bool:
     """Determine if this directory should have its tests collected."""
-    if config.option.functional or config.option.integration:
+    if config.option.benchmark or config.option.functional or config.option.integration:
         return True
     return False
 
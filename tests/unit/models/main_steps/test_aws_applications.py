@@ -0,0 +1,77 @@
+"""Test ssm_dox.models.main_steps.aws_applications."""
+# pylint: disable=no-member,no-self-use
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from ssm_dox.models.main_steps.aws_applications import (
+    AwsApplications,
+    AwsApplicationsInputs,
+)
+
+
+class TestAwsApplications:
+    """Test AwsApplications."""
+
+    action = "aws:applications"
+    inputs: Dict[str, Any] = {
+        "action": "Install",
+        "source": "https://example.com/app.msi",
+    }
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        precondition = {"StringEquals": ["something"]}
+        obj = AwsApplications(
+            action=self.action,
+            inputs={**self.inputs, "finallyStep": True},
+            name="test",
+            precondition=precondition,
+        )
+        assert obj.action == "aws:applications"
+        assert isinstance(obj.inputs, AwsApplicationsInputs)
+        assert obj.inputs.finallyStep is True
+        assert obj.name == "test"
+        assert obj.precondition == precondition
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"action": action, "name": "test"},
+            {"inputs": inputs, "name": "test"},
+            {"action": action, "inputs": inputs},
+        ],
+    )
+    def test_require_fields(self, kwargs: Dict[str, Any]) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsApplications.parse_obj(kwargs)
+        assert len(excinfo.value.errors()) == 1
+
+
+class TestAwsApplicationsInputs:
+    """Test AwsApplicationsInputs."""
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        obj = AwsApplicationsInputs(
+            **{**TestAwsApplications.inputs, "parameters": "/quiet"}
+        )
+        assert obj.parameters == "/quiet"
+
+    def test_optional_fields_default(self) -> None:
+        """Test optional fields default values."""
+        obj = AwsApplicationsInputs(**TestAwsApplications.inputs)
+        assert not obj.parameters
+        assert not obj.sourceHash
+
+    @pytest.mark.parametrize("field", ["action", "source"])
+    def test_require_fields(self, field: str) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsApplicationsInputs.parse_obj(
+                {k: v for k, v in TestAwsApplications.inputs.items() if k != field}
+            )
+        assert len(excinfo.value.errors()) == 1
+        assert excinfo.value.errors()[0]["loc"] == (field,)
@@ -0,0 +1,61 @@
+"""Test ssm_dox.models.main_steps.aws_configuredocker."""
+# pylint: disable=no-member,no-self-use
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from ssm_dox.models.main_steps.aws_configuredocker import (
+    AwsConfigureDocker,
+    AwsConfigureDockerInputs,
+)
+
+
+class TestAwsConfigureDocker:
+    """Test AwsConfigureDocker."""
+
+    action = "aws:configureDocker"
+    inputs: Dict[str, Any] = {"action": "Install"}
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        precondition = {"StringEquals": ["something"]}
+        obj = AwsConfigureDocker(
+            action=self.action,
+            inputs={**self.inputs, "finallyStep": True},
+            name="test",
+            precondition=precondition,
+        )
+        assert obj.action == "aws:configureDocker"
+        assert isinstance(obj.inputs, AwsConfigureDockerInputs)
+        assert obj.inputs.finallyStep is True
+        assert obj.name == "test"
+        assert obj.precondition == precondition
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"action": action, "name": "test"},
+            {"inputs": inputs, "name": "test"},
+            {"action": action, "inputs": inputs},
+        ],
+    )
+    def test_require_fields(self, kwargs: Dict[str, Any]) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsConfigureDocker.parse_obj(kwargs)
+        assert len(excinfo.value.errors()) == 1
+
+
+class TestAwsConfigureDockerInputs:
+    """Test AwsConfigureDockerInputs."""
+
+    @pytest.mark.parametrize("field", ["action"])
+    def test_require_fields(self, field: str) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsConfigureDockerInputs.parse_obj(
+                {k: v for k, v in TestAwsConfigureDocker.inputs.items() if k != field}
+            )
+        assert len(excinfo.value.errors()) == 1
+        assert excinfo.value.errors()[0]["loc"] == (field,)
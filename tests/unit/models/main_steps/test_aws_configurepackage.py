@@ -0,0 +1,78 @@
+"""Test ssm_dox.models.main_steps.aws_configurepackage."""
+# pylint: disable=no-member,no-self-use
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from ssm_dox.models.main_steps.aws_configurepackage import (
+    AwsConfigurePackage,
+    AwsConfigurePackageInputs,
+)
+
+
+class TestAwsConfigurePackage:
+    """Test AwsConfigurePackage."""
+
+    action = "aws:configurePackage"
+    inputs: Dict[str, Any] = {"action": "Install", "name": "AWSPVDriver"}
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        precondition = {"StringEquals": ["something"]}
+        obj = AwsConfigurePackage(
+            action=self.action,
+            inputs={**self.inputs, "finallyStep": True},
+            name="test",
+            precondition=precondition,
+        )
+        assert obj.action == "aws:configurePackage"
+        assert isinstance(obj.inputs, AwsConfigurePackageInputs)
+        assert obj.inputs.finallyStep is True
+        assert obj.name == "test"
+        assert obj.precondition == precondition
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"action": action, "name": "test"},
+            {"inputs": inputs, "name": "test"},
+            {"action": action, "inputs": inputs},
+        ],
+    )
+    def test_require_fields(self, kwargs: Dict[str, Any]) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsConfigurePackage.parse_obj(kwargs)
+        assert len(excinfo.value.errors()) == 1
+
+
+class TestAwsConfigurePackageInputs:
+    """Test AwsConfigurePackageInputs."""
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        obj = AwsConfigurePackageInputs(
+            **{
+                **TestAwsConfigurePackage.inputs,
+                "additionalArguments": {"SSM_key": "value"},
+            }
+        )
+        assert obj.additionalArguments == {"SSM_key": "value"}
+
+    def test_optional_fields_default(self) -> None:
+        """Test optional fields default values."""
+        obj = AwsConfigurePackageInputs(**TestAwsConfigurePackage.inputs)
+        assert not obj.additionalArguments
+        assert not obj.installationType
+        assert not obj.version
+
+    @pytest.mark.parametrize("field", ["action", "name"])
+    def test_require_fields(self, field: str) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsConfigurePackageInputs.parse_obj(
+                {k: v for k, v in TestAwsConfigurePackage.inputs.items() if k != field}
+            )
+        assert len(excinfo.value.errors()) == 1
+        assert excinfo.value.errors()[0]["loc"] == (field,)
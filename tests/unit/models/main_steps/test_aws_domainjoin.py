@@ -0,0 +1,77 @@
+"""Test ssm_dox.models.main_steps.aws_domainjoin."""
+# pylint: disable=no-member,no-self-use
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from ssm_dox.models.main_steps.aws_domainjoin import AwsDomainJoin, AwsDomainJoinInputs
+
+
+class TestAwsDomainJoin:
+    """Test AwsDomainJoin."""
+
+    action = "aws:domainJoin"
+    inputs: Dict[str, Any] = {
+        "directoryId": "d-1234567890",
+        "directoryName": "example.com",
+    }
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        precondition = {"StringEquals": ["something"]}
+        obj = AwsDomainJoin(
+            action=self.action,
+            inputs={**self.inputs, "finallyStep": True},
+            name="test",
+            precondition=precondition,
+        )
+        assert obj.action == "aws:domainJoin"
+        assert isinstance(obj.inputs, AwsDomainJoinInputs)
+        assert obj.inputs.finallyStep is True
+        assert obj.name == "test"
+        assert obj.precondition == precondition
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"action": action, "name": "test"},
+            {"inputs": inputs, "name": "test"},
+            {"action": action, "inputs": inputs},
+        ],
+    )
+    def test_require_fields(self, kwargs: Dict[str, Any]) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsDomainJoin.parse_obj(kwargs)
+        assert len(excinfo.value.errors()) == 1
+
+
+class TestAwsDomainJoinInputs:
+    """Test AwsDomainJoinInputs."""
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        obj = AwsDomainJoinInputs(
+            **{
+                **TestAwsDomainJoin.inputs,
+                "dnsIpAddresses": ["198.51.100.1", "198.51.100.2"],
+            }
+        )
+        assert obj.dnsIpAddresses == ["198.51.100.1", "198.51.100.2"]
+
+    def test_optional_fields_default(self) -> None:
+        """Test optional fields default values."""
+        obj = AwsDomainJoinInputs(**TestAwsDomainJoin.inputs)
+        assert not obj.directoryOU
+        assert not obj.dnsIpAddresses
+
+    @pytest.mark.parametrize("field", ["directoryId", "directoryName"])
+    def test_require_fields(self, field: str) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsDomainJoinInputs.parse_obj(
+                {k: v for k, v in TestAwsDomainJoin.inputs.items() if k != field}
+            )
+        assert len(excinfo.value.errors()) == 1
+        assert excinfo.value.errors()[0]["loc"] == (field,)
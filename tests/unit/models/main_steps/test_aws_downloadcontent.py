@@ -0,0 +1,76 @@
+"""Test ssm_dox.models.main_steps.aws_downloadcontent."""
+# pylint: disable=no-member,no-self-use
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from ssm_dox.models.main_steps.aws_downloadcontent import (
+    AwsDownloadContent,
+    AwsDownloadContentInputs,
+)
+
+
+class TestAwsDownloadContent:
+    """Test AwsDownloadContent."""
+
+    action = "aws:downloadContent"
+    inputs: Dict[str, Any] = {
+        "sourceInfo": {"path": "https://example.com/script.sh"},
+        "sourceType": "HTTP",
+    }
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        precondition = {"StringEquals": ["something"]}
+        obj = AwsDownloadContent(
+            action=self.action,
+            inputs={**self.inputs, "finallyStep": True},
+            name="test",
+            precondition=precondition,
+        )
+        assert obj.action == "aws:downloadContent"
+        assert isinstance(obj.inputs, AwsDownloadContentInputs)
+        assert obj.inputs.finallyStep is True
+        assert obj.name == "test"
+        assert obj.precondition == precondition
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"action": action, "name": "test"},
+            {"inputs": inputs, "name": "test"},
+            {"action": action, "inputs": inputs},
+        ],
+    )
+    def test_require_fields(self, kwargs: Dict[str, Any]) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsDownloadContent.parse_obj(kwargs)
+        assert len(excinfo.value.errors()) == 1
+
+
+class TestAwsDownloadContentInputs:
+    """Test AwsDownloadContentInputs."""
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        obj = AwsDownloadContentInputs(
+            **{**TestAwsDownloadContent.inputs, "destinationPath": "scripts"}
+        )
+        assert obj.destinationPath == "scripts"
+
+    def test_optional_fields_default(self) -> None:
+        """Test optional fields default values."""
+        obj = AwsDownloadContentInputs(**TestAwsDownloadContent.inputs)
+        assert not obj.destinationPath
+
+    @pytest.mark.parametrize("field", ["sourceInfo", "sourceType"])
+    def test_require_fields(self, field: str) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsDownloadContentInputs.parse_obj(
+                {k: v for k, v in TestAwsDownloadContent.inputs.items() if k != field}
+            )
+        assert len(excinfo.value.errors()) == 1
+        assert excinfo.value.errors()[0]["loc"] == (field,)
@@ -0,0 +1,73 @@
+"""Test ssm_dox.models.main_steps.aws_psmodule."""
+# pylint: disable=no-member,no-self-use
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from ssm_dox.models.main_steps.aws_psmodule import AwsPsModule, AwsPsModuleInputs
+
+
+class TestAwsPsModule:
+    """Test AwsPsModule."""
+
+    action = "aws:psModule"
+    inputs: Dict[str, Any] = {"source": "https://example.com/module.zip"}
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        precondition = {"StringEquals": ["something"]}
+        obj = AwsPsModule(
+            action=self.action,
+            inputs={**self.inputs, "finallyStep": True},
+            name="test",
+            precondition=precondition,
+        )
+        assert obj.action == "aws:psModule"
+        assert isinstance(obj.inputs, AwsPsModuleInputs)
+        assert obj.inputs.finallyStep is True
+        assert obj.name == "test"
+        assert obj.precondition == precondition
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"action": action, "name": "test"},
+            {"inputs": inputs, "name": "test"},
+            {"action": action, "inputs": inputs},
+        ],
+    )
+    def test_require_fields(self, kwargs: Dict[str, Any]) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsPsModule.parse_obj(kwargs)
+        assert len(excinfo.value.errors()) == 1
+
+
+class TestAwsPsModuleInputs:
+    """Test AwsPsModuleInputs."""
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        obj = AwsPsModuleInputs(
+            **{**TestAwsPsModule.inputs, "runCommand": ["Import-Module Example"]}
+        )
+        assert obj.runCommand == ["Import-Module Example"]
+
+    def test_optional_fields_default(self) -> None:
+        """Test optional fields default values."""
+        obj = AwsPsModuleInputs(**TestAwsPsModule.inputs)
+        assert not obj.runCommand
+        assert not obj.sourceHash
+        assert not obj.timeoutSeconds
+        assert not obj.workingDirectory
+
+    @pytest.mark.parametrize("field", ["source"])
+    def test_require_fields(self, field: str) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsPsModuleInputs.parse_obj(
+                {k: v for k, v in TestAwsPsModule.inputs.items() if k != field}
+            )
+        assert len(excinfo.value.errors()) == 1
+        assert excinfo.value.errors()[0]["loc"] == (field,)
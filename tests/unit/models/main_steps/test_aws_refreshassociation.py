@@ -0,0 +1,62 @@
+"""Test ssm_dox.models.main_steps.aws_refreshassociation."""
+# pylint: disable=no-member,no-self-use
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from ssm_dox.models.main_steps.aws_refreshassociation import (
+    AwsRefreshAssociation,
+    AwsRefreshAssociationInputs,
+)
+
+
+class TestAwsRefreshAssociation:
+    """Test AwsRefreshAssociation."""
+
+    action = "aws:refreshAssociation"
+    inputs: Dict[str, Any] = {}
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        precondition = {"StringEquals": ["something"]}
+        obj = AwsRefreshAssociation(
+            action=self.action,
+            inputs={**self.inputs, "finallyStep": True},
+            name="test",
+            precondition=precondition,
+        )
+        assert obj.action == "aws:refreshAssociation"
+        assert isinstance(obj.inputs, AwsRefreshAssociationInputs)
+        assert obj.inputs.finallyStep is True
+        assert obj.name == "test"
+        assert obj.precondition == precondition
+
+    def test_optional_fields_default(self) -> None:
+        """Test optional fields default values."""
+        obj = AwsRefreshAssociation(action=self.action, name="test")
+        assert not obj.inputs
+        assert obj.precondition is None
+
+    @pytest.mark.parametrize("kwargs", [{"action": action}, {"name": "test"}])
+    def test_require_fields(self, kwargs: Dict[str, Any]) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsRefreshAssociation.parse_obj(kwargs)
+        assert len(excinfo.value.errors()) == 1
+
+
+class TestAwsRefreshAssociationInputs:
+    """Test AwsRefreshAssociationInputs."""
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        obj = AwsRefreshAssociationInputs(
+            **{**TestAwsRefreshAssociation.inputs, "associationIds": ["abc123"]}
+        )
+        assert obj.associationIds == ["abc123"]
+
+    def test_optional_fields_default(self) -> None:
+        """Test optional fields default values."""
+        obj = AwsRefreshAssociationInputs(**TestAwsRefreshAssociation.inputs)
+        assert not obj.associationIds
@@ -0,0 +1,81 @@
+"""Test ssm_dox.models.main_steps.aws_rundockeraction."""
+# pylint: disable=no-member,no-self-use
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from ssm_dox.models.main_steps.aws_rundockeraction import (
+    AwsRunDockerAction,
+    AwsRunDockerActionInputs,
+)
+
+
+class TestAwsRunDockerAction:
+    """Test AwsRunDockerAction."""
+
+    action = "aws:runDockerAction"
+    inputs: Dict[str, Any] = {"action": "Run"}
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        precondition = {"StringEquals": ["something"]}
+        obj = AwsRunDockerAction(
+            action=self.action,
+            inputs={**self.inputs, "finallyStep": True},
+            name="test",
+            precondition=precondition,
+        )
+        assert obj.action == "aws:runDockerAction"
+        assert isinstance(obj.inputs, AwsRunDockerActionInputs)
+        assert obj.inputs.finallyStep is True
+        assert obj.name == "test"
+        assert obj.precondition == precondition
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"action": action, "name": "test"},
+            {"inputs": inputs, "name": "test"},
+            {"action": action, "inputs": inputs},
+        ],
+    )
+    def test_require_fields(self, kwargs: Dict[str, Any]) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsRunDockerAction.parse_obj(kwargs)
+        assert len(excinfo.value.errors()) == 1
+
+
+class TestAwsRunDockerActionInputs:
+    """Test AwsRunDockerActionInputs."""
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        obj = AwsRunDockerActionInputs(
+            **{**TestAwsRunDockerAction.inputs, "volume": ["C:\\\\data:C:\\\\data"]}
+        )
+        assert obj.volume == ["C:\\\\data:C:\\\\data"]
+
+    def test_optional_fields_default(self) -> None:
+        """Test optional fields default values."""
+        obj = AwsRunDockerActionInputs(**TestAwsRunDockerAction.inputs)
+        assert not obj.cmd
+        assert not obj.container
+        assert not obj.cpuShares
+        assert not obj.env
+        assert not obj.image
+        assert not obj.memory
+        assert not obj.publish
+        assert not obj.user
+        assert not obj.volume
+
+    @pytest.mark.parametrize("field", ["action"])
+    def test_require_fields(self, field: str) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsRunDockerActionInputs.parse_obj(
+                {k: v for k, v in TestAwsRunDockerAction.inputs.items() if k != field}
+            )
+        assert len(excinfo.value.errors()) == 1
+        assert excinfo.value.errors()[0]["loc"] == (field,)
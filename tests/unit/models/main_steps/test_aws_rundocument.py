@@ -0,0 +1,79 @@
+"""Test ssm_dox.models.main_steps.aws_rundocument."""
+# pylint: disable=no-member,no-self-use
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from ssm_dox.models.main_steps.aws_rundocument import (
+    AwsRunDocument,
+    AwsRunDocumentInputs,
+)
+
+
+class TestAwsRunDocument:
+    """Test AwsRunDocument."""
+
+    action = "aws:runDocument"
+    inputs: Dict[str, Any] = {
+        "documentPath": "AWS-RunShellScript",
+        "documentType": "SSMDocument",
+    }
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        precondition = {"StringEquals": ["something"]}
+        obj = AwsRunDocument(
+            action=self.action,
+            inputs={**self.inputs, "finallyStep": True},
+            name="test",
+            precondition=precondition,
+        )
+        assert obj.action == "aws:runDocument"
+        assert isinstance(obj.inputs, AwsRunDocumentInputs)
+        assert obj.inputs.finallyStep is True
+        assert obj.name == "test"
+        assert obj.precondition == precondition
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"action": action, "name": "test"},
+            {"inputs": inputs, "name": "test"},
+            {"action": action, "inputs": inputs},
+        ],
+    )
+    def test_require_fields(self, kwargs: Dict[str, Any]) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsRunDocument.parse_obj(kwargs)
+        assert len(excinfo.value.errors()) == 1
+
+
+class TestAwsRunDocumentInputs:
+    """Test AwsRunDocumentInputs."""
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        obj = AwsRunDocumentInputs(
+            **{
+                **TestAwsRunDocument.inputs,
+                "documentParameters": {"commands": ["echo test"]},
+            }
+        )
+        assert obj.documentParameters == {"commands": ["echo test"]}
+
+    def test_optional_fields_default(self) -> None:
+        """Test optional fields default values."""
+        obj = AwsRunDocumentInputs(**TestAwsRunDocument.inputs)
+        assert not obj.documentParameters
+
+    @pytest.mark.parametrize("field", ["documentPath", "documentType"])
+    def test_require_fields(self, field: str) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsRunDocumentInputs.parse_obj(
+                {k: v for k, v in TestAwsRunDocument.inputs.items() if k != field}
+            )
+        assert len(excinfo.value.errors()) == 1
+        assert excinfo.value.errors()[0]["loc"] == (field,)
@@ -0,0 +1,72 @@
+"""Test ssm_dox.models.main_steps.aws_softwareinventory."""
+# pylint: disable=no-member,no-self-use
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from ssm_dox.models.main_steps.aws_softwareinventory import (
+    AwsSoftwareInventory,
+    AwsSoftwareInventoryInputs,
+)
+
+
+class TestAwsSoftwareInventory:
+    """Test AwsSoftwareInventory."""
+
+    action = "aws:softwareInventory"
+    inputs: Dict[str, Any] = {}
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        precondition = {"StringEquals": ["something"]}
+        obj = AwsSoftwareInventory(
+            action=self.action,
+            inputs={**self.inputs, "finallyStep": True},
+            name="test",
+            precondition=precondition,
+        )
+        assert obj.action == "aws:softwareInventory"
+        assert isinstance(obj.inputs, AwsSoftwareInventoryInputs)
+        assert obj.inputs.finallyStep is True
+        assert obj.name == "test"
+        assert obj.precondition == precondition
+
+    def test_optional_fields_default(self) -> None:
+        """Test optional fields default values."""
+        obj = AwsSoftwareInventory(action=self.action, name="test")
+        assert not obj.inputs
+        assert obj.precondition is None
+
+    @pytest.mark.parametrize("kwargs", [{"action": action}, {"name": "test"}])
+    def test_require_fields(self, kwargs: Dict[str, Any]) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsSoftwareInventory.parse_obj(kwargs)
+        assert len(excinfo.value.errors()) == 1
+
+
+class TestAwsSoftwareInventoryInputs:
+    """Test AwsSoftwareInventoryInputs."""
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        obj = AwsSoftwareInventoryInputs(
+            **{**TestAwsSoftwareInventory.inputs, "applications": "{{ applications }}"}
+        )
+        assert obj.applications == "{{ applications }}"
+
+    def test_optional_fields_default(self) -> None:
+        """Test optional fields default values."""
+        obj = AwsSoftwareInventoryInputs(**TestAwsSoftwareInventory.inputs)
+        assert not obj.applications
+        assert not obj.awsComponents
+        assert not obj.billingInfo
+        assert not obj.customInventory
+        assert not obj.files
+        assert not obj.instanceDetailedInformation
+        assert not obj.networkConfig
+        assert not obj.services
+        assert not obj.windowsRegistry
+        assert not obj.windowsRoles
+        assert not obj.windowsUpdates
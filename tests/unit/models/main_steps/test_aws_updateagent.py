@@ -0,0 +1,77 @@
+"""Test ssm_dox.models.main_steps.aws_updateagent."""
+# pylint: disable=no-member,no-self-use
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from ssm_dox.models.main_steps.aws_updateagent import (
+    AwsUpdateAgent,
+    AwsUpdateAgentInputs,
+)
+
+
+class TestAwsUpdateAgent:
+    """Test AwsUpdateAgent."""
+
+    action = "aws:updateAgent"
+    inputs: Dict[str, Any] = {
+        "agentName": "Ec2Config",
+        "source": "https://example.com/manifest.json",
+    }
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        precondition = {"StringEquals": ["something"]}
+        obj = AwsUpdateAgent(
+            action=self.action,
+            inputs={**self.inputs, "finallyStep": True},
+            name="test",
+            precondition=precondition,
+        )
+        assert obj.action == "aws:updateAgent"
+        assert isinstance(obj.inputs, AwsUpdateAgentInputs)
+        assert obj.inputs.finallyStep is True
+        assert obj.name == "test"
+        assert obj.precondition == precondition
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"action": action, "name": "test"},
+            {"inputs": inputs, "name": "test"},
+            {"action": action, "inputs": inputs},
+        ],
+    )
+    def test_require_fields(self, kwargs: Dict[str, Any]) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsUpdateAgent.parse_obj(kwargs)
+        assert len(excinfo.value.errors()) == 1
+
+
+class TestAwsUpdateAgentInputs:
+    """Test AwsUpdateAgentInputs."""
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        obj = AwsUpdateAgentInputs(
+            **{**TestAwsUpdateAgent.inputs, "allowDowngrade": False}
+        )
+        assert obj.allowDowngrade is False
+
+    def test_optional_fields_default(self) -> None:
+        """Test optional fields default values."""
+        obj = AwsUpdateAgentInputs(**TestAwsUpdateAgent.inputs)
+        assert not obj.allowDowngrade
+        assert not obj.targetVersion
+
+    @pytest.mark.parametrize("field", ["agentName", "source"])
+    def test_require_fields(self, field: str) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsUpdateAgentInputs.parse_obj(
+                {k: v for k, v in TestAwsUpdateAgent.inputs.items() if k != field}
+            )
+        assert len(excinfo.value.errors()) == 1
+        assert excinfo.value.errors()[0]["loc"] == (field,)
@@ -0,0 +1,77 @@
+"""Test ssm_dox.models.main_steps.aws_updatessmagent."""
+# pylint: disable=no-member,no-self-use
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from ssm_dox.models.main_steps.aws_updatessmagent import (
+    AwsUpdateSsmAgent,
+    AwsUpdateSsmAgentInputs,
+)
+
+
+class TestAwsUpdateSsmAgent:
+    """Test AwsUpdateSsmAgent."""
+
+    action = "aws:updateSsmAgent"
+    inputs: Dict[str, Any] = {
+        "agentName": "amazon-ssm-agent",
+        "source": "https://example.com/manifest.json",
+    }
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        precondition = {"StringEquals": ["something"]}
+        obj = AwsUpdateSsmAgent(
+            action=self.action,
+            inputs={**self.inputs, "finallyStep": True},
+            name="test",
+            precondition=precondition,
+        )
+        assert obj.action == "aws:updateSsmAgent"
+        assert isinstance(obj.inputs, AwsUpdateSsmAgentInputs)
+        assert obj.inputs.finallyStep is True
+        assert obj.name == "test"
+        assert obj.precondition == precondition
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"action": action, "name": "test"},
+            {"inputs": inputs, "name": "test"},
+            {"action": action, "inputs": inputs},
+        ],
+    )
+    def test_require_fields(self, kwargs: Dict[str, Any]) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsUpdateSsmAgent.parse_obj(kwargs)
+        assert len(excinfo.value.errors()) == 1
+
+
+class TestAwsUpdateSsmAgentInputs:
+    """Test AwsUpdateSsmAgentInputs."""
+
+    def test_optional_fields(self) -> None:
+        """Test optional fields."""
+        obj = AwsUpdateSsmAgentInputs(
+            **{**TestAwsUpdateSsmAgent.inputs, "allowDowngrade": "{{ allowDowngrade }}"}
+        )
+        assert obj.allowDowngrade == "{{ allowDowngrade }}"
+
+    def test_optional_fields_default(self) -> None:
+        """Test optional fields default values."""
+        obj = AwsUpdateSsmAgentInputs(**TestAwsUpdateSsmAgent.inputs)
+        assert not obj.allowDowngrade
+        assert not obj.targetVersion
+
+    @pytest.mark.parametrize("field", ["agentName", "source"])
+    def test_require_fields(self, field: str) -> None:
+        """Test required fields."""
+        with pytest.raises(ValidationError) as excinfo:
+            AwsUpdateSsmAgentInputs.parse_obj(
+                {k: v for k, v in TestAwsUpdateSsmAgent.inputs.items() if k != field}
+            )
+        assert len(excinfo.value.errors()) == 1
+        assert excinfo.value.errors()[0]["loc"] == (field,)
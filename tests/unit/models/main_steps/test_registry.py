@@ -0,0 +1,175 @@
+"""Test ssm_dox.models.main_steps.registry."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+from typing import TYPE_CHECKING
+
+import pytest
+from mock import MagicMock
+
+from ssm_dox.models.main_steps import MAIN_STEP_TYPES
+from ssm_dox.models.main_steps.aws_runshellscript import AwsRunShellScript
+from ssm_dox.models.main_steps.base import SsmDocumentMainStep
+from ssm_dox.models.main_steps.registry import (
+    BUILTIN_MAIN_STEPS,
+    ENTRY_POINT_GROUP,
+    MainStepLoadError,
+    MainStepRegistry,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock import MockerFixture
+
+MODULE = "ssm_dox.models.main_steps.registry"
+
+PLUGIN = """
+from typing import Literal
+
+from ssm_dox.models.main_steps.base import SsmDocumentMainStep
+
+
+class PluginStep(SsmDocumentMainStep):
+    action: Literal["test:plugin"]
+
+
+NOT_A_MODEL = object()
+"""
+
+
+@pytest.fixture
+def plugin_module(monkeypatch: MonkeyPatch, tmp_path: Path) -> str:
+    """Name of a module that provides a mainStep data model."""
+    name = f"ssm_dox_test_plugin_{tmp_path.name}"
+    (tmp_path / f"{name}.py").write_text(PLUGIN)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return name
+
+
+def mock_entry_points(mocker: MockerFixture, *entry_points: EntryPoint) -> MagicMock:
+    """Mock the entry points that are installed."""
+    result = MagicMock()
+    result.select.return_value = list(entry_points)
+    return mocker.patch(f"{MODULE}.entry_points", return_value=result)
+
+
+class TestMainStepRegistry:
+    """Test MainStepRegistry."""
+
+    def test_builtin(self) -> None:
+        """Test every built-in data model can be loaded."""
+        registry = MainStepRegistry(BUILTIN_MAIN_STEPS, group=None)
+        assert list(registry) == sorted(BUILTIN_MAIN_STEPS)
+        for action, model in registry.items():
+            assert model.__fields__["action"].type_.__args__ == (action,)
+
+    def test_builtin_lazy(self, root_dir: Path) -> None:
+        """Test data models are not imported until their action is used."""
+        code = (
+            "import sys; import ssm_dox._cli.main; "
+            "from ssm_dox.models.document import SsmDocumentDataModel as M; "
+            "M.parse_obj({'mainSteps': [{'action': 'aws:runShellScript', "
+            "'name': 'test'}]}); "
+            "print(sorted(m for m in sys.modules if '.main_steps.aws_' in m))"
+        )
+        assert subprocess.check_output(
+            [sys.executable, "-c", code], cwd=root_dir, text=True
+        ).strip() == str(["ssm_dox.models.main_steps.aws_runshellscript"])
+
+    def test_contains(self) -> None:
+        """Test __contains__ does not import the data model."""
+        registry = MainStepRegistry({"test:step": "invalid:Invalid"}, group=None)
+        assert "test:step" in registry
+        assert "test:other" not in registry
+
+    def test_delitem(self) -> None:
+        """Test __delitem__."""
+        registry = MainStepRegistry({"test:step": "invalid:Invalid"}, group=None)
+        registry["test:model"] = AwsRunShellScript
+        del registry["test:step"]
+        del registry["test:model"]
+        assert not registry
+        with pytest.raises(KeyError):
+            del registry["test:step"]
+
+    def test_getitem(self, plugin_module: str) -> None:
+        """Test __getitem__ importing the data model once."""
+        registry = MainStepRegistry(
+            {"test:plugin": f"{plugin_module}:PluginStep"}, group=None
+        )
+        assert plugin_module not in sys.modules
+        model = registry["test:plugin"]
+        assert plugin_module in sys.modules
+        assert issubclass(model, SsmDocumentMainStep)
+        assert registry["test:plugin"] is model
+        with pytest.raises(KeyError):
+            registry["test:other"]  # pylint: disable=pointless-statement
+
+    @pytest.mark.parametrize(
+        "attr, error",
+        [
+            ("Missing", "has no attribute 'Missing'"),
+            ("NOT_A_MODEL", "NOT_A_MODEL is not a mainStep data model"),
+        ],
+    )
+    def test_getitem_invalid(self, attr: str, error: str, plugin_module: str) -> None:
+        """Test __getitem__ with an invalid import path."""
+        registry = MainStepRegistry({"test:plugin": f"{plugin_module}:{attr}"})
+        with pytest.raises(MainStepLoadError, match=error):
+            registry["test:plugin"]  # pylint: disable=pointless-statement
+        assert not registry.get("test:other")
+
+    def test_getitem_module_not_found(self) -> None:
+        """Test __getitem__ with a module that does not exist."""
+        registry = MainStepRegistry({"test:step": "ssm_dox_missing:Step"}, group=None)
+        with pytest.raises(MainStepLoadError, match="No module named"):
+            registry["test:step"]  # pylint: disable=pointless-statement
+
+    def test_len(self) -> None:
+        """Test __len__."""
+        registry = MainStepRegistry({"test:step": "invalid:Invalid"}, group=None)
+        registry["test:model"] = AwsRunShellScript
+        assert len(registry) == 2
+
+    def test_scan(self, mocker: MockerFixture, plugin_module: str) -> None:
+        """Test plugins are only found when an action is not registered."""
+        mock_entry_points_ = mock_entry_points(
+            mocker,
+            EntryPoint("aws:runShellScript", "invalid:Invalid", ENTRY_POINT_GROUP),
+            EntryPoint("test:plugin", f"{plugin_module}:PluginStep", ENTRY_POINT_GROUP),
+        )
+        registry = MainStepRegistry(BUILTIN_MAIN_STEPS)
+        assert registry["aws:runShellScript"] is AwsRunShellScript
+        mock_entry_points_.assert_not_called()
+        assert registry["test:plugin"].__name__ == "PluginStep"
+        mock_entry_points_.return_value.select.assert_called_once_with(
+            group=ENTRY_POINT_GROUP
+        )
+        assert registry["aws:runShellScript"] is AwsRunShellScript
+        assert not registry.get("test:other")
+        mock_entry_points_.assert_called_once()
+
+    def test_scan_iter(self, mocker: MockerFixture) -> None:
+        """Test plugins are found when every action is listed."""
+        mock_entry_points(
+            mocker, EntryPoint("test:plugin", "invalid:Invalid", ENTRY_POINT_GROUP)
+        )
+        assert "test:plugin" in list(MainStepRegistry(BUILTIN_MAIN_STEPS))
+
+    def test_setitem(self, plugin_module: str) -> None:
+        """Test __setitem__ replacing a data model."""
+        registry = MainStepRegistry(BUILTIN_MAIN_STEPS, group=None)
+        registry["aws:runShellScript"] = f"{plugin_module}:PluginStep"
+        assert registry["aws:runShellScript"].__name__ == "PluginStep"
+        registry["aws:runShellScript"] = AwsRunShellScript
+        assert registry["aws:runShellScript"] is AwsRunShellScript
+
+    def test_main_step_types(self) -> None:
+        """Test the default registry."""
+        assert MAIN_STEP_TYPES.group == ENTRY_POINT_GROUP
+        assert set(BUILTIN_MAIN_STEPS).issubset(MAIN_STEP_TYPES)
@@ -1,9 +1,20 @@
 """Test ssm_dox.models.base."""
 # pylint: disable=no-self-use,unneeded-not
+from __future__ import annotations
+
 import json
-from typing import Optional
+import pickle
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import pytest
 
 from ssm_dox.models.base import BaseModel
+from ssm_dox.serializer import serialize
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+MODULE = "ssm_dox.models.base"
 
 
 class SampleModel(BaseModel):
@@ -12,6 +23,14 @@ class SampleModel(BaseModel):
     value: Optional[str] = None
 
 
+class NestedModel(BaseModel):
+    """Nested model for testing."""
+
+    items: List[SampleModel] = []
+    mapping: Optional[Dict[str, List[str]]] = None
+    sample: SampleModel = SampleModel()
+
+
 class TestBaseModel:
     """Test BaseModel."""
 
@@ -23,6 +42,23 @@ class TestBaseModel:
         """Test __bool__ True."""
         assert SampleModel(value="test")
 
+    def test_bool_defaults(self) -> None:
+        """Test __bool__ ignores fields set to their default value."""
+        assert not NestedModel(items=[], sample=SampleModel())
+        assert NestedModel(sample=SampleModel(value="test"))
+        assert NestedModel(items=[SampleModel()])
+
+    def test_copy(self) -> None:
+        """Test copy does not reuse the cached fingerprint."""
+        obj = SampleModel(value="test")
+        assert obj.fingerprint
+        assert obj == json.dumps({"value": "test"}, indent=4)
+        assert obj.copy(update={"value": "something"}) == SampleModel(value="something")
+        assert obj.copy(update={"value": "something"}) == json.dumps(
+            {"value": "something"}, indent=4
+        )
+        assert not SampleModel().copy(update={"value": "test"}) == SampleModel()
+
     def test_eq(self) -> None:
         """Test __eq__."""
         assert SampleModel(value="test") == SampleModel(value="test")
@@ -34,6 +70,59 @@ class TestBaseModel:
         assert SampleModel(value="test") == {"value": "test"}
         assert not SampleModel(value="test") == {"value": "something"}
 
+    def test_eq_nested(self) -> None:
+        """Test __eq__ with nested data models."""
+        data = {
+            "items": [{"value": "a"}, {"value": "b"}],
+            "mapping": {"key": ["value"]},
+            "sample": {"value": "c"},
+        }
+        obj = NestedModel.parse_obj(data)
+        assert obj == NestedModel.parse_obj(data)
+        assert obj == data
+        assert obj == {**data, "sample": SampleModel(value="c")}
+        assert not obj == {**data, "items": [{"value": "b"}, {"value": "a"}]}
+        assert not obj == {**data, "mapping": {"key": ("value", "other")}}
+        assert not obj == NestedModel.parse_obj({**data, "sample": {}})
+        assert not obj == ["items", "mapping", "sample"]
+
+    def test_eq_str(self, mocker: MockerFixture) -> None:
+        """Test __eq__ with a string only serializes the data model once."""
+        mock_serialize = mocker.patch(f"{MODULE}.serialize", wraps=serialize)
+        obj = NestedModel(items=[SampleModel(value="test")])
+        expected = obj.json(exclude_none=True, indent=4)
+        assert obj == expected
+        assert not obj == expected + "\n"
+        mock_serialize.assert_called_once_with(obj)
+
+    def test_fingerprint(self) -> None:
+        """Test fingerprint."""
+        obj = NestedModel(items=[SampleModel(value="test")])
+        assert obj.fingerprint is obj.fingerprint
+        assert dict(obj.fingerprint)["items"][0] is obj.items[0].fingerprint
+        assert obj.fingerprint == NestedModel.parse_obj(obj.dict()).fingerprint
+
+    def test_hash(self) -> None:
+        """Test __hash__."""
+        assert hash(SampleModel(value="test")) == hash(SampleModel(value="test"))
+        assert len({SampleModel(value="test"), SampleModel(value="test")}) == 1
+
+    def test_immutable(self) -> None:
+        """Test data models can't be modified."""
+        obj = SampleModel(value="test")
+        with pytest.raises(TypeError):
+            obj.value = "something"  # type: ignore
+        assert obj.value == "test"
+
+    def test_pickle(self) -> None:
+        """Test pickling does not include cached values."""
+        obj = NestedModel(items=[SampleModel(value="test")])
+        assert obj.fingerprint and obj and obj == obj.json(exclude_none=True, indent=4)
+        result = pickle.loads(pickle.dumps(obj))
+        assert result._fingerprint is None  # pylint: disable=protected-access
+        assert result._json is None  # pylint: disable=protected-access
+        assert result == obj
+
     def test_ne(self) -> None:
         """Test __ne__."""
         assert SampleModel(value="test") != SampleModel(value="something")
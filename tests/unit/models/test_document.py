@@ -1,12 +1,17 @@
 """Test ssm_dox.models.document."""
 # pylint: disable=no-self-use,unsubscriptable-object
-from typing import Dict
+from typing import Dict, Optional
 
 import pytest
 from pydantic import ValidationError
 
 from ssm_dox.models.document import SsmDocumentDataModel
-from ssm_dox.models.main_steps import AwsRunShellScript
+from ssm_dox.models.main_steps import (
+    MAIN_STEP_TYPES,
+    AwsRunPowerShellScript,
+    AwsRunShellScript,
+)
+from ssm_dox.models.main_steps.base import SsmDocumentMainStep
 from ssm_dox.models.parameter import SsmDocumentParameterDataModel
 
 
@@ -21,6 +26,71 @@ class TestSsmDocumentDataModel:
         )
     ]
 
+    def test_main_steps(self) -> None:
+        """Test mainSteps are validated as the data model for their action."""
+        actions = ["aws:runPowerShellScript", "aws:runShellScript"]
+        obj = SsmDocumentDataModel.parse_obj(
+            {
+                "mainSteps": [
+                    {"action": action, "name": f"step{index}"}
+                    for index, action in enumerate(actions)
+                ]
+            }
+        )
+        assert [type(step) for step in obj.mainSteps] == [
+            MAIN_STEP_TYPES[action] for action in actions
+        ]
+        assert SsmDocumentDataModel(mainSteps=obj.mainSteps).mainSteps[0] is (
+            obj.mainSteps[0]
+        )
+
+    def test_main_steps_invalid(self) -> None:
+        """Test mainSteps only report the errors of the matching data model."""
+        with pytest.raises(ValidationError) as excinfo:
+            SsmDocumentDataModel.parse_obj(
+                {
+                    "mainSteps": [
+                        {
+                            "action": "aws:runPowerShellScript",
+                            "inputs": {"runCommand": "invalid"},
+                            "name": "test",
+                        },
+                        "invalid",
+                    ]
+                }
+            )
+        assert [(e["loc"], e["type"]) for e in excinfo.value.errors()] == [
+            (("mainSteps", 0, "inputs", "runCommand"), "type_error.list"),
+            (("mainSteps", 1), "type_error.dict"),
+        ]
+
+    @pytest.mark.parametrize("action", [None, "aws:invalid"])
+    def test_main_steps_unsupported_action(self, action: Optional[str]) -> None:
+        """Test mainSteps with an action that is missing or not supported."""
+        with pytest.raises(ValidationError) as excinfo:
+            SsmDocumentDataModel.parse_obj(
+                {"mainSteps": [{"action": action, "name": "test"}]}
+            )
+        expected = ", ".join(MAIN_STEP_TYPES)
+        assert "aws:runDockerAction, aws:runDocument" in expected
+        assert excinfo.value.errors() == [
+            {
+                "ctx": {"action": action, "expected": expected},
+                "loc": ("mainSteps", 0),
+                "msg": f"unsupported action {action!r}; expected one of {expected}",
+                "type": "value_error.main_step.action",
+            }
+        ]
+
+    def test_main_steps_model(self) -> None:
+        """Test mainSteps that are another data model are validated again."""
+        obj = SsmDocumentDataModel(
+            mainSteps=[
+                SsmDocumentMainStep(action="aws:runPowerShellScript", name="test")
+            ]
+        )
+        assert isinstance(obj.mainSteps[0], AwsRunPowerShellScript)
+
     def test_optional_fields(self) -> None:
         """Test optional fields."""
         obj = SsmDocumentDataModel(
@@ -0,0 +1,203 @@
+"""Test ssm_dox.builder."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import pytest
+
+from ssm_dox.builder import Builder, BuildSummary, build_dox
+from ssm_dox.cache.build import BuildCache
+from ssm_dox.cache.dependencies import DependencyGraph
+from ssm_dox.dox import Dox
+from ssm_dox.finder import Finder
+from ssm_dox.manifest import BuildManifest
+from ssm_dox.models.document import SsmDocumentDataModel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.logging import LogCaptureFixture
+    from pytest_mock import MockerFixture
+
+
+def make_invalid_dox(root_dir: Path) -> Dox:
+    """Create a Dox that fails to build."""
+    path = root_dir / "Invalid"
+    path.mkdir(parents=True)
+    (path / "template.yml").write_text("mainSteps: not-a-list\n")
+    return Dox(path=path, root_dir=root_dir)
+
+
+class TestBuilder:
+    """Test Builder."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_build(
+        self,
+        caplog: LogCaptureFixture,
+        documents_dir: Path,
+        dox_dir: Path,
+        jobs: int,
+        tmp_path: Path,
+    ) -> None:
+        """Test build."""
+        caplog.set_level(logging.INFO, logger="ssm_dox")
+        dox = Finder(dox_dir).dox
+        assert Builder(tmp_path, jobs=jobs).build(dox) == BuildSummary(
+            built=2, failed=0, skipped=0, unchanged=0
+        )
+        for name in ["ExampleLinux.json", "ExampleWindows.json"]:
+            assert SsmDocumentDataModel.parse_file(
+                tmp_path / name
+            ) == SsmDocumentDataModel.parse_file(documents_dir / name)
+        assert [m for m in caplog.messages if m.startswith("building")] == [
+            "building ExampleLinux...",
+            "building ExampleWindows...",
+        ]
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_build_callback(self, dox_dir: Path, jobs: int, tmp_path: Path) -> None:
+        """Test build calling a callback with each result in order."""
+        handled: List[Tuple[str, Optional[bytes]]] = []
+        Builder(tmp_path, body=True, jobs=jobs).build(
+            Finder(dox_dir).dox,
+            callback=lambda dox, result: handled.append(
+                (dox.name, result.body if result else None)
+            ),
+        )
+        assert [name for name, _ in handled] == ["ExampleLinux", "ExampleWindows"]
+        for name, body in handled:
+            assert body and body + b"\n" == (tmp_path / f"{name}.json").read_bytes()
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_build_manifest(self, dox_dir: Path, jobs: int, tmp_path: Path) -> None:
+        """Test build records built documents in a manifest."""
+        output = tmp_path / "output"
+        output.mkdir()
+        (output / "Removed.json").write_text("{}")
+        manifest = BuildManifest(output)
+        manifest.record(output / "Removed.json", {"size": 2})
+        manifest.record(output / "Gone.json", {"size": 2})
+        Builder(output, jobs=jobs, manifest=manifest).build(
+            [*Finder(dox_dir).dox, make_invalid_dox(tmp_path / "dox")]
+        )
+        entries = BuildManifest(output).entries
+        assert sorted(entries) == [
+            "ExampleLinux.json",
+            "ExampleWindows.json",
+            "Removed.json",
+        ]
+        assert entries["ExampleLinux.json"]["dox"] == "ExampleLinux"
+        assert entries["ExampleLinux.json"]["size"] == (
+            (output / "ExampleLinux.json").stat().st_size
+        )
+
+    def test_build_manifest_empty(self, tmp_path: Path) -> None:
+        """Test build does not create an empty manifest."""
+        manifest = BuildManifest(tmp_path)
+        Builder(tmp_path, manifest=manifest).build([])
+        assert not manifest.path.exists()
+
+    def test_build_manifest_unchanged(
+        self, dox_dir: Path, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test build does not save a manifest that did not change."""
+        Builder(tmp_path, manifest=BuildManifest(tmp_path)).build(Finder(dox_dir).dox)
+        manifest = BuildManifest(tmp_path)
+        spy_save = mocker.spy(manifest, "save")
+        Builder(tmp_path, manifest=manifest).build(Finder(dox_dir).dox)
+        spy_save.assert_not_called()
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_build_graph(self, dox_dir: Path, jobs: int, tmp_path: Path) -> None:
+        """Test build records included files in a dependency graph."""
+        graph = DependencyGraph(tmp_path / "graph.json")
+        Builder(tmp_path / "output", graph=graph, jobs=jobs).build(
+            [*Finder(dox_dir).dox, make_invalid_dox(tmp_path / "dox")]
+        )
+        assert DependencyGraph(graph.path).entries == {
+            str(dox_dir.absolute() / "ExampleLinux" / "template.yml"): [
+                str(dox_dir.absolute() / "ExampleLinux" / "script.sh")
+            ],
+            str(dox_dir.absolute() / "ExampleWindows" / "template.yml"): [
+                str(dox_dir.absolute() / "ExampleWindows" / "script.ps1")
+            ],
+        }
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_build_cache(self, dox_dir: Path, jobs: int, tmp_path: Path) -> None:
+        """Test build with cache."""
+        output = tmp_path / "output"
+        cache = BuildCache(tmp_path / "cache.json")
+        dox = Finder(dox_dir).dox
+        assert Builder(output, cache=cache, jobs=jobs).build(dox) == BuildSummary(
+            built=2, failed=0, skipped=0, unchanged=0
+        )
+        assert cache.path.is_file()
+        assert Builder(output, cache=BuildCache(cache.path), jobs=jobs).build(
+            dox
+        ) == BuildSummary(built=0, failed=0, skipped=2, unchanged=0)
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_build_failed(
+        self, caplog: LogCaptureFixture, dox_dir: Path, jobs: int, tmp_path: Path
+    ) -> None:
+        """Test build continues after a Dox fails to build."""
+        caplog.set_level(logging.INFO, logger="ssm_dox")
+        output = tmp_path / "output"
+        cache = BuildCache(tmp_path / "cache.json")
+        dox: List[Dox] = [
+            make_invalid_dox(tmp_path / "dox"),
+            *Finder(dox_dir).dox,
+        ]
+        assert Builder(output, cache=cache, jobs=jobs).build(dox) == BuildSummary(
+            built=2, failed=1, skipped=0, unchanged=0
+        )
+        assert list(cache.entries) == [str(d.template) for d in dox[1:]]
+        assert any(m.startswith("failed to build Invalid") for m in caplog.messages)
+
+    def test_build_unchanged(self, dox_dir: Path, tmp_path: Path) -> None:
+        """Test build when documents already have the same contents."""
+        dox = Finder(dox_dir).dox
+        Builder(tmp_path).build(dox)
+        assert Builder(tmp_path).build(dox) == BuildSummary(
+            built=2, failed=0, skipped=0, unchanged=2
+        )
+
+    def test_init(self, tmp_path: Path) -> None:
+        """Test __init__."""
+        obj = Builder(tmp_path, jobs=0)
+        assert not obj.cache
+        assert obj.jobs == 1
+        assert obj.output_dir == tmp_path
+
+
+def test_build_dox(dox_dir: Path, tmp_path: Path) -> None:
+    """Test build_dox."""
+    dox = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+    result = build_dox(dox, tmp_path)
+    assert not result.error
+    assert result.dependencies == dox.dependencies
+    assert result.document == tmp_path / "ExampleLinux.json"
+    assert result.document.is_file()
+    assert result.name == dox.name
+    assert result.template == dox.template
+    assert result.written
+    assert result.body is None
+
+
+def test_build_dox_body(dox_dir: Path, tmp_path: Path) -> None:
+    """Test build_dox including the serialized document."""
+    dox = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+    result = build_dox(dox, tmp_path, body=True)
+    assert result.body and result.body + b"\n" == result.document.read_bytes()
+
+
+def test_build_dox_error(tmp_path: Path) -> None:
+    """Test build_dox error."""
+    dox = make_invalid_dox(tmp_path / "dox")
+    result = build_dox(dox, tmp_path / "output")
+    assert result.error and "mainSteps" in result.error
+    assert not result.document.exists()
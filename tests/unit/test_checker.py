@@ -0,0 +1,200 @@
+"""Test ssm_dox.checker."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+import logging
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, List
+
+import pytest
+
+from ssm_dox.builder import Builder
+from ssm_dox.checker import Checker, CheckReport, CheckResult, check_dox, get_manifest
+from ssm_dox.document import Document
+from ssm_dox.dox import Dox
+from ssm_dox.finder import Finder
+from ssm_dox.manifest import BuildManifest
+
+if TYPE_CHECKING:
+    from _pytest.logging import LogCaptureFixture
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def documents(documents_dir: Path, tmp_path: Path) -> Path:
+    """Directory containing built documents."""
+    result = tmp_path / "documents"
+    shutil.copytree(documents_dir, result)
+    return result
+
+
+def test_check_dox(documents: Path, dox_dir: Path) -> None:
+    """Test check_dox."""
+    dox = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+    assert check_dox(dox, documents) == CheckResult(
+        document=documents / "ExampleLinux.json",
+        dox_path=dox.path,
+        error=None,
+        status="current",
+    )
+
+
+def test_check_dox_drifted(documents: Path, dox_dir: Path) -> None:
+    """Test check_dox drifted."""
+    (documents / "ExampleLinux.json").write_text('{"mainSteps": []}')
+    dox = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+    assert check_dox(dox, documents).status == "drifted"
+
+
+def test_check_dox_error(documents: Path, dox_dir: Path, mocker: MockerFixture) -> None:
+    """Test check_dox error."""
+    mocker.patch.object(Dox, "check", side_effect=ValueError("invalid"))
+    dox = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+    result = check_dox(dox, documents)
+    assert result.error == "invalid"
+    assert result.status == "error"
+
+
+def test_check_dox_manifest(
+    dox_dir: Path, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Test check_dox using the build manifest."""
+    Builder(tmp_path, manifest=BuildManifest(tmp_path)).build(Finder(dox_dir).dox)
+    mock_check = mocker.patch.object(Dox, "check")
+    dox = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+    assert check_dox(dox, tmp_path, manifest=True).status == "current"
+    mock_check.assert_called_once_with(tmp_path, manifest=get_manifest(tmp_path))
+    assert mock_check.call_args.kwargs["manifest"]
+
+
+def test_check_dox_missing(dox_dir: Path, tmp_path: Path) -> None:
+    """Test check_dox missing."""
+    dox = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+    assert check_dox(dox, tmp_path).status == "missing"
+
+
+def test_get_manifest(tmp_path: Path) -> None:
+    """Test get_manifest."""
+    assert not get_manifest(tmp_path)
+    manifest = BuildManifest(tmp_path)
+    manifest.record(tmp_path / "ExampleLinux.json", {"size": 1})
+    manifest.save()
+    result = get_manifest(tmp_path)
+    assert result and result.entries == manifest.entries
+    assert get_manifest(tmp_path) is result
+    manifest.record(tmp_path / "ExampleWindows.json", {"size": 1})
+    manifest.save()
+    result = get_manifest(tmp_path)
+    assert result and result.entries == manifest.entries
+
+
+class TestCheckReport:
+    """Test CheckReport."""
+
+    def test_log(self, caplog: LogCaptureFixture, tmp_path: Path) -> None:
+        """Test log."""
+        caplog.set_level(logging.INFO, logger="ssm_dox")
+        obj = CheckReport()
+        for status in ["current", "drifted", "error", "missing"]:
+            obj.results.append(
+                CheckResult(
+                    document=tmp_path / f"{status}.json",
+                    dox_path=tmp_path / status,
+                    error="invalid" if status == "error" else None,
+                    status=status,  # type: ignore
+                )
+            )
+        obj.orphaned.append(tmp_path / "orphan.json")
+        assert not obj.ok
+        obj.log()
+        assert caplog.messages == [
+            "checked 4 dox; 1 up to date, 1 drifted, 1 missing, 1 orphaned, "
+            "1 error(s)",
+            f"drifted: {tmp_path / 'drifted.json'} (Dox: {tmp_path / 'drifted'})",
+            f"missing: {tmp_path / 'missing.json'} (Dox: {tmp_path / 'missing'})",
+            f"orphaned: {tmp_path / 'orphan.json'} (no corresponding Dox)",
+            f"error: {tmp_path / 'error'}: invalid",
+        ]
+
+    def test_log_ok(self, caplog: LogCaptureFixture, tmp_path: Path) -> None:
+        """Test log when all documents are up to date."""
+        caplog.set_level(logging.INFO, logger="ssm_dox")
+        obj = CheckReport()
+        obj.results.append(
+            CheckResult(
+                document=tmp_path / "doc.json",
+                dox_path=tmp_path,
+                error=None,
+                status="current",
+            )
+        )
+        assert obj.ok
+        obj.log()
+        assert caplog.messages == ["all 1 document(s) are up to date"]
+
+
+class TestChecker:
+    """Test Checker."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_check(
+        self, documents: Path, dox_dir: Path, jobs: int, mocker: MockerFixture
+    ) -> None:
+        """Test check."""
+        mock_diff = mocker.patch.object(Dox, "diff")
+        (documents / "ExampleWindows.json").write_text('{"mainSteps": []}')
+        (documents / "Orphan.json").touch()
+        dox = [
+            Dox(path=dox_dir / name, root_dir=dox_dir)
+            for name in ["ExampleLinux", "ExampleWindows"]
+        ]
+        report = Checker(documents, jobs=jobs).check(
+            dox,
+            [
+                Document(path=documents / name, root_dir=documents)
+                for name in ["ExampleLinux.json", "ExampleWindows.json", "Orphan.json"]
+            ],
+        )
+        assert [r.status for r in report.results] == ["current", "drifted"]
+        assert report.orphaned == [documents / "Orphan.json"]
+        mock_diff.assert_called_once_with(documents)
+
+    def test_check_no_documents(self, documents: Path, dox_dir: Path) -> None:
+        """Test check without documents to find orphans."""
+        (documents / "Orphan.json").touch()
+        report = Checker(documents).check(
+            [Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)]
+        )
+        assert report.ok
+        assert not report.orphaned
+
+    def test_check_skipped(self, documents: Path, dox_dir: Path) -> None:
+        """Test check does not report documents of skipped Dox as orphaned."""
+        skipped: List[Dox] = []
+
+        def select(dox: List[Dox]) -> Iterator[Dox]:
+            yield dox[0]
+            skipped.append(dox[1])
+
+        report = Checker(documents).check(
+            select(
+                [
+                    Dox(path=dox_dir / name, root_dir=dox_dir)
+                    for name in ["ExampleLinux", "ExampleWindows"]
+                ]
+            ),
+            [
+                Document(path=documents / name, root_dir=documents)
+                for name in ["ExampleLinux.json", "ExampleWindows.json"]
+            ],
+            skipped=skipped,
+        )
+        assert report.ok
+        assert len(report.results) == 1
+
+    def test_init(self, tmp_path: Path) -> None:
+        """Test __init__."""
+        obj = Checker(tmp_path, jobs=0)
+        assert obj.documents_dir == tmp_path
+        assert obj.jobs == 1
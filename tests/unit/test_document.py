@@ -2,6 +2,7 @@
 # pylint: disable=no-self-use
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -21,6 +22,17 @@ if TYPE_CHECKING:
 class TestDocument:
     """Test Document."""
 
+    def test_body(self, documents_dir: Path) -> None:
+        """Test body."""
+        obj = Document(path=documents_dir / "ExampleLinux.json", root_dir=documents_dir)
+        expected = obj.content.json(exclude_none=True, indent=4).encode()
+        assert obj.body == expected
+        assert obj.body is obj.body
+        obj.body = b"{}"
+        assert obj.body == b"{}"
+        obj.content = SsmDocumentDataModel.parse_raw(expected)
+        assert obj.body == expected
+
     def test_content(self, documents_dir: Path) -> None:
         """Test content."""
         path = documents_dir / "ExampleLinux.json"
@@ -58,6 +70,29 @@ class TestDocument:
         obj.content = content_windows
         assert obj.content == content_windows
 
+    @pytest.mark.parametrize(
+        "expected, relative_path, prefix",
+        [
+            ("ExampleLinux", "./", None),
+            ("dev-ExampleLinux", "./", "dev"),
+            ("dev-ExampleLinux", "./", "dev-"),
+            ("a-b-ExampleLinux", f"./a{os.sep}b", None),
+            ("dev-a-ExampleLinux", "./a", "dev"),
+        ],
+    )
+    def test_get_name(
+        self,
+        documents_dir: Path,
+        expected: str,
+        mocker: MockerFixture,
+        prefix: Optional[str],
+        relative_path: str,
+    ) -> None:
+        """Test get_name."""
+        mocker.patch.object(Document, "relative_path", relative_path)
+        obj = Document(path=documents_dir / "ExampleLinux.json", root_dir=documents_dir)
+        assert obj.get_name(prefix) == expected
+
     def test_init(self, documents_dir: Path) -> None:
         """Test __init__."""
         path = documents_dir / "ExampleLinux.json"
@@ -73,10 +108,11 @@ class TestDocument:
         content.json = MagicMock(return_value="success")
         path = documents_dir / "ExampleLinux.json"
         obj = Document(content=content, path=path, root_dir=documents_dir)
-        assert obj.json() == content.json.return_value
-        content.json.assert_called_once_with(exclude_none=True, indent=4)
-        obj.json(exclude_none=False, indent=2)
-        content.json.assert_called_with(exclude_none=False, indent=2)
+        obj.body = b"body"
+        assert obj.json() == "body"
+        content.json.assert_not_called()
+        assert obj.json(exclude_none=False, indent=2) == content.json.return_value
+        content.json.assert_called_once_with(exclude_none=False, indent=2)
 
     @pytest.mark.parametrize(
         "relative_path, prefix, expected_prefix",
@@ -119,6 +155,26 @@ class TestDocument:
         with stubber:
             obj.publish(client, bucket=bucket, prefix=prefix)
 
+    def test_is_unchanged(self, tmp_path: Path) -> None:
+        """Test is_unchanged."""
+        path = tmp_path / "document.json"
+        obj = Document(path=path, root_dir=tmp_path)
+        assert not obj.is_unchanged(b"foo")
+        path.write_bytes(b"foo")
+        assert obj.is_unchanged(b"foo")
+        assert not obj.is_unchanged(b"bar")
+        assert not obj.is_unchanged(b"foobar")
+
+    def test_is_unchanged_size_differs(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test is_unchanged does not read the file when its size differs."""
+        path = tmp_path / "document.json"
+        path.write_bytes(b"foo")
+        mock_read_bytes = mocker.patch.object(Path, "read_bytes")
+        assert not Document(path=path, root_dir=tmp_path).is_unchanged(b"foobar")
+        mock_read_bytes.assert_not_called()
+
     def test_write(self, documents_dir: Path, mocker: MockerFixture) -> None:
         """Test write."""
         mocker.patch.object(
@@ -129,10 +185,12 @@ class TestDocument:
             ),
         )
         mock_path = MagicMock(autospec=Path)
-        mock_path.write_text = MagicMock()
+        mock_path.stat.side_effect = FileNotFoundError
+        mock_path.write_bytes = MagicMock()
         obj = Document(path=mock_path, root_dir=documents_dir)
         assert obj.write() == mock_path
-        mock_path.write_text.assert_called_once_with(obj.json() + "\n")
+        assert obj.written
+        mock_path.write_bytes.assert_called_once_with((obj.json() + "\n").encode())
 
     def test_write_provided(self, documents_dir: Path, mocker: MockerFixture) -> None:
         """Test write."""
@@ -147,8 +205,27 @@ class TestDocument:
             ),
         )
         mock_path = MagicMock(autospec=Path)
-        mock_path.write_text = MagicMock()
+        mock_path.stat.side_effect = FileNotFoundError
+        mock_path.write_bytes = MagicMock()
         obj = Document(path=mock_path, root_dir=documents_dir)
         assert obj.write(new_content) == mock_path
         assert obj.content == new_content
-        mock_path.write_text.assert_called_once_with(obj.json() + "\n")
+        mock_path.write_bytes.assert_called_once_with((obj.json() + "\n").encode())
+
+    def test_write_unchanged(self, documents_dir: Path, tmp_path: Path) -> None:
+        """Test write does not rewrite a file with the same contents."""
+        path = tmp_path / "ExampleLinux.json"
+        obj = Document(
+            content=Document(
+                path=documents_dir / "ExampleLinux.json", root_dir=documents_dir
+            ).content,
+            path=path,
+            root_dir=tmp_path,
+        )
+        obj.write()
+        assert obj.written
+        os.utime(path, ns=(0, 0))
+        obj.write()
+        assert not obj.written
+        assert path.stat().st_mtime_ns == 0
+        assert path.read_text() == obj.json() + "\n"
@@ -10,10 +10,13 @@ import pytest
 import yaml
 from mock import MagicMock
 
+from ssm_dox.cache.templates import TemplateCache
 from ssm_dox.document import Document
-from ssm_dox.dox import Dox, DoxLoader
+from ssm_dox.dox import Dox, DoxLoader, PyDoxLoader
 from ssm_dox.exceptions import DocumentDrift, TemplateNotFound
+from ssm_dox.manifest import BuildManifest
 from ssm_dox.models.document import SsmDocumentDataModel
+from ssm_dox.serializer import get_default_serializer
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -34,7 +37,18 @@ class TestDox:
         obj = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
         assert obj.build(tmp_path) == document.path
         mock_get_document.assert_called_once_with(tmp_path)
-        mock_write.assert_called_once_with(content=obj.content)
+        mock_write.assert_called_once_with(content=obj.content, body=obj.body)
+
+    def test_body(self, dox_dir: Path, mocker: MockerFixture) -> None:
+        """Test body."""
+        obj = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+        spy_dumps = mocker.spy(get_default_serializer(), "dumps")
+        assert obj.body == obj.content.json(exclude_none=True, indent=4).encode()
+        assert obj.body is obj.body
+        assert spy_dumps.call_count == 1
+        obj.content = obj.content.copy(update={"description": "updated"})
+        assert b'"description": "updated"' in obj.body
+        assert spy_dumps.call_count == 2
 
     def test_check(
         self, documents_dir: Path, dox_dir: Path, mocker: MockerFixture
@@ -51,6 +65,34 @@ class TestDox:
         assert not obj.check(documents_dir)
         mock_get_document.assert_called_once_with(documents_dir)
 
+    def test_check_unchanged(
+        self, dox_dir: Path, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test check not parsing documents that match byte for byte."""
+        obj = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+        obj.build(tmp_path)
+        spy_parse_raw = mocker.spy(SsmDocumentDataModel, "parse_raw")
+        assert not obj.check(tmp_path)
+        assert not spy_parse_raw.called
+
+    def test_check_manifest(
+        self, dox_dir: Path, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test check not reading documents recorded in the build manifest."""
+        obj = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+        document = obj.get_document(tmp_path)
+        obj.build(tmp_path, document=document)
+        manifest = BuildManifest(tmp_path)
+        entry = BuildManifest.create_entry(obj, document, duration=0.0)
+        assert entry
+        manifest.record(document.path, entry)
+        spy_is_unchanged = mocker.spy(Document, "is_unchanged")
+        assert not obj.check(tmp_path, manifest=manifest)
+        assert not spy_is_unchanged.called
+        manifest.entries["ExampleLinux.json"]["sha256"] = "0"
+        assert not obj.check(tmp_path, manifest=manifest)
+        assert spy_is_unchanged.called
+
     def test_check_document_drift(
         self, documents_dir: Path, dox_dir: Path, mocker: MockerFixture
     ) -> None:
@@ -78,6 +120,39 @@ class TestDox:
         assert isinstance(obj.content, SsmDocumentDataModel)
         assert obj.content == document
 
+    def test_content_cache(
+        self, dox_dir: Path, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test content using a TemplateCache."""
+        spy_load = mocker.spy(DoxLoader, "get_single_data")
+        cache = TemplateCache(tmp_path)
+        path = dox_dir / "ExampleLinux"
+        expected = Dox(cache=cache, path=path, root_dir=dox_dir)
+        assert spy_load.call_count == 0
+        assert expected.content
+        assert spy_load.call_count == 1
+
+        obj = Dox(cache=cache, path=path, root_dir=dox_dir)
+        assert obj.content == expected.content
+        assert obj.json() == expected.json()
+        assert obj.dependencies == expected.dependencies
+        assert spy_load.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_content_setter(self, dox_dir: Path, tmp_path: Path) -> None:
+        """Test content.setter."""
+        obj = Dox(path=tmp_path / "Missing", root_dir=tmp_path)
+        content = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir).content
+        obj.content = content
+        assert obj.content is content
+
+    def test_dependencies(self, dox_dir: Path) -> None:
+        """Test dependencies."""
+        obj = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+        assert obj.dependencies == [obj.template]
+        assert obj.content
+        assert obj.dependencies == [obj.template, obj.path / "script.sh"]
+
     def test_diff(
         self, documents_dir: Path, dox_dir: Path, mocker: MockerFixture
     ) -> None:
@@ -96,7 +171,7 @@ class TestDox:
         assert not obj.diff(documents_dir)
         mock_get_document.assert_called_once_with(documents_dir)
         mock_differ.compare.assert_called_once_with(
-            obj.json().split("\n"), document.json().split("\n")
+            document.json().split("\n"), obj.json().split("\n")
         )
 
     def test_get_document(
@@ -125,6 +200,16 @@ class TestDox:
             == documents_dir / "ExampleLinux.json"
         )
 
+    def test_reload(self, dox_dir: Path, mocker: MockerFixture) -> None:
+        """Test reload."""
+        spy_load_content = mocker.spy(Dox, "_load_content")
+        obj = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+        assert obj.body and obj.includes
+        obj.reload()
+        assert not obj.includes
+        assert obj.body and obj.includes
+        assert spy_load_content.call_count == 2
+
     def test_init(self, dox_dir: Path) -> None:
         """Test __init__."""
         path = dox_dir / "ExampleLinux"
@@ -137,13 +222,14 @@ class TestDox:
         """Test json."""
         content = MagicMock(autospec=SsmDocumentDataModel)
         content.json = MagicMock(return_value="success")
+        mocker.patch.object(Dox, "body", b"body")
         mocker.patch.object(Dox, "content", content)
         path = documents_dir / "ExampleLinux.json"
         obj = Dox(path=path, root_dir=documents_dir)
-        assert obj.json() == content.json.return_value
-        content.json.assert_called_once_with(exclude_none=True, indent=4)
-        obj.json(exclude_none=False, indent=2)
-        content.json.assert_called_with(exclude_none=False, indent=2)
+        assert obj.json() == "body"
+        content.json.assert_not_called()
+        assert obj.json(exclude_none=False, indent=2) == content.json.return_value
+        content.json.assert_called_once_with(exclude_none=False, indent=2)
 
     @pytest.mark.parametrize("ext", ["yaml", "yml"])
     def test_template(self, ext: str, tmp_path: Path) -> None:
@@ -153,6 +239,14 @@ class TestDox:
         obj = Dox(path=tmp_path, root_dir=tmp_path)
         assert obj.template == template_path
 
+    def test_template_provided(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test template provided does not probe the filesystem."""
+        mock_is_file = mocker.patch.object(Path, "is_file")
+        template_path = tmp_path / "template.yml"
+        obj = Dox(path=tmp_path, root_dir=tmp_path, template=template_path)
+        assert obj.template == template_path
+        mock_is_file.assert_not_called()
+
     @pytest.mark.parametrize(
         "file_name", ["template", "template.json", "something.yml", None]
     )
@@ -168,9 +262,70 @@ class TestDox:
         assert excinfo.value.path == tmp_path
 
 
+PARITY_TEMPLATE = """
+schemaVersion: "2.2"
+description: |
+  Multi-line description
+  with "quotes" & unicode: é
+parameters:
+  Count:
+    type: Integer
+    default: 10
+    allowedValues: [1, 10, 0x10]
+  Enabled:
+    type: Boolean
+    default: yes
+  Empty:
+    type: String
+    default: ~
+mainSteps:
+  - &step
+    action: aws:runShellScript
+    name: first
+    precondition: !LinuxOnly
+    inputs:
+      runCommand: !IncludeScript script.sh
+  - <<: *step
+    name: second
+    precondition: !WindowsOnly
+    inputs:
+      runCommand:
+        - >-
+          folded
+          line
+        - 'single ''quoted'''
+"""
+
+
 class TestDoxLoader:
     """Test DoxLoader."""
 
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="requires libyaml")
+    @pytest.mark.parametrize("name", ["ExampleLinux", "ExampleWindows", None])
+    def test_c_loader_parity(
+        self, dox_dir: Path, name: Optional[str], tmp_path: Path
+    ) -> None:
+        """Test the libyaml loader produces the same result as pure Python."""
+        if name:
+            template = dox_dir / name / "template.yml"
+        else:
+            template = tmp_path / "template.yml"
+            template.write_text(PARITY_TEMPLATE, encoding="UTF-8")
+            (tmp_path / "script.sh").write_text("#!/bin/bash\necho 'hello'  \n")
+        results = []
+        for loader_class in (DoxLoader, PyDoxLoader):
+            with open(template, "r", encoding="UTF-8") as f:
+                loader = loader_class(f)
+                results.append(
+                    (
+                        SsmDocumentDataModel.parse_obj(loader.get_single_data()),
+                        loader.includes,
+                    )
+                )
+        assert DoxLoader is not PyDoxLoader
+        assert results[0] == results[1]
+        assert results[0][0].json() == results[1][0].json()
+
     def test_include_script(self, dox_dir: Path) -> None:
         """Test !IncludeScript."""
         dox_path = dox_dir / "ExampleLinux"
@@ -183,6 +338,26 @@ class TestDoxLoader:
             result = yaml.load(f, Loader=DoxLoader)
         assert result["mainSteps"][0]["inputs"]["runCommand"] == expected
 
+    def test_include_script_includes(self, dox_dir: Path) -> None:
+        """Test !IncludeScript records included files."""
+        dox_path = dox_dir / "ExampleLinux"
+        with open(dox_path / "template.yml", "r", encoding="UTF-8") as f:
+            loader = DoxLoader(f)
+            loader.get_single_data()
+        assert loader.includes == [(dox_path / "script.sh").resolve()]
+
+    def test_include_script_includes_resolved(self, tmp_path: Path) -> None:
+        """Test !IncludeScript records the resolved path of included files."""
+        script = tmp_path / "scripts" / "common.sh"
+        script.parent.mkdir()
+        script.write_text("echo common\n")
+        loader = DoxLoader(
+            "value: !IncludeScript ../../scripts/common.sh",
+            root=tmp_path / "dox" / "Example",
+        )
+        assert loader.get_single_data() == {"value": ["echo common"]}
+        assert loader.includes == [script.resolve()]
+
     def test_include_script_cwd(self, tmp_path: Path) -> None:
         """Test !IncludeScript cwd."""
         orig = Path.cwd().absolute()  # cache original working direcory
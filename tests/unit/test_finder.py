@@ -2,11 +2,17 @@
 # pylint: disable=no-self-use
 from __future__ import annotations
 
+import os
+import time
 from typing import TYPE_CHECKING
 
+from mock import ANY
+
+from ssm_dox.cache.discovery import RACY_WINDOW_NS, DiscoveryIndex
 from ssm_dox.document import Document
 from ssm_dox.dox import Dox
-from ssm_dox.finder import Finder
+from ssm_dox.finder import Finder, ScanResult
+from ssm_dox.ignore import DoxIgnore
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -22,7 +28,7 @@ class TestFinder:
         json0 = tmp_path / "json0.json"
         json0.touch()
         json1 = tmp_path / "child" / "json1.json"
-        json1.mkdir(exist_ok=True, parents=True)
+        json1.parent.mkdir(exist_ok=True, parents=True)
         json1.touch()
 
         documents = Finder(tmp_path).documents
@@ -34,62 +40,212 @@ class TestFinder:
         assert documents[1].path == json1
         assert documents[1].root == tmp_path
 
-    def test_dox(self, mocker: MockerFixture, tmp_path: Path) -> None:
+    def test_dox(self, tmp_path: Path) -> None:
         """Test dox."""
-        mock_has_template = mocker.patch.object(
-            Finder, "has_template", return_value=True
-        )
-        mock_subdirectories = mocker.patch.object(
-            Finder, "subdirectories", [tmp_path / "something"]
+        result = ScanResult(tmp_path)
+        result.directories.append(tmp_path / "something")
+        result.templates[tmp_path / "something"] = (
+            tmp_path / "something" / "template.yml"
         )
         obj = Finder(tmp_path)
+        obj.scan = result
         assert len(obj.dox) == 1
-        mock_has_template.assert_called_once_with(mock_subdirectories[0])
         dox = obj.dox[0]
         assert isinstance(dox, Dox)
-        assert dox.path == mock_subdirectories[0]
+        assert dox.path == tmp_path / "something"
         assert dox.root == tmp_path
+        assert dox.template == tmp_path / "something" / "template.yml"
 
-    def test_has_template(self, tmp_path: Path) -> None:
-        """Test has_template."""
-        dir0 = tmp_path / "parent0"
-        dir0.mkdir(exist_ok=True, parents=True)
-        assert not Finder.has_template(dir0)
-
-        dir1 = tmp_path / "parent0" / "child0"
-        dir1.mkdir(exist_ok=True, parents=True)
-        (dir1 / "template.yml").touch()
-        assert not Finder.has_template(dir0)
-        assert Finder.has_template(dir1)
+    def test_iter_documents(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test iter_documents."""
+        (tmp_path / "child").mkdir()
+        expected = [tmp_path / "json0.json", tmp_path / "child" / "json1.json"]
+        for f in expected:
+            f.touch()
+        spy_walk = mocker.spy(Finder, "walk")
+        obj = Finder(tmp_path)
+        iterator = obj.iter_documents()
+        first = next(iterator)
+        assert first.path == expected[0]
+        assert first.root == tmp_path
+        assert "scan" not in obj.__dict__
+        assert [first.path, *(doc.path for doc in iterator)] == expected
+        assert obj.scan.documents == expected
+        assert [doc.path for doc in obj.iter_documents()] == expected
+        spy_walk.assert_called_once_with(tmp_path, ignore=None, index=None)
 
-        dir2 = tmp_path / "parent1"
-        dir2.mkdir(exist_ok=True, parents=True)
-        (dir2 / "template").touch()
-        assert not Finder.has_template(dir2)
+    def test_iter_dox(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test iter_dox."""
+        expected = [tmp_path / "dox0", tmp_path / "dox1"]
+        for d in expected:
+            d.mkdir()
+            (d / "template.yml").touch()
+        (tmp_path / "not-dox").mkdir()
+        spy_walk = mocker.spy(Finder, "walk")
+        obj = Finder(tmp_path)
+        iterator = obj.iter_dox()
+        first = next(iterator)
+        assert isinstance(first, Dox)
+        assert first.path == expected[0]
+        assert first.template == expected[0] / "template.yml"
+        assert "scan" not in obj.__dict__
+        assert [first.path, *(dox.path for dox in iterator)] == expected
+        assert list(obj.scan.templates) == expected
+        assert [dox.path for dox in obj.iter_dox()] == expected
+        spy_walk.assert_called_once_with(tmp_path, ignore=None, index=None)
 
     def test_init(self, tmp_path: Path) -> None:
         """Test __init__."""
         obj = Finder(tmp_path)
         assert obj.root == tmp_path
 
+    def test_scan(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test scan."""
+        mock_scandir = mocker.patch.object(
+            Finder, "scandir", return_value=ScanResult(tmp_path)
+        )
+        obj = Finder(tmp_path)
+        assert obj.scan == mock_scandir.return_value
+        assert obj.scan == mock_scandir.return_value
+        mock_scandir.assert_called_once_with(tmp_path, ignore=None, index=None)
+
     def test_scandir(self, tmp_path: Path) -> None:
         """test scandir."""
         expected = [
             tmp_path / "parent0",
-            tmp_path / "parent1",
-            tmp_path / "parent2",
             tmp_path / "parent0" / "child0",
             tmp_path / "parent0" / "child0" / "subchild0",
+            tmp_path / "parent1",
             tmp_path / "parent1" / "child0",
             tmp_path / "parent1" / "child1",
+            tmp_path / "parent2",
         ]
         for d in expected:
             d.mkdir(exist_ok=True, parents=True)
-        assert Finder.scandir(tmp_path).sort() == expected.sort()
+        assert Finder.scandir(tmp_path).directories == expected
+
+    def test_scandir_documents(self, tmp_path: Path) -> None:
+        """test scandir documents."""
+        (tmp_path / "child").mkdir()
+        expected = [tmp_path / "json0.json", tmp_path / "child" / "json1.json"]
+        for f in expected:
+            f.touch()
+        (tmp_path / "child" / "not-json.txt").touch()
+        (tmp_path / "dir.json").mkdir()
+        assert Finder.scandir(tmp_path).documents == expected
+
+    def test_scandir_ignore(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test scandir prunes ignored paths."""
+        (tmp_path / ".doxignore").write_text("node_modules/\n/out/*.json\n")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "template.yml").touch()
+        (tmp_path / "node_modules" / "pkg" / "package.json").touch()
+        (tmp_path / "out").mkdir()
+        (tmp_path / "out" / "ignored.json").touch()
+        (tmp_path / "dox").mkdir()
+        (tmp_path / "dox" / "template.yml").touch()
+        (tmp_path / "dox" / "kept.json").touch()
+        spy_list_directory = mocker.spy(Finder, "_list_directory")
+
+        result = Finder.scandir(tmp_path)
+        assert result.directories == [tmp_path / "dox", tmp_path / "out"]
+        assert result.documents == [tmp_path / "dox" / "kept.json"]
+        assert list(result.templates) == [tmp_path / "dox"]
+        assert [c.args[0] for c in spy_list_directory.call_args_list] == [
+            tmp_path,
+            tmp_path / "dox",
+            tmp_path / "out",
+        ]
+
+    def test_scandir_ignore_provided(self, tmp_path: Path) -> None:
+        """Test scandir with ignore provided."""
+        (tmp_path / ".doxignore").write_text("dox0/\n")
+        (tmp_path / "dox0").mkdir()
+        (tmp_path / "dox1").mkdir()
+        result = Finder.scandir(tmp_path, ignore=DoxIgnore(["dox1/"]))
+        assert result.directories == [tmp_path / "dox0"]
+
+    def test_scandir_templates(self, tmp_path: Path) -> None:
+        """Test scandir templates."""
+        (tmp_path / "template.yml").touch()  # root is never a dox
+        dir0 = tmp_path / "parent0"
+        dir0.mkdir()
+        dir1 = dir0 / "child0"
+        dir1.mkdir()
+        (dir1 / "template.yml").touch()
+        dir2 = tmp_path / "parent1"
+        dir2.mkdir()
+        (dir2 / "template").touch()
+        (dir2 / "template.json").touch()
+        dir3 = tmp_path / "parent2"
+        dir3.mkdir()
+        (dir3 / "template.yml").touch()
+        (dir3 / "template.yaml").touch()
+        dir4 = tmp_path / "parent3"
+        (dir4 / "template.yml").mkdir(parents=True)
+
+        assert Finder.scandir(tmp_path).templates == {
+            dir1: dir1 / "template.yml",
+            dir3: dir3 / "template.yaml",
+        }
+
+    def test_walk_index(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test walk using an index."""
+        dox = tmp_path / "dox"
+        (dox / "parent0" / "child0").mkdir(parents=True)
+        (dox / "parent0" / "child0" / "template.yml").touch()
+        (dox / "parent1").mkdir()
+        old_ns = time.time_ns() - RACY_WINDOW_NS * 2
+        for d in [dox, dox / "parent0", dox / "parent0" / "child0", dox / "parent1"]:
+            os.utime(d, ns=(old_ns, old_ns))
+        index_path = tmp_path / "index.json"
+        expected = Finder.scandir(dox).templates
+
+        spy_list_directory = mocker.spy(Finder, "_list_directory")
+        assert Finder.scandir(dox, index=DiscoveryIndex(index_path)).templates == (
+            expected
+        )
+        assert spy_list_directory.call_count == 4
+        assert index_path.is_file()
+
+        spy_list_directory.reset_mock()
+        assert Finder.scandir(dox, index=DiscoveryIndex(index_path)).templates == (
+            expected
+        )
+        spy_list_directory.assert_not_called()
+
+        (dox / "parent1" / "template.yaml").touch()
+        result = Finder.scandir(dox, index=DiscoveryIndex(index_path))
+        spy_list_directory.assert_called_once_with(dox / "parent1", "parent1/", ANY)
+        assert result.templates == {
+            **expected,
+            dox / "parent1": dox / "parent1" / "template.yaml",
+        }
+
+    def test_walk_index_ignore_changed(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test walk using an index built with different ignore rules."""
+        dox = tmp_path / "dox"
+        (dox / "parent0").mkdir(parents=True)
+        (dox / "parent1").mkdir()
+        old_ns = time.time_ns() - RACY_WINDOW_NS * 2
+        for d in [dox, dox / "parent0", dox / "parent1"]:
+            os.utime(d, ns=(old_ns, old_ns))
+        index_path = tmp_path / "index.json"
+        Finder.scandir(dox, index=DiscoveryIndex(index_path))
+
+        spy_list_directory = mocker.spy(Finder, "_list_directory")
+        result = Finder.scandir(
+            dox, ignore=DoxIgnore(["parent1/"]), index=DiscoveryIndex(index_path)
+        )
+        assert result.directories == [dox / "parent0"]
+        assert spy_list_directory.call_count == 2
 
     def test_subdirectories(self, mocker: MockerFixture, tmp_path: Path) -> None:
         """Test subdirectories."""
-        mock_scandir = mocker.patch.object(Finder, "scandir", return_value=[tmp_path])
+        result = ScanResult(tmp_path)
+        result.directories.append(tmp_path / "something")
+        mocker.patch.object(Finder, "scan", result)
         obj = Finder(tmp_path)
-        assert obj.subdirectories == mock_scandir.return_value
-        mock_scandir.assert_called_once_with(tmp_path)
+        assert obj.subdirectories == result.directories
@@ -0,0 +1,65 @@
+"""Test ssm_dox.git."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+import subprocess
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ssm_dox.exceptions import GitError
+from ssm_dox.git import get_changed_files, git
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+MODULE = "ssm_dox.git"
+
+
+def init_repo(path: Path) -> None:
+    """Initialize a git repository with a single commit."""
+    for args in [
+        ("init", "-q"),
+        ("config", "user.email", "test@example.com"),
+        ("config", "user.name", "test"),
+        ("add", "."),
+        ("commit", "-q", "-m", "initial"),
+    ]:
+        subprocess.run(["git", *args], check=True, cwd=path)
+
+
+def test_get_changed_files(tmp_path: Path) -> None:
+    """Test get_changed_files."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "modified.sh").write_text("original")
+    (tmp_path / "unchanged.sh").write_text("unchanged")
+    (tmp_path / "renamed.sh").write_text("renamed")
+    init_repo(tmp_path)
+    assert get_changed_files("HEAD", tmp_path) == []
+
+    (tmp_path / "sub" / "modified.sh").write_text("modified")
+    (tmp_path / "sub" / "new file.sh").write_text("new")
+    git("mv", "renamed.sh", "moved.sh", cwd=tmp_path)
+    assert get_changed_files("HEAD", tmp_path / "sub") == [
+        tmp_path / "moved.sh",
+        tmp_path / "renamed.sh",
+        tmp_path / "sub" / "modified.sh",
+        tmp_path / "sub" / "new file.sh",
+    ]
+
+
+def test_git_error(tmp_path: Path) -> None:
+    """Test git raising GitError."""
+    with pytest.raises(GitError) as excinfo:
+        git("rev-parse", "--show-toplevel", cwd=tmp_path)
+    assert excinfo.value.command == ["git", "rev-parse", "--show-toplevel"]
+    assert "not a git repository" in excinfo.value.reason.lower()
+
+
+def test_git_not_installed(mocker: MockerFixture) -> None:
+    """Test git raising GitError when git is not installed."""
+    mocker.patch(f"{MODULE}.subprocess.run", side_effect=FileNotFoundError)
+    with pytest.raises(GitError, match="git is not installed"):
+        git("status")
@@ -0,0 +1,85 @@
+"""Test ssm_dox.ignore."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+import pytest
+
+from ssm_dox.ignore import DEFAULT_PATTERNS, DoxIgnore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestDoxIgnore:
+    """Test DoxIgnore."""
+
+    def test_digest(self) -> None:
+        """Test digest."""
+        assert DoxIgnore(["a"]).digest == DoxIgnore(["a", "", "# comment"]).digest
+        assert DoxIgnore(["a"]).digest != DoxIgnore(["b"]).digest
+
+    def test_from_root(self, tmp_path: Path) -> None:
+        """Test from_root."""
+        (tmp_path / ".doxignore").write_text("# comment\nnode_modules/\n\n*.log\n")
+        obj = DoxIgnore.from_root(tmp_path)
+        assert obj.patterns == [
+            *DEFAULT_PATTERNS,
+            "# comment",
+            "node_modules/",
+            "",
+            "*.log",
+        ]
+        assert len(obj.rules) == len(DEFAULT_PATTERNS) + 2
+
+    def test_from_root_not_exist(self, tmp_path: Path) -> None:
+        """Test from_root file does not exist."""
+        obj = DoxIgnore.from_root(tmp_path)
+        assert obj.patterns == list(DEFAULT_PATTERNS)
+
+    @pytest.mark.parametrize(
+        "patterns, path, is_dir, expected",
+        [
+            ([], ".git", True, True),
+            ([], "nested/.ssm-dox-cache", True, True),
+            ([], ".git", False, False),
+            (["node_modules/"], "node_modules", True, True),
+            (["node_modules/"], "a/b/node_modules", True, True),
+            (["node_modules/"], "node_modules", False, False),
+            (["/build"], "build", True, True),
+            (["/build"], "a/build", True, False),
+            (["a/build"], "a/build", False, True),
+            (["a/build"], "b/a/build", False, False),
+            (["*.log"], "a/b.log", False, True),
+            (["*.log"], "a.logs", False, False),
+            (["*.log", "!keep.log"], "a/keep.log", False, False),
+            (["*.log", "!keep.log", "*.log"], "keep.log", False, True),
+            (["fixtures/**"], "fixtures/a/b", True, True),
+            (["fixtures/**"], "fixtures", True, False),
+            (["**/fixtures"], "a/b/fixtures", True, True),
+            (["a/**/b"], "a/b", True, True),
+            (["a/**/b"], "a/x/y/b", False, True),
+            (["a/**/b"], "x/a/b", False, False),
+            (["?.json"], "a.json", False, True),
+            (["?.json"], "ab.json", False, False),
+            (["[ab].json"], "b.json", False, True),
+            (["[!ab].json"], "b.json", False, False),
+            (["[!ab].json"], "c.json", False, True),
+            (["\\!important"], "!important", False, True),
+            (["\\#hash"], "#hash", False, True),
+            (["trailing\\ "], "trailing ", False, True),
+            (["trailing  "], "trailing", False, True),
+            (["[unclosed"], "[unclosed", False, True),
+        ],
+    )
+    def test_is_ignored(
+        self, expected: bool, is_dir: bool, path: str, patterns: List[str]
+    ) -> None:
+        """Test is_ignored."""
+        assert DoxIgnore(patterns).is_ignored(path, is_dir=is_dir) is expected
+
+    @pytest.mark.parametrize("line", ["", "   ", "# comment", "!", "/"])
+    def test_parse_empty(self, line: str) -> None:
+        """Test parse line without a pattern."""
+        assert not DoxIgnore.parse(line)
@@ -0,0 +1,133 @@
+"""Test ssm_dox.manifest."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from typing import TYPE_CHECKING
+
+from ssm_dox.dox import Dox
+from ssm_dox.manifest import MANIFEST_FILE_NAME, BuildManifest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def build(dox_dir: Path, output_dir: Path) -> BuildManifest:
+    """Build ExampleLinux and record it in a manifest."""
+    dox = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+    document = dox.get_document(output_dir)
+    dox.build(output_dir, document=document)
+    manifest = BuildManifest(output_dir)
+    entry = BuildManifest.create_entry(dox, document, duration=0.1234567891)
+    assert entry
+    manifest.record(document.path, entry)
+    return manifest
+
+
+class TestBuildManifest:
+    """Test BuildManifest."""
+
+    def test_create_entry(self, dox_dir: Path, tmp_path: Path) -> None:
+        """Test create_entry."""
+        manifest = build(dox_dir, tmp_path)
+        document = tmp_path / "ExampleLinux.json"
+        data = document.read_bytes()
+        assert manifest.entries == {
+            "ExampleLinux.json": {
+                "dox": "ExampleLinux",
+                "duration": 0.123457,
+                "inputs_sha256": manifest.entries["ExampleLinux.json"]["inputs_sha256"],
+                "md5": hashlib.md5(data[:-1]).hexdigest(),
+                "mtime_ns": document.stat().st_mtime_ns,
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "size": len(data),
+            }
+        }
+
+    def test_create_entry_inputs(self, dox_dir: Path, tmp_path: Path) -> None:
+        """Test create_entry inputs digest changes with the included files."""
+        root = tmp_path / "dox"
+        shutil.copytree(dox_dir, root)
+        first = build(root, tmp_path / "first").entries["ExampleLinux.json"]
+        assert (
+            build(root, tmp_path / "second").entries["ExampleLinux.json"][
+                "inputs_sha256"
+            ]
+            == first["inputs_sha256"]
+        )
+        with open(root / "ExampleLinux" / "script.sh", "a", encoding="utf-8") as f:
+            f.write("# changed\n")
+        assert (
+            build(root, tmp_path / "third").entries["ExampleLinux.json"][
+                "inputs_sha256"
+            ]
+            != first["inputs_sha256"]
+        )
+
+    def test_create_entry_missing(self, dox_dir: Path, tmp_path: Path) -> None:
+        """Test create_entry for a document that was not written."""
+        dox = Dox(path=dox_dir / "ExampleLinux", root_dir=dox_dir)
+        assert not BuildManifest.create_entry(
+            dox, dox.get_document(tmp_path), duration=0.0
+        )
+
+    def test_get(self, dox_dir: Path, tmp_path: Path) -> None:
+        """Test get."""
+        manifest = build(dox_dir, tmp_path)
+        document = tmp_path / "ExampleLinux.json"
+        assert manifest.get(document) == manifest.entries["ExampleLinux.json"]
+        assert not manifest.get(tmp_path / "ExampleWindows.json")
+        stat = document.stat()
+        os.utime(document, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert not manifest.get(document)
+        document.unlink()
+        assert not manifest.get(document)
+
+    def test_is_current(self, dox_dir: Path, tmp_path: Path) -> None:
+        """Test is_current."""
+        manifest = build(dox_dir, tmp_path)
+        document = tmp_path / "ExampleLinux.json"
+        data = document.read_bytes()
+        assert manifest.is_current(document, data)
+        assert not manifest.is_current(document, data + b"\n")
+
+    def test_prune(self, dox_dir: Path, tmp_path: Path) -> None:
+        """Test prune."""
+        manifest = build(dox_dir, tmp_path)
+        manifest.prune()
+        assert list(manifest.entries) == ["ExampleLinux.json"]
+        (tmp_path / "ExampleLinux.json").unlink()
+        manifest.modified = False
+        manifest.prune()
+        assert not manifest.entries
+        assert manifest.modified
+
+    def test_record(self, dox_dir: Path, tmp_path: Path) -> None:
+        """Test record does not modify the manifest with an equal entry."""
+        manifest = build(dox_dir, tmp_path)
+        assert manifest.modified
+        manifest.save()
+        assert not manifest.modified
+        document = tmp_path / "ExampleLinux.json"
+        entry = manifest.entries["ExampleLinux.json"]
+        manifest.record(document, {**entry, "duration": 1.0})
+        assert not manifest.modified
+        assert manifest.entries["ExampleLinux.json"]["duration"] == 0.123457
+        manifest.record(document, {**entry, "size": 0})
+        assert manifest.modified
+        assert manifest.entries["ExampleLinux.json"]["size"] == 0
+
+    def test_save(self, dox_dir: Path, tmp_path: Path) -> None:
+        """Test save."""
+        manifest = build(dox_dir, tmp_path)
+        manifest.save()
+        path = tmp_path / MANIFEST_FILE_NAME
+        assert path.read_text().endswith("}\n")
+        assert json.loads(path.read_text()) == {
+            "data": manifest.data,
+            "version": BuildManifest.VERSION,
+        }
+        assert BuildManifest(tmp_path).entries == manifest.entries
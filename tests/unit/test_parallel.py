@@ -0,0 +1,71 @@
+"""Test ssm_dox.parallel."""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Tuple
+
+import pytest
+
+from ssm_dox.dox import Dox
+from ssm_dox.parallel import imap_dox, imap_ordered
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.logging import LogCaptureFixture
+
+LOGGER = logging.getLogger("ssm_dox.test")
+
+
+def get_name(dox: Dox, output_dir: Path) -> Tuple[str, int]:
+    """Return the name of the Dox and the ID of the current process."""
+    LOGGER.info("processing %s in %s", dox.name, output_dir.name)
+    return dox.name, os.getpid()
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_imap_dox(caplog: LogCaptureFixture, jobs: int, tmp_path: Path) -> None:
+    """Test imap_dox."""
+    caplog.set_level(logging.INFO, logger="ssm_dox")
+    dox = [Dox(path=tmp_path / f"dox{i}", root_dir=tmp_path) for i in range(10)]
+    for item in dox:
+        item.template = item.path / "template.yml"
+    results = list(
+        imap_dox(get_name, iter(dox), tmp_path, jobs=jobs, skip=lambda d: d is dox[1])
+    )
+    assert [item for item, _ in results] == dox
+    assert results[1][1] is None
+    assert [r[0] for _, r in results if r] == [d.name for d in dox if d is not dox[1]]
+    pids = {r[1] for _, r in results if r}
+    assert (os.getpid() in pids) is (jobs == 1)
+    assert caplog.messages == [
+        f"processing {d.name} in {tmp_path.name}" for d in dox if d is not dox[1]
+    ]
+
+
+def test_imap_ordered() -> None:
+    """Test imap_ordered."""
+
+    def double(value: int) -> Tuple[int, str]:
+        time.sleep(0.01 * (value % 3))  # finish out of order
+        return value * 2, threading.current_thread().name
+
+    results = list(
+        imap_ordered(
+            ThreadPoolExecutor,
+            double,
+            iter(range(10)),
+            2,
+            args=lambda value: (value + 1,),
+            skip=lambda value: value == 3,
+            thread_name_prefix="test-imap",
+        )
+    )
+    assert [item for item, _ in results] == list(range(10))
+    assert results[3][1] is None
+    assert [r[0] for _, r in results if r] == [(v + 1) * 2 for v in range(10) if v != 3]
+    assert all(r[1].startswith("test-imap") for _, r in results if r)
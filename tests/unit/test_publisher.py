@@ -0,0 +1,351 @@
+"""Test ssm_dox.publisher."""
+# pylint: disable=no-self-use,redefined-outer-name
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import TYPE_CHECKING, Iterator
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from ssm_dox.builder import Builder
+from ssm_dox.document import Document
+from ssm_dox.finder import Finder
+from ssm_dox.manifest import BuildManifest
+from ssm_dox.publisher import (
+    SSM_FIND_VERSION_LIMIT,
+    Publisher,
+    PublishSummary,
+    SsmPublisher,
+)
+from ssm_dox.serializer import get_default_serializer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.logging import LogCaptureFixture
+    from mypy_boto3_s3.client import S3Client
+    from mypy_boto3_ssm.client import SSMClient
+    from pytest_mock import MockerFixture
+
+MODULE = "ssm_dox.publisher"
+BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def s3_client() -> Iterator[S3Client]:
+    """S3 client for a mocked bucket."""
+    with mock_aws():
+        client = Publisher.create_client(boto3.Session(region_name="us-east-1"))
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+@pytest.fixture
+def ssm_client() -> Iterator[SSMClient]:
+    """Mocked SSM client."""
+    with mock_aws():
+        yield SsmPublisher.create_client(boto3.Session(region_name="us-east-1"))
+
+
+class TestPublishSummary:
+    """Test PublishSummary."""
+
+    def test_log(self, caplog: LogCaptureFixture) -> None:
+        """Test log."""
+        caplog.set_level(logging.INFO, logger="ssm_dox.publisher")
+        PublishSummary(
+            deleted=3, failed=1, published=4, seconds=2, size=4096, unchanged=2
+        ).log()
+        assert caplog.messages == [
+            "published 4 document(s) (4096 byte(s)) in 2.00s; "
+            "2.0 document(s)/s, 2.0 KiB/s; 2 unchanged, 3 deleted",
+            "failed to publish 1 document(s)",
+        ]
+
+    def test_throughput(self) -> None:
+        """Test throughput."""
+        assert (
+            PublishSummary(
+                deleted=0, failed=0, published=6, seconds=2, size=0, unchanged=0
+            ).throughput
+            == 3
+        )
+        assert not PublishSummary(
+            deleted=0, failed=0, published=0, seconds=0, size=0, unchanged=0
+        ).throughput
+
+
+class TestPublisher:
+    """Test Publisher."""
+
+    def test_create_client(self) -> None:
+        """Test create_client."""
+        session = boto3.Session(region_name="us-east-1")
+        client = Publisher.create_client(session, concurrency=32)
+        assert client.meta.config.max_pool_connections == 32
+        client = Publisher.create_client(session, concurrency=2)
+        assert client.meta.config.max_pool_connections == 10
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_publish(
+        self, concurrency: int, documents_dir: Path, s3_client: S3Client
+    ) -> None:
+        """Test publish."""
+        documents = Finder(documents_dir).documents
+        obj = Publisher(s3_client, bucket=BUCKET, concurrency=concurrency, prefix="v1")
+        summary = obj.publish(iter(documents))
+        assert summary.published == len(documents) == 2
+        assert not summary.failed
+        assert summary.size == sum(len(d.json().encode()) for d in documents)
+        assert [r.key for r in obj.results] == [
+            "v1/ExampleLinux.json",
+            "v1/ExampleWindows.json",
+        ]
+        for document in documents:
+            assert (
+                s3_client.get_object(Bucket=BUCKET, Key=document.get_key("v1"))[
+                    "Body"
+                ].read()
+                == document.json().encode()
+            )
+
+    def test_publish_error(self, documents_dir: Path, s3_client: S3Client) -> None:
+        """Test publish capturing errors."""
+        obj = Publisher(s3_client, bucket="missing-bucket", concurrency=2, force=True)
+        summary = obj.publish(Finder(documents_dir).documents)
+        assert summary.failed == 2
+        assert not summary.published
+        assert not summary.size
+        assert all("NoSuchBucket" in str(r.error) for r in obj.results)
+
+    def test_publish_delete(
+        self, documents_dir: Path, mocker: MockerFixture, s3_client: S3Client
+    ) -> None:
+        """Test publish deleting objects that do not correspond to a document."""
+        mocker.patch(f"{MODULE}.DELETE_BATCH_SIZE", 2)
+        spy_delete_objects = mocker.spy(s3_client, "delete_objects")
+        for key in ["v1/stale0.json", "v1/a/stale1.json", "v1/stale2.json", "v2/x"]:
+            s3_client.put_object(Bucket=BUCKET, Body=b"{}", Key=key)
+        obj = Publisher(s3_client, bucket=BUCKET, delete=True, prefix="v1")
+        summary = obj.publish(Finder(documents_dir).documents)
+        assert summary.deleted == 3
+        assert summary.published == 2
+        assert spy_delete_objects.call_count == 2
+        assert sorted(
+            o["Key"] for o in s3_client.list_objects_v2(Bucket=BUCKET)["Contents"]
+        ) == ["v1/ExampleLinux.json", "v1/ExampleWindows.json", "v2/x"]
+
+    def test_publish_delete_skipped(
+        self, documents_dir: Path, s3_client: S3Client
+    ) -> None:
+        """Test publish not deleting objects of skipped documents."""
+        documents = Finder(documents_dir).documents
+        Publisher(s3_client, bucket=BUCKET).publish(documents)
+        summary = Publisher(s3_client, bucket=BUCKET, delete=True).publish(
+            documents[:1], skipped=documents[1:]
+        )
+        assert not summary.deleted
+        assert len(s3_client.list_objects_v2(Bucket=BUCKET)["Contents"]) == 2
+
+    def test_publish_delete_errors(
+        self, caplog: LogCaptureFixture, mocker: MockerFixture
+    ) -> None:
+        """Test delete_objects logging keys that could not be deleted."""
+        caplog.set_level(logging.ERROR, logger=MODULE)
+        client = mocker.MagicMock()
+        client.delete_objects.return_value = {
+            "Errors": [{"Key": "a", "Message": "Access Denied"}]
+        }
+        obj = Publisher(client, bucket=BUCKET)
+        assert obj.delete_objects(["a", "b"]) == 1
+        assert caplog.messages == [f"failed to delete s3://{BUCKET}/a: Access Denied"]
+
+    def test_publish_unchanged(
+        self, documents_dir: Path, mocker: MockerFixture, s3_client: S3Client
+    ) -> None:
+        """Test publish skipping documents whose object is unchanged."""
+        documents = Finder(documents_dir).documents
+        Publisher(s3_client, bucket=BUCKET).publish(documents)
+        spy_put_object = mocker.spy(s3_client, "put_object")
+
+        summary = Publisher(s3_client, bucket=BUCKET).publish(documents)
+        assert (summary.published, summary.unchanged) == (0, 2)
+        assert not spy_put_object.called
+
+        s3_client.put_object(Bucket=BUCKET, Body=b"{}", Key=documents[0].get_key())
+        summary = Publisher(s3_client, bucket=BUCKET).publish(documents)
+        assert (summary.published, summary.unchanged) == (1, 1)
+        assert spy_put_object.call_count == 2
+
+        summary = Publisher(s3_client, bucket=BUCKET, force=True).publish(documents)
+        assert (summary.published, summary.unchanged) == (2, 0)
+
+    def test_publish_unchanged_manifest(
+        self,
+        dox_dir: Path,
+        mocker: MockerFixture,
+        s3_client: S3Client,
+        tmp_path: Path,
+    ) -> None:
+        """Test publish using digests from the build manifest."""
+        manifest = BuildManifest(tmp_path)
+        Builder(tmp_path, manifest=manifest).build(Finder(dox_dir).dox)
+        Publisher(s3_client, bucket=BUCKET).publish(Finder(tmp_path).documents)
+        spy_serialize = mocker.spy(get_default_serializer(), "dumps")
+
+        obj = Publisher(s3_client, bucket=BUCKET, manifest=manifest)
+        summary = obj.publish(Finder(tmp_path).documents)
+        assert (summary.published, summary.unchanged) == (0, 2)
+        assert not spy_serialize.called
+        assert [r.size for r in obj.results] == [
+            len(Document(path=r.document, root_dir=tmp_path).body) for r in obj.results
+        ]
+
+
+class TestSsmPublisher:
+    """Test SsmPublisher."""
+
+    def test_create_client(self) -> None:
+        """Test create_client."""
+        session = boto3.Session(region_name="us-east-1")
+        client = SsmPublisher.create_client(session, concurrency=16)
+        assert client.meta.config.max_pool_connections == 16
+        assert client.meta.config.retries == {
+            "mode": "adaptive",
+            "total_max_attempts": 10,
+        }
+
+    def test_describe_document_error(self, mocker: MockerFixture) -> None:
+        """Test describe_document raising errors other than not found."""
+        client = boto3.client("ssm", region_name="us-east-1")
+        mocker.patch.object(
+            client,
+            "describe_document",
+            side_effect=ClientError(
+                {"Error": {"Code": "ThrottlingException"}}, "DescribeDocument"
+            ),
+        )
+        with pytest.raises(ClientError):
+            SsmPublisher(client).describe_document("test")
+
+    def test_find_version(self, mocker: MockerFixture) -> None:
+        """Test find_version only searches the newest versions."""
+        client = mocker.MagicMock()
+        client.describe_document.side_effect = lambda **kwargs: {
+            "Document": {"Hash": f"hash{kwargs['DocumentVersion']}"}
+        }
+        obj = SsmPublisher(client)
+        assert obj.find_version("test", "hash98", "100") == "98"
+        assert client.describe_document.call_count == 3
+        client.describe_document.reset_mock()
+        assert not obj.find_version("test", "hash1", "100")
+        assert [
+            call.kwargs["DocumentVersion"]
+            for call in client.describe_document.call_args_list
+        ] == [str(v) for v in range(100, 100 - SSM_FIND_VERSION_LIMIT, -1)]
+        client.describe_document.reset_mock()
+        assert obj.find_version("test", "hash1", "2") == "1"
+        assert client.describe_document.call_count == 2
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_publish(
+        self, concurrency: int, documents_dir: Path, ssm_client: SSMClient
+    ) -> None:
+        """Test publish creating SSM Documents."""
+        documents = Finder(documents_dir).documents
+        obj = SsmPublisher(ssm_client, concurrency=concurrency, prefix="dev")
+        summary = obj.publish(iter(documents))
+        assert (summary.published, summary.unchanged, summary.failed) == (2, 0, 0)
+        assert summary.size == sum(len(d.json().encode()) for d in documents)
+        assert [r.key for r in obj.results] == [
+            "dev-ExampleLinux",
+            "dev-ExampleWindows",
+        ]
+        for document in documents:
+            response = ssm_client.get_document(Name=document.get_name("dev"))
+            assert response["Content"] == document.json()
+            assert response["DocumentFormat"] == "JSON"
+            assert response["DocumentType"] == "Command"
+
+    def test_publish_error(
+        self, documents_dir: Path, mocker: MockerFixture, ssm_client: SSMClient
+    ) -> None:
+        """Test publish capturing errors."""
+        mocker.patch.object(
+            ssm_client,
+            "create_document",
+            side_effect=ClientError(
+                {"Error": {"Code": "DocumentLimitExceeded"}}, "CreateDocument"
+            ),
+        )
+        obj = SsmPublisher(ssm_client, concurrency=2)
+        summary = obj.publish(Finder(documents_dir).documents)
+        assert summary.failed == 2
+        assert not summary.published
+        assert all("DocumentLimitExceeded" in str(r.error) for r in obj.results)
+
+    def test_publish_unchanged(
+        self, documents_dir: Path, mocker: MockerFixture, ssm_client: SSMClient
+    ) -> None:
+        """Test publish skipping SSM Documents that are unchanged."""
+        documents = Finder(documents_dir).documents
+        SsmPublisher(ssm_client).publish(documents)
+        spy_update_document = mocker.spy(ssm_client, "update_document")
+
+        summary = SsmPublisher(ssm_client).publish(documents)
+        assert (summary.published, summary.unchanged) == (0, 2)
+        assert not spy_update_document.called
+
+    def test_publish_update(self, documents_dir: Path, ssm_client: SSMClient) -> None:
+        """Test publish updating the default version of SSM Documents."""
+        document = Finder(documents_dir).documents[0]
+        name = document.get_name()
+        ssm_client.create_document(
+            Content=document.json().replace("Example", "Outdated"),
+            DocumentFormat="JSON",
+            DocumentType="Command",
+            Name=name,
+        )
+        summary = SsmPublisher(ssm_client).publish([document])
+        assert (summary.published, summary.unchanged) == (1, 0)
+        description = ssm_client.describe_document(Name=name)["Document"]
+        assert description["DefaultVersion"] == description["LatestVersion"] == "2"
+        assert (
+            description["Hash"] == hashlib.sha256(document.json().encode()).hexdigest()
+        )
+
+    def test_publish_update_duplicate(
+        self, documents_dir: Path, ssm_client: SSMClient
+    ) -> None:
+        """Test publish using an existing version with the same content."""
+        document = Finder(documents_dir).documents[0]
+        name = document.get_name()
+        ssm_client.create_document(
+            Content=document.json().replace("Example", "Outdated"),
+            DocumentFormat="JSON",
+            DocumentType="Command",
+            Name=name,
+        )
+        ssm_client.update_document(
+            Content=document.json(),
+            DocumentFormat="JSON",
+            DocumentVersion="$LATEST",
+            Name=name,
+        )
+        assert (
+            ssm_client.describe_document(Name=name)["Document"]["DefaultVersion"] == "1"
+        )
+        summary = SsmPublisher(ssm_client).publish([document])
+        assert (summary.published, summary.failed) == (1, 0)
+        description = ssm_client.describe_document(Name=name)["Document"]
+        assert description["DefaultVersion"] == description["LatestVersion"] == "2"
+
+        summary = SsmPublisher(ssm_client, force=True).publish([document])
+        assert (summary.published, summary.failed) == (1, 0)
+        assert (
+            ssm_client.describe_document(Name=name)["Document"]["LatestVersion"] == "2"
+        )
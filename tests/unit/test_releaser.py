@@ -0,0 +1,120 @@
+"""Test ssm_dox.releaser."""
+# pylint: disable=no-self-use,redefined-outer-name
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING, Iterator
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from ssm_dox.builder import Builder
+from ssm_dox.document import Document
+from ssm_dox.finder import Finder
+from ssm_dox.publisher import Publisher
+from ssm_dox.releaser import Releaser
+from ssm_dox.serializer import get_default_serializer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from mypy_boto3_s3.client import S3Client
+    from pytest_mock import MockerFixture
+
+BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def s3_client() -> Iterator[S3Client]:
+    """S3 client for a mocked bucket."""
+    with mock_aws():
+        client = Publisher.create_client(boto3.Session(region_name="us-east-1"))
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+class TestReleaser:
+    """Test Releaser."""
+
+    def test_init(self, s3_client: S3Client, tmp_path: Path) -> None:
+        """Test __init__."""
+        builder = Builder(tmp_path)
+        obj = Releaser(builder, Publisher(s3_client, bucket=BUCKET, concurrency=3))
+        assert builder.body
+        assert obj.queue_size == 6
+        assert Releaser(builder, obj.publisher, queue_size=1).queue_size == 1
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_release(
+        self,
+        dox_dir: Path,
+        jobs: int,
+        mocker: MockerFixture,
+        s3_client: S3Client,
+        tmp_path: Path,
+    ) -> None:
+        """Test release publishing the bytes that were written to disk."""
+        spy_document_json = mocker.spy(Document, "json")
+        spy_dumps = mocker.spy(get_default_serializer(), "dumps")
+        obj = Releaser(
+            Builder(tmp_path, jobs=jobs),
+            Publisher(s3_client, bucket=BUCKET, prefix="v1"),
+            queue_size=1,
+        )
+        summary = obj.release(Finder(dox_dir).iter_dox())
+        assert (summary.build.built, summary.build.failed) == (2, 0)
+        assert (summary.publish.published, summary.publish.failed) == (2, 0)
+        for name in ["ExampleLinux.json", "ExampleWindows.json"]:
+            assert (
+                s3_client.get_object(Bucket=BUCKET, Key=f"v1/{name}")["Body"].read()
+                + b"\n"
+                == (tmp_path / name).read_bytes()
+            )
+        assert not spy_document_json.called
+        if jobs == 1:
+            assert spy_dumps.call_count == 2
+
+    def test_release_build_error(
+        self, dox_dir: Path, s3_client: S3Client, tmp_path: Path
+    ) -> None:
+        """Test release not publishing or deleting documents that failed to build."""
+        root_dir = tmp_path / "dox"
+        shutil.copytree(dox_dir, root_dir)
+        (root_dir / "ExampleWindows" / "template.yml").write_text("mainSteps: x\n")
+        s3_client.put_object(Bucket=BUCKET, Body=b"{}", Key="ExampleWindows.json")
+        s3_client.put_object(Bucket=BUCKET, Body=b"{}", Key="stale.json")
+        summary = Releaser(
+            Builder(tmp_path / "output"),
+            Publisher(s3_client, bucket=BUCKET, delete=True),
+        ).release(Finder(root_dir).iter_dox())
+        assert (summary.build.built, summary.build.failed) == (1, 1)
+        assert (summary.publish.published, summary.publish.deleted) == (1, 1)
+        assert sorted(
+            o["Key"] for o in s3_client.list_objects_v2(Bucket=BUCKET)["Contents"]
+        ) == ["ExampleLinux.json", "ExampleWindows.json"]
+
+    def test_release_publish_error(
+        self, dox_dir: Path, mocker: MockerFixture, s3_client: S3Client, tmp_path: Path
+    ) -> None:
+        """Test release raising when publishing stops before the build finishes."""
+        mocker.patch.object(
+            Publisher, "list_objects", side_effect=RuntimeError("access denied")
+        )
+        with pytest.raises(RuntimeError, match="access denied"):
+            Releaser(
+                Builder(tmp_path), Publisher(s3_client, bucket=BUCKET), queue_size=1
+            ).release(Finder(dox_dir).iter_dox())
+
+    def test_release_skipped(
+        self, dox_dir: Path, mocker: MockerFixture, s3_client: S3Client, tmp_path: Path
+    ) -> None:
+        """Test release reading documents of skipped Dox from disk."""
+        builder = Builder(tmp_path)
+        builder.build(Finder(dox_dir).dox)
+        mocker.patch.object(builder, "_is_current", return_value=True)
+        summary = Releaser(builder, Publisher(s3_client, bucket=BUCKET)).release(
+            Finder(dox_dir).iter_dox()
+        )
+        assert (summary.build.built, summary.build.skipped) == (0, 2)
+        assert summary.publish.published == 2
@@ -0,0 +1,69 @@
+"""Test ssm_dox.selector."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from ssm_dox.cache.dependencies import DependencyGraph
+from ssm_dox.finder import Finder
+from ssm_dox.selector import DoxSelector
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.logging import LogCaptureFixture
+
+
+class TestDoxSelector:
+    """Test DoxSelector."""
+
+    def test_select(
+        self, caplog: LogCaptureFixture, dox_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test select."""
+        caplog.set_level(logging.INFO, logger="ssm_dox.selector")
+        dox = Finder(dox_dir).dox
+        graph = DependencyGraph(tmp_path / "graph.json")
+        for item in dox:
+            graph.record(item.template, [])
+        script = dox_dir / "ExampleLinux" / "script.sh"
+        obj = DoxSelector([script, script.absolute()], graph)
+        assert [d.name for d in obj.select(dox)] == ["ExampleLinux"]
+        assert [d.name for d in obj.skipped] == ["ExampleWindows"]
+        obj.log()
+        assert caplog.messages[-2:] == [
+            "selected 1 dox affected by 1 changed path(s); skipped 1 dox",
+            "skipped ExampleWindows (not affected)",
+        ]
+
+    def test_select_shared_script(self, dox_dir: Path, tmp_path: Path) -> None:
+        """Test select with a script included through ``../`` by a nested Dox."""
+        script = tmp_path / "scripts" / "common.sh"
+        script.parent.mkdir()
+        script.write_text("echo common\n")
+        nested = tmp_path / "dox" / "group" / "Nested"
+        nested.mkdir(parents=True)
+        (nested / "template.yml").write_text(
+            "mainSteps:\n"
+            "  - action: aws:runShellScript\n"
+            "    inputs:\n"
+            "      runCommand: !IncludeScript ../../../scripts/common.sh\n"
+            "    name: Nested\n"
+        )
+        dox = [*Finder(dox_dir).dox, *Finder(tmp_path / "dox").dox]
+        graph = DependencyGraph(tmp_path / "graph.json")
+        for item in dox:
+            assert item.content
+            graph.record(item.template, item.includes)
+        obj = DoxSelector(
+            [nested / ".." / ".." / ".." / "scripts" / "common.sh"], graph
+        )
+        assert [d.name for d in obj.select(dox)] == ["Nested"]
+
+    def test_select_unknown(self, dox_dir: Path, tmp_path: Path) -> None:
+        """Test select with Dox that have not been recorded."""
+        dox = Finder(dox_dir).dox
+        obj = DoxSelector([tmp_path], DependencyGraph(tmp_path / "graph.json"))
+        assert list(obj.select(dox)) == dox
+        assert not obj.skipped
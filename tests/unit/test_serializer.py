@@ -0,0 +1,159 @@
+"""Test ssm_dox.serializer."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict
+
+import pytest
+
+from ssm_dox.models.document import SsmDocumentDataModel
+from ssm_dox.serializer import (
+    JsonSerializer,
+    OrjsonSerializer,
+    get_default_serializer,
+    get_serializer,
+    serialize,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock import MockerFixture
+
+MODULE = "ssm_dox.serializer"
+
+SERIALIZERS = [JsonSerializer, OrjsonSerializer]
+
+STEP: Dict[str, Any] = {
+    "action": "aws:runShellScript",
+    "name": "step",
+    "inputs": {"runCommand": ["echo 'two  spaces'", "", '"quoted" \\ \t']},
+}
+
+
+def make_document(**kwargs: Any) -> SsmDocumentDataModel:
+    """Make a document with a single step."""
+    return SsmDocumentDataModel.parse_obj({"mainSteps": [STEP], **kwargs})
+
+
+EDGE_CASES = [
+    make_document(),
+    make_document(description="unicode ✓ café"),
+    make_document(description="control \x00 \x1f"),
+    make_document(
+        parameters={
+            "Empty": {"type": "StringList", "default": []},
+            "EmptyMap": {"type": "StringMap", "default": {}},
+            "Float": {"type": "String", "allowedValues": ["a"], "default": "1e-05"},
+            "Integer": {"type": "Integer", "default": 2**70},
+            "MapList": {
+                "type": "MapList",
+                "default": [{"a": {"b": [1.5, 1e-05, 1e16]}}, {"c": "d"}],
+            },
+            "Nested": {"type": "StringMap", "default": {"a": {"b": {"c": []}}}},
+            "Boolean": {"type": "Boolean", "default": True},
+        }
+    ),
+    make_document(parameters={"Float": {"type": "MapList", "default": [0.1]}}),
+    make_document(parameters={"Key": {"type": "StringMap", "default": {1: "a"}}}),
+    make_document(description="delete \x7f"),
+]
+
+
+@pytest.mark.parametrize("serializer_class", SERIALIZERS)
+class TestSerializers:
+    """Test output of each serializer."""
+
+    def test_dumps_edge_cases(self, serializer_class: Any) -> None:
+        """Test dumps matches pydantic for edge cases."""
+        serializer = serializer_class()
+        for model in EDGE_CASES:
+            assert (
+                serializer.dumps(model)
+                == model.json(exclude_none=True, indent=4).encode()
+            )
+
+    def test_dumps_golden(self, fixture_dir: Path, serializer_class: Any) -> None:
+        """Test dumps matches a built document byte for byte."""
+        data = (fixture_dir / "serializer" / "golden.json").read_bytes()
+        assert (
+            serializer_class().dumps(SsmDocumentDataModel.parse_raw(data)) + b"\n"
+            == data
+        )
+
+
+class TestOrjsonSerializer:
+    """Test OrjsonSerializer."""
+
+    def test_dumps_fallback(self, mocker: MockerFixture) -> None:
+        """Test dumps falling back to the standard library."""
+        spy_dumps = mocker.spy(JsonSerializer, "dumps")
+        serializer = OrjsonSerializer()
+        serializer.dumps(make_document())
+        assert not spy_dumps.called
+        serializer.dumps(EDGE_CASES[2])  # control characters are escaped the same
+        assert not spy_dumps.called
+        for model in [EDGE_CASES[1], *EDGE_CASES[3:]]:
+            serializer.dumps(model)
+        assert spy_dumps.call_count == len(EDGE_CASES) - 2
+
+    def test_init_not_installed(self, mocker: MockerFixture) -> None:
+        """Test __init__ when orjson is not installed."""
+        mocker.patch(f"{MODULE}.orjson", None)
+        with pytest.raises(ImportError):
+            OrjsonSerializer()
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            (b"{}", b"{}"),
+            (
+                b'{\n  "a": [\n    "  b"\n  ]\n}',
+                b'{\n    "a": [\n        "  b"\n    ]\n}',
+            ),
+        ],
+    )
+    def test_reindent(self, data: bytes, expected: bytes) -> None:
+        """Test reindent."""
+        assert OrjsonSerializer.reindent(data) == expected
+
+
+def test_get_serializer(mocker: MockerFixture, monkeypatch: MonkeyPatch) -> None:
+    """Test get_serializer."""
+    monkeypatch.delenv("SSM_DOX_SERIALIZER", raising=False)
+    assert isinstance(get_serializer(), OrjsonSerializer)
+    assert type(get_serializer("json")) is JsonSerializer
+    monkeypatch.setenv("SSM_DOX_SERIALIZER", "json")
+    assert type(get_serializer()) is JsonSerializer
+    mocker.patch(f"{MODULE}.orjson", None)
+    monkeypatch.delenv("SSM_DOX_SERIALIZER")
+    assert type(get_serializer()) is JsonSerializer
+    with pytest.raises(ValueError, match="not available"):
+        get_serializer("orjson")
+    with pytest.raises(ValueError, match="unknown serializer"):
+        get_serializer("invalid")
+
+
+def test_get_default_serializer(monkeypatch: MonkeyPatch) -> None:
+    """Test get_default_serializer is resolved once, when it is first used."""
+    monkeypatch.setenv("SSM_DOX_SERIALIZER", "invalid")
+    get_default_serializer.cache_clear()
+    try:
+        with pytest.raises(ValueError, match="unknown serializer"):
+            get_default_serializer()
+        monkeypatch.setenv("SSM_DOX_SERIALIZER", "json")
+        assert type(get_default_serializer()) is JsonSerializer
+        assert get_default_serializer() is get_default_serializer()
+    finally:
+        get_default_serializer.cache_clear()
+
+
+def test_serialize(mocker: MockerFixture) -> None:
+    """Test serialize."""
+    mock_get_default_serializer = mocker.patch(f"{MODULE}.get_default_serializer")
+    model = make_document()
+    assert serialize(model) == (
+        mock_get_default_serializer.return_value.dumps.return_value
+    )
+    mock_get_default_serializer.return_value.dumps.assert_called_once_with(model)
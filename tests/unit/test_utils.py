@@ -0,0 +1,69 @@
+"""Test ssm_dox.utils."""
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ssm_dox.utils import _digest_file, _get_umask, digest_file, write_atomic
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+MODULE = "ssm_dox.utils"
+
+
+def test_digest_file(tmp_path: Path) -> None:
+    """Test digest_file only reads a file again once it changes."""
+    path = tmp_path / "script.sh"
+    path.write_bytes(b"echo hello")
+    expected = hashlib.sha256(b"echo hello").hexdigest()
+    hits = _digest_file.cache_info().hits
+    assert digest_file(path) == expected
+    assert digest_file(tmp_path / "." / "script.sh") == expected
+    assert _digest_file.cache_info().hits == hits + 1
+    path.write_bytes(b"echo changed")
+    assert digest_file(path) == hashlib.sha256(b"echo changed").hexdigest()
+    assert _digest_file.cache_info().hits == hits + 1
+
+
+def test_write_atomic(tmp_path: Path) -> None:
+    """Test write_atomic."""
+    path = tmp_path / "parent" / "file.json"
+    write_atomic(path, b"foo")
+    assert path.read_bytes() == b"foo"
+    write_atomic(path, b"bar")
+    assert path.read_bytes() == b"bar"
+    assert os.listdir(path.parent) == [path.name]
+
+
+def test_write_atomic_mode(tmp_path: Path) -> None:
+    """Test write_atomic sets the mode of the file."""
+    path = tmp_path / "file.json"
+    umask = os.umask(0o027)
+    try:
+        _get_umask.cache_clear()
+        write_atomic(path, b"foo")
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+        path.chmod(0o604)
+        write_atomic(path, b"bar")
+        assert stat.S_IMODE(path.stat().st_mode) == 0o604
+    finally:
+        os.umask(umask)
+        _get_umask.cache_clear()
+
+
+def test_write_atomic_error(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Test write_atomic error leaves nothing behind."""
+    path = tmp_path / "file.json"
+    path.write_bytes(b"original")
+    mocker.patch(f"{MODULE}.os.replace", side_effect=OSError)
+    with pytest.raises(OSError):
+        write_atomic(path, b"new")
+    assert path.read_bytes() == b"original"
+    assert os.listdir(tmp_path) == [path.name]
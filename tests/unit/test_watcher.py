@@ -0,0 +1,208 @@
+"""Test ssm_dox.watcher."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional, Set
+
+import pytest
+
+from ssm_dox.dox import Dox
+from ssm_dox.watcher import DoxWatcher, InotifyWatcher, PollingWatcher, get_watcher
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+MODULE = "ssm_dox.watcher"
+
+linux_only = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="requires inotify"
+)
+
+
+class FakeWatcher:
+    """Watcher that returns predefined changes."""
+
+    def __init__(self, changes: Iterable[Set[Path]] = ()) -> None:
+        """Instantiate class."""
+        self.changes = list(changes)
+        self.closed = False
+        self.directories: List[Path] = []
+
+    def close(self) -> None:
+        """Stop watching."""
+        self.closed = True
+
+    def read(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Return the next predefined change."""
+        if timeout is None or self.changes and self.changes[0]:
+            return self.changes.pop(0)
+        if self.changes:
+            self.changes.pop(0)
+        return set()
+
+    def watch(self, directories: Iterable[Path]) -> None:
+        """Set the directories being watched."""
+        self.directories = sorted(directories)
+
+
+@pytest.fixture
+def root(dox_dir: Path, tmp_path: Path) -> Path:
+    """Copy of the fixture Dox that can be modified."""
+    result = tmp_path / "dox"
+    shutil.copytree(dox_dir, result)
+    return result
+
+
+class TestDoxWatcher:
+    """Test DoxWatcher."""
+
+    def test_handle(self, mocker: MockerFixture, root: Path, tmp_path: Path) -> None:
+        """Test handle."""
+        output = tmp_path / "output"
+        obj = DoxWatcher(root, output, watcher=FakeWatcher())
+        obj.build(obj.scan())
+        obj.watch()
+        assert sorted(p.name for p in output.iterdir()) == [
+            "ExampleLinux.json",
+            "ExampleWindows.json",
+        ]
+        assert obj.watcher.directories == [
+            root,
+            root / "ExampleLinux",
+            root / "ExampleWindows",
+        ]
+        spy_build = mocker.spy(Dox, "build")
+
+        script = root / "ExampleLinux" / "script.sh"
+        script.write_text("echo changed\n")
+        assert [d.name for d in obj.handle({script})] == ["ExampleLinux"]
+        assert "echo changed" in (output / "ExampleLinux.json").read_text()
+        assert spy_build.call_count == 1
+
+        assert not obj.handle({root / "ExampleLinux" / "unused.sh"})
+        assert spy_build.call_count == 1
+
+        shutil.copytree(root / "ExampleLinux", root / "New")
+        assert [d.name for d in obj.handle({root / "New"})] == ["New"]
+        assert (output / "New.json").is_file()
+        assert root / "New" in obj.watcher.directories
+
+        shutil.rmtree(root / "ExampleWindows")
+        assert not obj.handle({root / "ExampleWindows" / "template.yml"})
+        assert sorted(d.name for d in obj.dox.values()) == ["ExampleLinux", "New"]
+
+    def test_handle_shared_script(self, root: Path, tmp_path: Path) -> None:
+        """Test handle with a script included through different ``../`` paths."""
+        script = tmp_path / "scripts" / "common.sh"
+        script.parent.mkdir()
+        script.write_text("echo common\n")
+        for name, include in [
+            ("A", "../../scripts/common.sh"),
+            ("group/B", "../../../scripts/common.sh"),
+        ]:
+            (root / name).mkdir(parents=True)
+            (root / name / "template.yml").write_text(
+                "mainSteps:\n"
+                "  - action: aws:runShellScript\n"
+                "    inputs:\n"
+                f"      runCommand: !IncludeScript {include}\n"
+                "    name: Shared\n"
+            )
+        obj = DoxWatcher(root, tmp_path / "output", watcher=FakeWatcher())
+        obj.build(obj.scan())
+        assert sorted(d.name for d in obj.dependencies[script.resolve()]) == ["A", "B"]
+        obj.watch()
+        assert obj.watcher.directories.count(script.parent.resolve()) == 1
+        script.write_text("echo changed\n")
+        assert sorted(d.name for d in obj.handle({script.resolve()})) == ["A", "B"]
+
+    def test_run(self, root: Path, tmp_path: Path) -> None:
+        """Test run."""
+        output = tmp_path / "output"
+        script = root / "ExampleLinux" / "script.sh"
+        watcher = FakeWatcher([{script}, {script}, set()])
+        obj = DoxWatcher(root, output, debounce=0, watcher=watcher)
+        obj.run(iterations=1)
+        assert watcher.closed
+        assert not watcher.changes
+        assert (output / "ExampleWindows.json").is_file()
+
+
+class TestInotifyWatcher:
+    """Test InotifyWatcher."""
+
+    @linux_only
+    def test_read(self, tmp_path: Path) -> None:
+        """Test read."""
+        (tmp_path / "sub").mkdir()
+        obj = InotifyWatcher()
+        try:
+            obj.watch([tmp_path, tmp_path / "sub", tmp_path / "missing"])
+            assert obj.directories == [tmp_path, tmp_path / "sub"]
+            assert obj.read(0) == set()
+            (tmp_path / "sub" / "file.txt").write_text("test")
+            (tmp_path / "other.txt").write_text("test")
+            changed = obj.read(1)
+            changed.update(obj.read(0.05))
+            assert changed == {tmp_path / "sub" / "file.txt", tmp_path / "other.txt"}
+            obj.watch([tmp_path])
+            assert obj.directories == [tmp_path]
+            (tmp_path / "sub" / "file.txt").unlink()
+            assert obj.read(0.05) == set()
+        finally:
+            obj.close()
+        obj.close()
+
+    def test_init_unsupported(self, mocker: MockerFixture) -> None:
+        """Test __init__ on a platform without inotify."""
+        mocker.patch(f"{MODULE}.sys.platform", "darwin")
+        with pytest.raises(OSError, match="inotify is not available on darwin"):
+            InotifyWatcher()
+
+
+class TestPollingWatcher:
+    """Test PollingWatcher."""
+
+    def test_read(self, tmp_path: Path) -> None:
+        """Test read."""
+        (tmp_path / "sub").mkdir()
+        existing = tmp_path / "existing.txt"
+        existing.write_text("test")
+        obj = PollingWatcher(interval=0.01)
+        obj.watch([tmp_path, tmp_path / "sub"])
+        assert obj.read(0.02) == set()
+        (tmp_path / "sub" / "new.txt").write_text("test")
+        existing.write_text("changed")
+        assert obj.read(1) == {tmp_path / "sub" / "new.txt", existing}
+        existing.unlink()
+        shutil.rmtree(tmp_path / "sub")
+        assert obj.read(1) == {
+            existing,
+            tmp_path / "sub",
+            tmp_path / "sub" / "new.txt",
+        }
+        obj.close()
+        assert not obj.directories
+
+    def test_read_modified_same_size(self, tmp_path: Path) -> None:
+        """Test read detecting a change that does not change the size."""
+        existing = tmp_path / "existing.txt"
+        existing.write_text("test")
+        obj = PollingWatcher(interval=0.01)
+        obj.watch([tmp_path])
+        stat = existing.stat()
+        os.utime(existing, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert obj.read(1) == {existing}
+
+
+def test_get_watcher(mocker: MockerFixture) -> None:
+    """Test get_watcher."""
+    watcher = get_watcher(polling=True, interval=2)
+    assert isinstance(watcher, PollingWatcher)
+    assert watcher.interval == 2
+    mocker.patch(f"{MODULE}.InotifyWatcher", side_effect=OSError)
+    assert isinstance(get_watcher(), PollingWatcher)